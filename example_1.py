@@ -1,13 +1,16 @@
 import os
 from dotenv import load_dotenv
 from src.model import AwsEnviroment, MyzelApp
+from src.packaging import Router
 from src.resources.api_gateway import ApiGateway
 from src.resources.cloudfront import CloudFront
 from src.resources.dynamodb import DynamoDB
 from src.resources.iam_role import IamRole
 from src.resources.lambda_function import LambdaFunction
+from src.resources.lambda_function_url import LambdaFunctionUrl
 from src.resources.s3 import S3
 from src.resources.s3_deploy import S3Deploy
+from src.resources.schedule_rule import WarmerConfig
 
 load_dotenv()
 
@@ -38,8 +41,29 @@ my_bucket = S3(
     env=app.env
 )
 
+# MYZEL_TODO_ROUTER=1: deploy the todo functions consolidated as one routed function
+TODO_ROUTER = os.getenv("MYZEL_TODO_ROUTER") == "1"
+todo_router = Router("todo-router", {
+    "POST /api/todos/create": "./functions/todo_create",
+    "GET /api/todos": "./functions/todo_list",
+    "PUT /api/todos/{id}/update": "./functions/todo_update",
+    "DELETE /api/todos/{id}/delete": "./functions/todo_delete",
+})
+
 # Transactional Deployment
 with app.begin_deploy() as deploy_ctx:
+    # Package all Lambda functions in parallel while roles, table and bucket deploy
+    if TODO_ROUTER:
+        deploy_ctx.prepackage("./functions/hallo_welt", str(todo_router.build()))
+    else:
+        deploy_ctx.prepackage(
+            "./functions/hallo_welt",
+            "./functions/todo_create",
+            "./functions/todo_list",
+            "./functions/todo_update",
+            "./functions/todo_delete"
+        )
+
     # Create and deploy IAM Roles first (other Lambda functions depend on them)
     hello_role = IamRole(
         role_name="hallo-welt-lambda-role",
@@ -81,7 +105,10 @@ with app.begin_deploy() as deploy_ctx:
                         "dynamodb:Scan",
                         "dynamodb:Query"
                     ],
-                    "Resource": f"arn:aws:dynamodb:{app.env.region}:{app.env.account}:table/todos"
+                    "Resource": [
+                        f"arn:aws:dynamodb:{app.env.region}:{app.env.account}:table/todos",
+                        f"arn:aws:dynamodb:{app.env.region}:{app.env.account}:table/todos/index/*"
+                    ]
                 }]
             }
         },
@@ -95,9 +122,18 @@ with app.begin_deploy() as deploy_ctx:
         table_name="todos",
         partition_key={'name': 'id', 'type': 'S'},
         billing_mode="PAY_PER_REQUEST",
+        # todo_list pages through this index (newest first) instead of scanning the table
+        global_secondary_indexes=[{
+            "index_name": "by-created",
+            "partition_key": {"name": "entity", "type": "S"},
+            "sort_key": {"name": "created_at", "type": "N"},
+            "projection": ["title", "description", "completed", "updated_at"]
+        }],
         env=app.env
     )
     deploy_ctx.add_resource("03-todo-table", todo_table)
+    # Todos written before the by-created index lack its partition key and are not listed;
+    # backfill them once with: python -m src.tools.backfill todos entity todo
 
     deploy_ctx.add_resource("04-my-bucket", my_bucket)
     deploy_ctx.add_resource("05-website", S3Deploy(
@@ -118,59 +154,69 @@ with app.begin_deploy() as deploy_ctx:
     )
     deploy_ctx.add_resource("10-lambda-hello", hello_lambda)
 
-    lambda_todo_create = LambdaFunction(
-        function_name="todo-create",
-        handler="lambda_function.lambda_handler",
-        runtime="python3.13",
-        code_path="./functions/todo_create",
-        role_arn=lambda_role.get_arn(),  # Real ARN from deployed role
-        environment_variables={"TABLE_NAME": "todos"},
-        env=app.env
-    )
-    deploy_ctx.add_resource("11-lambda-todo-create", lambda_todo_create)
+    if TODO_ROUTER:
+        # One function for all todo routes: a single warm pool, one cold start warms every route
+        lambda_todo_router = LambdaFunction(
+            function_name="todo-router",
+            handler=todo_router.handler,
+            runtime="python3.13",
+            code_path=str(todo_router.code_path),
+            role_arn=lambda_role.get_arn(),  # Real ARN from deployed role
+            environment_variables={"TABLE_NAME": "todos"},
+            warmer=WarmerConfig(concurrency=2, interval=5),
+            env=app.env
+        )
+        deploy_ctx.add_resource("11-lambda-todo-router", lambda_todo_router)
+        todo_routes = todo_router.api_routes(
+            f"arn:aws:lambda:{app.env.region}:{app.env.account}:function:todo-router", "todo-router")
+    else:
+        lambda_todo_create = LambdaFunction(
+            function_name="todo-create",
+            handler="lambda_function.lambda_handler",
+            runtime="python3.13",
+            code_path="./functions/todo_create",
+            role_arn=lambda_role.get_arn(),  # Real ARN from deployed role
+            environment_variables={"TABLE_NAME": "todos"},
+            env=app.env
+        )
+        deploy_ctx.add_resource("11-lambda-todo-create", lambda_todo_create)
 
-    lambda_todo_list = LambdaFunction(
-        function_name="todo-list",
-        handler="lambda_function.lambda_handler",
-        runtime="python3.13",
-        code_path="./functions/todo_list",
-        role_arn=lambda_role.get_arn(),  # Real ARN from deployed role
-        environment_variables={"TABLE_NAME": "todos"},
-        env=app.env
-    )
-    deploy_ctx.add_resource("12-lambda-todo-list", lambda_todo_list)
+        lambda_todo_list = LambdaFunction(
+            function_name="todo-list",
+            handler="lambda_function.lambda_handler",
+            runtime="python3.13",
+            code_path="./functions/todo_list",
+            role_arn=lambda_role.get_arn(),  # Real ARN from deployed role
+            environment_variables={"TABLE_NAME": "todos"},
+            # Two warm environments instead of provisioned concurrency
+            warmer=WarmerConfig(concurrency=2, interval=5),
+            env=app.env
+        )
+        deploy_ctx.add_resource("12-lambda-todo-list", lambda_todo_list)
 
-    lambda_todo_update = LambdaFunction(
-        function_name="todo-update",
-        handler="lambda_function.lambda_handler",
-        runtime="python3.13",
-        code_path="./functions/todo_update",
-        role_arn=lambda_role.get_arn(),  # Real ARN from deployed role
-        environment_variables={"TABLE_NAME": "todos"},
-        env=app.env
-    )
-    deploy_ctx.add_resource("13-lambda-todo-update", lambda_todo_update)
+        lambda_todo_update = LambdaFunction(
+            function_name="todo-update",
+            handler="lambda_function.lambda_handler",
+            runtime="python3.13",
+            code_path="./functions/todo_update",
+            role_arn=lambda_role.get_arn(),  # Real ARN from deployed role
+            environment_variables={"TABLE_NAME": "todos"},
+            env=app.env
+        )
+        deploy_ctx.add_resource("13-lambda-todo-update", lambda_todo_update)
 
-    lambda_todo_delete = LambdaFunction(
-        function_name="todo-delete",
-        handler="lambda_function.lambda_handler",
-        runtime="python3.13",
-        code_path="./functions/todo_delete",
-        role_arn=lambda_role.get_arn(),  # Real ARN from deployed role
-        environment_variables={"TABLE_NAME": "todos"},
-        env=app.env
-    )
-    deploy_ctx.add_resource("14-lambda-todo-delete", lambda_todo_delete)
+        lambda_todo_delete = LambdaFunction(
+            function_name="todo-delete",
+            handler="lambda_function.lambda_handler",
+            runtime="python3.13",
+            code_path="./functions/todo_delete",
+            role_arn=lambda_role.get_arn(),  # Real ARN from deployed role
+            environment_variables={"TABLE_NAME": "todos"},
+            env=app.env
+        )
+        deploy_ctx.add_resource("14-lambda-todo-delete", lambda_todo_delete)
 
-    # Create API Gateway and CloudFront
-    api_gateway = ApiGateway(
-        api_name="my-app-api",
-        routes={
-            "/api/hello": {
-                "method": "GET",
-                "lambda_arn": f"arn:aws:lambda:{app.env.region}:{app.env.account}:function:hallo-welt",
-                "lambda_name": "hallo-welt"
-            },
+        todo_routes = {
             "/api/todos": {
                 "method": "GET",
                 "lambda_arn": f"arn:aws:lambda:{app.env.region}:{app.env.account}:function:todo-list",
@@ -191,6 +237,28 @@ with app.begin_deploy() as deploy_ctx:
                 "lambda_arn": f"arn:aws:lambda:{app.env.region}:{app.env.account}:function:todo-delete",
                 "lambda_name": "todo-delete"
             }
+        }
+
+    # Hot read route without the API Gateway hop (CloudFront → Function URL → Lambda);
+    # the router resolves GET /api/todos by method and path
+    todo_list_url = LambdaFunctionUrl(
+        function_name="todo-router" if TODO_ROUTER else "todo-list",
+        auth_type="NONE",
+        cors={"allow_origins": ["*"], "allow_methods": ["GET"]},
+        env=app.env
+    )
+    deploy_ctx.add_resource("15-lambda-url-todo-list", todo_list_url)
+
+    # Create API Gateway and CloudFront
+    api_gateway = ApiGateway(
+        api_name="my-app-api",
+        routes={
+            "/api/hello": {
+                "method": "GET",
+                "lambda_arn": f"arn:aws:lambda:{app.env.region}:{app.env.account}:function:hallo-welt",
+                "lambda_name": "hallo-welt"
+            },
+            **todo_routes
         },
         description="API Gateway für App",
         env=app.env
@@ -200,6 +268,7 @@ with app.begin_deploy() as deploy_ctx:
     cloudfront = CloudFront(
         bucket_name=my_bucket.bucket_name,
         api_gateway_endpoint=f"https://r5kaifpzh4.execute-api.{app.env.region}.amazonaws.com",
+        function_urls={"/api/todos": todo_list_url},
         env=app.env
     )
     deploy_ctx.add_resource("30-cloudfront", cloudfront)
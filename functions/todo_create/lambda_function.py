@@ -30,6 +30,8 @@ def lambda_handler(event, context):
 
         item = {
             'id': todo_id,
+            # Partition key of the by-created index that todo_list pages through
+            'entity': 'todo',
             'title': title,
             'description': body.get('description', ''),
             'completed': False,
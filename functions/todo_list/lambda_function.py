@@ -1,11 +1,25 @@
+import base64
+import binascii
 import json
 import boto3
 import os
 from decimal import Decimal
 
+from myzel_warmer import skip_warmer
+
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table(os.environ.get('TABLE_NAME', 'todos'))
 
+# GSI over all todos, newest first (see DynamoDB(global_secondary_indexes=...) in example_1.py)
+INDEX_NAME = os.environ.get('INDEX_NAME', 'by-created')
+ENTITY = 'todo'
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 100
+
+# Only the attributes the client renders - the index projects nothing else
+FIELDS = ('id', 'title', 'description', 'completed', 'created_at', 'updated_at')
+
 
 def decimal_default(obj):
     """Convert Decimal to int or float for JSON serialization"""
@@ -14,25 +28,75 @@ def decimal_default(obj):
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+def encode_cursor(last_key):
+    """LastEvaluatedKey -> opaque, URL-safe token"""
+    raw = json.dumps(last_key, default=decimal_default, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """Token -> ExclusiveStartKey; ValueError for anything that is not one of our tokens"""
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        key = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(key, dict) or set(key) != {'id', 'entity', 'created_at'} or key['entity'] != ENTITY:
+        raise ValueError('Invalid cursor')
+    return key
+
+
+def error(status, message):
+    return {
+        'statusCode': status,
+        'headers': {'Content-Type': 'application/json'},
+        'body': json.dumps({'error': message})
+    }
+
+
+@skip_warmer
 def lambda_handler(event, context):
     """
-    List all todo items.
+    List todo items, newest first, one page per call.
+
+    Query parameters: limit (1-100, default 50), cursor (next_cursor of the previous page)
+    Response: {"todos": [...], "next_cursor": "..." or null}
     """
+    params = event.get('queryStringParameters') or {}
     try:
-        response = table.scan()
-        items = response.get('Items', [])
+        limit = int(params.get('limit', DEFAULT_LIMIT))
+    except ValueError:
+        return error(400, 'limit must be a number')
+    if not 1 <= limit <= MAX_LIMIT:
+        return error(400, f'limit must be between 1 and {MAX_LIMIT}')
+
+    query = {
+        'IndexName': INDEX_NAME,
+        'KeyConditionExpression': '#entity = :entity',
+        'ScanIndexForward': False,
+        'Limit': limit,
+        'ProjectionExpression': ', '.join(f'#{field}' for field in FIELDS),
+        'ExpressionAttributeNames': {'#entity': 'entity', **{f'#{field}': field for field in FIELDS}},
+        'ExpressionAttributeValues': {':entity': ENTITY},
+    }
+    if params.get('cursor'):
+        try:
+            query['ExclusiveStartKey'] = decode_cursor(params['cursor'])
+        except ValueError as e:
+            return error(400, str(e))
 
-        items.sort(key=lambda x: x.get('created_at', 0), reverse=True)
+    try:
+        response = table.query(**query)
+        last_key = response.get('LastEvaluatedKey')
 
         return {
             'statusCode': 200,
             'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({'todos': items}, default=decimal_default)
+            'body': json.dumps({
+                'todos': response.get('Items', []),
+                'next_cursor': encode_cursor(last_key) if last_key else None
+            }, default=decimal_default)
         }
 
     except Exception as e:
-        return {
-            'statusCode': 500,
-            'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({'error': str(e)})
-        }
+        return error(500, str(e))
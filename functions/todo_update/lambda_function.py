@@ -34,8 +34,9 @@ def lambda_handler(event, context):
 
         body = json.loads(event.get('body', '{}'))
 
-        update_expression = "SET updated_at = :updated_at"
-        expression_values = {':updated_at': int(time.time())}
+        # Keeps todos written by an older todo_create in the by-created index (see src/tools/backfill.py)
+        update_expression = "SET updated_at = :updated_at, #entity = :entity"
+        expression_values = {':updated_at': int(time.time()), ':entity': 'todo'}
 
         if 'title' in body:
             update_expression += ", title = :title"
@@ -52,6 +53,7 @@ def lambda_handler(event, context):
         response = table.update_item(
             Key={'id': todo_id},
             UpdateExpression=update_expression,
+            ExpressionAttributeNames={'#entity': 'entity'},
             ExpressionAttributeValues=expression_values,
             ReturnValues='ALL_NEW'
         )
@@ -1,5 +1,13 @@
+from src.core.canary import Canary, CanaryConfig, CanaryRollbackError
 from src.core.deploy import deploy
+from src.core.describe_cache import DescribeCache
 from src.core.destroy import destroy
+from src.core.events import EventBus, DeploymentSubscriber, AsyncSubscriber, bus
+from src.core.log import configure_logging, get_logger
 from src.core.transactional_deploy import TransactionalDeploymentContext
+from src.core.watchdog import Watchdog, DeadlineExceededError
 
-__all__ = ["deploy", "destroy", "TransactionalDeploymentContext"]
+__all__ = ["deploy", "destroy", "TransactionalDeploymentContext",
+           "EventBus", "DeploymentSubscriber", "AsyncSubscriber", "bus",
+           "configure_logging", "get_logger", "Watchdog", "DeadlineExceededError", "DescribeCache",
+           "Canary", "CanaryConfig", "CanaryRollbackError"]
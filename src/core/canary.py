@@ -0,0 +1,296 @@
+import math
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+
+from src.core.log import get_logger
+from src.core.session import create_session
+from src.core.watchdog import check_deadline, extend_deadline
+from src.core.report import parse_report, percentile
+
+logger = get_logger("canary")
+
+# Executed version of an invocation, from the START line of its log
+_START_VERSION = re.compile(r"^START RequestId: \S+ Version: (\S+)", re.MULTILINE)
+
+# Synthetic traffic aims this much above min_invocations - alias routing is random
+TRAFFIC_MARGIN = 1.5
+
+PROMOTE = "promote"
+ROLLBACK = "rollback"
+PENDING = "pending"
+
+
+class CanaryRollbackError(Exception):
+    """Die neue Version wurde im Canary verworfen, der Alias zeigt weiter auf die alte"""
+
+    def __init__(self, message: str, result: "CanaryResult"):
+        super().__init__(message)
+        self.result = result
+
+
+@dataclass
+class CanaryConfig:
+    """Gewichteter Rollout einer neuen Version über den Alias"""
+    # Share of the alias traffic routed to the new version
+    weight: float = 0.1
+    # Observation time in seconds before promotion
+    duration: float = 600
+    # Seconds between two evaluations (a regression rolls back early)
+    interval: float = 60
+    # Allowed relative increase of p95/p99 duration over the stable version
+    max_latency_increase: float = 0.2
+    # Allowed absolute increase of the error rate (0.01 = one percentage point)
+    max_error_rate_increase: float = 0.01
+    # Invocations of the new version needed for a decision; fewer means rollback
+    min_invocations: int = 20
+    # Synthetic traffic: invoked against the alias every interval (LogType=Tail),
+    # repeated until the new version can reach min_invocations at its weight.
+    # With payloads the REPORT lines are the metric source, else CloudWatch.
+    payloads: list[dict] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not 0 < self.weight < 1:
+            raise ValueError(f"Canary weight muss zwischen 0 und 1 liegen: {self.weight}")
+
+
+@dataclass
+class VersionStats:
+    """Aufrufe, Fehler und Dauer-Perzentile einer Version im Beobachtungsfenster"""
+    version: str
+    invocations: int = 0
+    errors: int = 0
+    p95_ms: Optional[float] = None
+    p99_ms: Optional[float] = None
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.invocations if self.invocations else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "invocations": self.invocations,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "p95_ms": self.p95_ms,
+            "p99_ms": self.p99_ms,
+        }
+
+
+@dataclass
+class CanaryResult:
+    """Entscheidung des Canary und die Zahlen dahinter"""
+    function_name: str
+    alias: str
+    verdict: str
+    reason: str
+    stable: VersionStats
+    candidate: VersionStats
+    duration_s: float
+
+    @property
+    def promoted(self) -> bool:
+        return self.verdict == PROMOTE
+
+    def to_dict(self) -> dict:
+        return {
+            "function_name": self.function_name,
+            "alias": self.alias,
+            "verdict": self.verdict,
+            "reason": self.reason,
+            "stable": self.stable.to_dict(),
+            "candidate": self.candidate.to_dict(),
+            "duration_s": self.duration_s,
+        }
+
+
+class ReportMetrics:
+    """Metriken aus den REPORT Zeilen von Invocations mit LogType=Tail
+
+    The executed version comes from the START line, so invocations of the
+    alias are attributed to the version that actually served them.
+    """
+
+    def __init__(self):
+        self._samples: list[tuple[float, str, float, bool]] = []
+        self._lock = threading.Lock()
+
+    def record(self, response: dict) -> None:
+        log = response.get("LogResult") or ""
+        match = _START_VERSION.search(log)
+        report = parse_report(log)
+        if match is None or report is None:
+            return
+        with self._lock:
+            self._samples.append((time.time(), match.group(1), report.duration_ms,
+                                  bool(response.get("FunctionError"))))
+
+    def stats(self, version: str, start: float, end: float) -> VersionStats:
+        with self._lock:
+            samples = [(duration, error) for ts, v, duration, error in self._samples
+                       if v == version and start <= ts <= end]
+        durations = [duration for duration, _ in samples]
+        return VersionStats(version, len(samples), sum(1 for _, error in samples if error),
+                            percentile(durations, 95), percentile(durations, 99))
+
+
+class CloudWatchMetrics:
+    """Lambda Metriken pro ausgeführter Version (Dimension ExecutedVersion des Alias)"""
+
+    def __init__(self, env, function_name: str, alias: str):
+        self.env = env
+        self.function_name = function_name
+        self.alias = alias
+
+    def stats(self, version: str, start: float, end: float) -> VersionStats:
+        cloudwatch = create_session(self.env).client('cloudwatch')
+        dimensions = [
+            {'Name': 'FunctionName', 'Value': self.function_name},
+            {'Name': 'Resource', 'Value': f"{self.function_name}:{self.alias}"},
+            {'Name': 'ExecutedVersion', 'Value': version},
+        ]
+        # One period spanning the whole window (minute-aligned)
+        start = math.floor(start / 60) * 60
+        period = max(60, math.ceil((end - start) / 60) * 60)
+        queries = [
+            {
+                'Id': query_id,
+                'MetricStat': {
+                    'Metric': {'Namespace': 'AWS/Lambda', 'MetricName': metric, 'Dimensions': dimensions},
+                    'Period': period,
+                    'Stat': stat,
+                },
+            }
+            for query_id, metric, stat in (("invocations", "Invocations", "Sum"), ("errors", "Errors", "Sum"),
+                                           ("p95", "Duration", "p95"), ("p99", "Duration", "p99"))
+        ]
+        response = cloudwatch.get_metric_data(
+            MetricDataQueries=queries,
+            StartTime=datetime.fromtimestamp(start, timezone.utc),
+            EndTime=datetime.fromtimestamp(start + period, timezone.utc)
+        )
+        values = {result['Id']: result['Values'] for result in response['MetricDataResults']}
+        return VersionStats(
+            version,
+            invocations=int(sum(values.get("invocations", []))),
+            errors=int(sum(values.get("errors", []))),
+            p95_ms=max(values.get("p95", []), default=None),
+            p99_ms=max(values.get("p99", []), default=None),
+        )
+
+
+def evaluate(stable: VersionStats, candidate: VersionStats, config: CanaryConfig) -> tuple[str, str]:
+    """(verdict, Begründung) für den aktuellen Stand - PENDING solange Daten fehlen"""
+    if candidate.invocations < config.min_invocations:
+        return PENDING, f"zu wenige Aufrufe der neuen Version ({candidate.invocations}/{config.min_invocations})"
+
+    if candidate.error_rate > stable.error_rate + config.max_error_rate_increase:
+        return ROLLBACK, (f"Fehlerrate {candidate.error_rate:.1%} statt {stable.error_rate:.1%} "
+                          f"(Version {stable.version})")
+
+    # Without enough stable traffic only the error rate can be judged
+    if stable.invocations >= config.min_invocations:
+        for name in ("p95_ms", "p99_ms"):
+            baseline, value = getattr(stable, name), getattr(candidate, name)
+            if baseline and value and value > baseline * (1 + config.max_latency_increase):
+                return ROLLBACK, (f"{name[:3]} {value:.1f} ms statt {baseline:.1f} ms "
+                                  f"(+{value / baseline - 1:.0%}, erlaubt +{config.max_latency_increase:.0%})")
+    return PROMOTE, "keine Regression"
+
+
+class Canary:
+    """
+    Weighted rollout of a new version behind an alias.
+
+    The alias keeps pointing to the stable version and routes
+    `config.weight` of the traffic to the candidate. Every interval the
+    p95/p99 duration and the error rate of both versions since the start
+    are compared (evaluate()); a regression rolls back immediately. After
+    `config.duration` the candidate is promoted to 100% - or rolled back if
+    it is still regressed or got too little traffic. Any error during the
+    observation rolls back as well.
+
+    The function can be a LambdaFunction or a stand-in with the same
+    route_alias(alias, version, canary_version, weight) and invoke(...)
+    methods; metrics anything with stats(version, start, end).
+    """
+
+    def __init__(self, function, alias: str, stable_version: str, candidate_version: str,
+                 config: CanaryConfig, metrics=None):
+        self.function = function
+        self.alias = alias
+        self.stable_version = stable_version
+        self.candidate_version = candidate_version
+        self.config = config
+        if metrics is None:
+            metrics = ReportMetrics() if config.payloads else CloudWatchMetrics(
+                function.env, function.function_name, alias)
+        self.metrics = metrics
+
+    def run(self) -> CanaryResult:
+        name = f"{self.function.function_name}:{self.alias}"
+        # The observation time counts against the deployment watchdog of the function
+        extend_deadline(self.config.duration + self.config.interval)
+        self.function.route_alias(self.alias, self.stable_version, self.candidate_version, self.config.weight)
+        logger.info(f"Canary {name}: {self.config.weight:.0%} → Version {self.candidate_version}, "
+                    f"Version {self.stable_version} stabil, {self.config.duration:.0f}s Beobachtung")
+
+        started = time.time()
+        try:
+            verdict, reason = PENDING, ""
+            candidate_invocations = 0
+            while True:
+                remaining = started + self.config.duration - time.time()
+                self._send_traffic(candidate_invocations, max(1, math.ceil(remaining / self.config.interval)))
+                stable, candidate = self._stats(started)
+                candidate_invocations = candidate.invocations
+                verdict, reason = evaluate(stable, candidate, self.config)
+                remaining = started + self.config.duration - time.time()
+                if verdict == ROLLBACK or remaining <= 0:
+                    break
+                logger.info(f"  Canary {name}: {candidate.invocations} Aufrufe, {reason}, noch {remaining:.0f}s")
+                check_deadline()
+                time.sleep(min(self.config.interval, remaining))
+
+            if verdict == PENDING:
+                verdict = ROLLBACK
+        except BaseException:
+            self.function.route_alias(self.alias, self.stable_version)
+            logger.warning(f"Warnung: Canary {name} abgebrochen, Alias zurück auf Version {self.stable_version}")
+            raise
+
+        if verdict == PROMOTE:
+            self.function.route_alias(self.alias, self.candidate_version)
+            logger.info(f"Canary {name}: Version {self.candidate_version} übernommen ({reason})")
+        else:
+            self.function.route_alias(self.alias, self.stable_version)
+            logger.warning(f"Warnung: Canary {name}: Rollback auf Version {self.stable_version} - {reason}")
+
+        result = CanaryResult(self.function.function_name, self.alias, verdict, reason, stable, candidate,
+                              time.time() - started)
+        logger.info(f"Canary {name}: {verdict}", extra=result.to_dict())
+        return result
+
+    def _send_traffic(self, candidate_invocations: int, rounds_left: int) -> None:
+        """Alle Payloads, mehrfach wenn die neue Version sonst min_invocations nicht erreicht"""
+        payloads = self.config.payloads
+        if not payloads:
+            return
+        # Only `weight` of the alias calls reach the new version: spread what is missing over the rounds left
+        missing = self.config.min_invocations - candidate_invocations
+        calls = len(payloads)
+        if missing > 0:
+            calls = max(calls, math.ceil(missing * TRAFFIC_MARGIN / self.config.weight / rounds_left))
+        for index in range(calls):
+            response = self.function.invoke(payloads[index % len(payloads)], log_type="Tail", qualifier=self.alias)
+            if isinstance(self.metrics, ReportMetrics):
+                self.metrics.record(response)
+
+    def _stats(self, started: float) -> tuple[VersionStats, VersionStats]:
+        now = time.time()
+        return (self.metrics.stats(self.stable_version, started, now),
+                self.metrics.stats(self.candidate_version, started, now))
@@ -4,6 +4,7 @@ from pydantic import ValidationError
 
 from src.model import MyzelApp, Resources, IacMapping, ResourceMapping
 from src.model.registry import get_resource_class, get_resource_type
+from src.packaging import pool as package_pool
 
 
 def deploy(app: MyzelApp, config_dir: Path = Path("config")) -> IacMapping:
@@ -27,6 +28,27 @@ def deploy(app: MyzelApp, config_dir: Path = Path("config")) -> IacMapping:
     desired_constructs: dict[str, Resources] = app.constructs
     desired_iac_mapping = IacMapping()
 
+    # Package all Lambda functions in parallel up front
+    packages = package_pool.PackagePool()
+    packages.prepackage(*desired_constructs.values())
+    package_pool.activate(packages)
+    try:
+        _apply(desired_constructs, deployed_constructs, iac_mapping, desired_iac_mapping)
+    finally:
+        package_pool.activate(None)
+        packages.shutdown()
+
+    desired_iac_mapping.to_yaml(config_file)
+    return iac_mapping
+
+
+def _apply(
+    desired_constructs: dict[str, Resources],
+    deployed_constructs: dict[str, Resources],
+    iac_mapping: IacMapping,
+    desired_iac_mapping: IacMapping
+) -> None:
+
     # 1. Nur in desired (neue Ressourcen - CREATE)
     for resource_id, resource in desired_constructs.items():
         if resource_id not in deployed_constructs:
@@ -56,6 +78,3 @@ def deploy(app: MyzelApp, config_dir: Path = Path("config")) -> IacMapping:
         if resource_id not in desired_constructs:
             tech_id = iac_mapping.resources[resource_id].tech_id
             resource.delete(tech_id)
-
-    desired_iac_mapping.to_yaml(config_file)
-    return iac_mapping
@@ -0,0 +1,187 @@
+import copy
+import json
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+from botocore.awsrequest import AWSResponse
+from botocore.compat import HTTPHeaders
+
+from src.core.log import get_logger
+
+logger = get_logger("describe_cache")
+
+# Read-only operations whose responses may be shared within one run
+CACHEABLE_OPERATIONS = {
+    "lambda": {"GetFunction", "GetFunctionConfiguration"},
+    "apigatewayv2": {"GetApis", "GetApi", "GetRoutes", "GetIntegrations", "GetStage"},
+    "s3": {"HeadBucket", "GetBucketPolicy", "GetBucketLocation"},
+    "iam": {"GetRole", "ListAttachedRolePolicies", "ListRolePolicies", "GetRolePolicy"},
+    "dynamodb": {"DescribeTable"},
+    "cloudfront": {"GetDistribution", "GetDistributionConfig"},
+}
+
+# Request parameters identifying the resource an operation touches
+IDENTITY_PARAMETERS = ("FunctionName", "ApiId", "Bucket", "RoleName", "TableName", "Id")
+
+READ_ONLY_PREFIXES = ("Get", "List", "Describe", "Head")
+
+# Coalesced callers stop waiting for the leading request after this many seconds
+COALESCE_TIMEOUT = 60
+
+_bypass = threading.local()
+
+
+def _identity(params: dict) -> Optional[str]:
+    for name in IDENTITY_PARAMETERS:
+        value = params.get(name)
+        if isinstance(value, str):
+            # Lambda accepts names and ARNs (arn:aws:lambda:region:account:function:name[:qualifier])
+            if name == "FunctionName" and value.startswith("arn:"):
+                value = value.split(":")[6]
+            return value
+    return None
+
+
+class DescribeCache:
+    """
+    Run-scoped cache for read-only describe/list responses.
+
+    - Responses of CACHEABLE_OPERATIONS are cached per region, operation and
+      parameters and handed out as deep copies.
+    - Concurrent identical requests are coalesced: one thread performs the
+      call, the others wait for its response.
+    - Any mutating call invalidates every cached entry of the same service
+      that touches the same resource (FunctionName, Bucket, ...) as well as
+      identity-less listings like GetApis.
+    - Polling loops that wait for a state change run inside uncached().
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple, tuple[Optional[str], dict]] = {}
+        self._inflight: dict[tuple, threading.Event] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def register(self, session) -> None:
+        """Registriere die botocore Hooks auf einer Session"""
+        session.events.register("before-parameter-build", self._remember_params,
+                                unique_id="myzel-describe-cache-params")
+        session.events.register("before-call", self._before_call, unique_id="myzel-describe-cache-before")
+        session.events.register("after-call", self._after_call, unique_id="myzel-describe-cache-after")
+        session.events.register("after-call-error", self._after_call_error, unique_id="myzel-describe-cache-error")
+
+    @staticmethod
+    def _remember_params(params, context, **kwargs):
+        context["myzel_params"] = params
+
+    def _before_call(self, event_name, context, **kwargs):
+        if active() is not self:
+            return None
+
+        _, service, operation = event_name.split(".", 2)
+        params = context.get("myzel_params", {})
+        identity = _identity(params)
+
+        if operation not in CACHEABLE_OPERATIONS.get(service, ()):
+            if not operation.startswith(READ_ONLY_PREFIXES):
+                self._invalidate(service, identity)
+            return None
+
+        key = (context.get("client_region"), service, operation,
+               json.dumps(params, sort_keys=True, default=str))
+
+        if getattr(_bypass, "active", False):
+            # Fresh read (polling) - refresh the entry afterwards
+            context["myzel_cache_store"] = (key, identity)
+            return None
+
+        while True:
+            with self._lock:
+                if key in self._entries:
+                    self.hits += 1
+                    context["myzel_cache_hit"] = True
+                    return self._cached_response(self._entries[key][1])
+                inflight = self._inflight.get(key)
+                if inflight is None:
+                    self.misses += 1
+                    self._inflight[key] = threading.Event()
+                    context["myzel_cache_store"] = (key, identity)
+                    context["myzel_cache_leader"] = True
+                    return None
+            if not inflight.wait(COALESCE_TIMEOUT):
+                return None
+            with self._lock:
+                if key not in self._entries:
+                    # The leading request failed - make our own call
+                    return None
+
+    def _after_call(self, http_response, parsed, context, **kwargs):
+        if context.get("myzel_cache_hit"):
+            return
+        store = context.get("myzel_cache_store")
+        if store is None:
+            return
+        key, identity = store
+        with self._lock:
+            if http_response is not None and http_response.status_code < 300:
+                self._entries[key] = (identity, copy.deepcopy(parsed))
+            self._release(key, context)
+
+    def _after_call_error(self, context, **kwargs):
+        store = context.get("myzel_cache_store")
+        if store is None:
+            return
+        with self._lock:
+            self._release(store[0], context)
+
+    def _release(self, key: tuple, context: dict) -> None:
+        if context.get("myzel_cache_leader"):
+            inflight = self._inflight.pop(key, None)
+            if inflight is not None:
+                inflight.set()
+
+    def _invalidate(self, service: str, identity: Optional[str]) -> None:
+        with self._lock:
+            stale = [
+                key for key, (entry_identity, _) in self._entries.items()
+                if key[1] == service and (entry_identity is None or entry_identity == identity)
+            ]
+            for key in stale:
+                del self._entries[key]
+        if stale:
+            logger.debug(f"Describe Cache: {len(stale)} Einträge invalidiert ({service} {identity})")
+
+    @staticmethod
+    def _cached_response(parsed: dict) -> tuple:
+        http_response = AWSResponse(url="", status_code=200, headers=HTTPHeaders(), raw=None)
+        return http_response, copy.deepcopy(parsed)
+
+
+# Cache of the currently running deployment (None outside of a run)
+_active: Optional[DescribeCache] = None
+
+
+def activate(cache: Optional[DescribeCache]) -> None:
+    global _active
+    _active = cache
+
+
+def active() -> Optional[DescribeCache]:
+    return _active
+
+
+@contextmanager
+def uncached():
+    """Lese im aktuellen Thread frisch aus AWS (für Polling-Schleifen und Waiter)"""
+    previous = getattr(_bypass, "active", False)
+    _bypass.active = True
+    try:
+        yield
+    finally:
+        _bypass.active = previous
@@ -0,0 +1,344 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from src.core.log import get_logger
+
+logger = get_logger("events")
+
+HOOKS = (
+    "on_refresh",
+    "on_plan",
+    "on_resource_start",
+    "on_resource_finish",
+    "on_resource_fail",
+    "on_wait",
+    "on_api_call",
+)
+
+
+@dataclass(frozen=True)
+class RefreshEvent:
+    """Deployed state of a resource was fetched from AWS"""
+    resource_id: str
+    resource_type: str
+    tech_id: str
+    duration: float
+
+
+@dataclass(frozen=True)
+class PlanEvent:
+    """The engine decided what to do with a resource (create, update, noop, delete)"""
+    resource_id: str
+    resource_type: str
+    action: str
+
+
+@dataclass(frozen=True)
+class ResourceStartEvent:
+    resource_id: str
+    resource_type: str
+    action: str
+
+
+@dataclass(frozen=True)
+class ResourceFinishEvent:
+    resource_id: str
+    resource_type: str
+    action: str
+    tech_id: Optional[str]
+    duration: float
+
+
+@dataclass(frozen=True)
+class ResourceFailEvent:
+    resource_id: str
+    resource_type: str
+    action: str
+    error: BaseException
+    duration: float
+
+
+@dataclass(frozen=True)
+class WaitEvent:
+    """A resource is polling AWS until an asynchronous operation completes"""
+    resource: str
+    reason: str
+    attempt: int
+    delay: float
+
+
+@dataclass(frozen=True)
+class ApiCallEvent:
+    service: str
+    operation: str
+    duration: float
+    error_code: Optional[str] = None
+
+
+class DeploymentSubscriber:
+    """
+    Base class for event bus subscribers.
+
+    Override only the hooks you need - the bus dispatches a hook only to
+    subscribers that override it, so unused hooks cost nothing.
+    """
+
+    def on_refresh(self, event: RefreshEvent) -> None:
+        pass
+
+    def on_plan(self, event: PlanEvent) -> None:
+        pass
+
+    def on_resource_start(self, event: ResourceStartEvent) -> None:
+        pass
+
+    def on_resource_finish(self, event: ResourceFinishEvent) -> None:
+        pass
+
+    def on_resource_fail(self, event: ResourceFailEvent) -> None:
+        pass
+
+    def on_wait(self, event: WaitEvent) -> None:
+        pass
+
+    def on_api_call(self, event: ApiCallEvent) -> None:
+        pass
+
+
+def _handled_hooks(subscriber) -> set[str]:
+    """Bestimme welche Hooks ein Subscriber tatsächlich implementiert"""
+    declared = getattr(subscriber, "handled_hooks", None)
+    if declared is not None:
+        return set(declared)
+
+    hooks = set()
+    for hook in HOOKS:
+        method = getattr(type(subscriber), hook, None)
+        if method is None:
+            continue
+        if method is getattr(DeploymentSubscriber, hook):
+            continue
+        hooks.add(hook)
+    return hooks
+
+
+# Queued by AsyncSubscriber.close(): the worker stops after the events before it
+_STOP = object()
+
+
+class AsyncSubscriber(DeploymentSubscriber):
+    """
+    Runs a subscriber on its own daemon thread.
+
+    Events are handed over through a bounded queue; when the queue is full
+    the event is dropped (and counted) instead of blocking the deployment.
+    """
+
+    def __init__(self, subscriber, maxsize: int = 10000):
+        self.subscriber = subscriber
+        self.handled_hooks = frozenset(_handled_hooks(subscriber))
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"myzel-events-{type(subscriber).__name__}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def _enqueue(self, hook: str, event) -> None:
+        try:
+            self._queue.put_nowait((hook, event))
+        except queue.Full:
+            self.dropped += 1
+
+    def on_refresh(self, event):
+        self._enqueue("on_refresh", event)
+
+    def on_plan(self, event):
+        self._enqueue("on_plan", event)
+
+    def on_resource_start(self, event):
+        self._enqueue("on_resource_start", event)
+
+    def on_resource_finish(self, event):
+        self._enqueue("on_resource_finish", event)
+
+    def on_resource_fail(self, event):
+        self._enqueue("on_resource_fail", event)
+
+    def on_wait(self, event):
+        self._enqueue("on_wait", event)
+
+    def on_api_call(self, event):
+        self._enqueue("on_api_call", event)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            hook, event = item
+            try:
+                getattr(self.subscriber, hook)(event)
+            except Exception:
+                logger.exception(f"Event Subscriber {type(self.subscriber).__name__} fehlgeschlagen ({hook})")
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Warte bis alle eingereihten Events verarbeitet wurden
+
+        Returns:
+            True if the queue was drained within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 5.0) -> bool:
+        """Verarbeite die eingereihten Events und beende den Worker Thread
+
+        Returns:
+            True if the worker stopped within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return False
+        self._thread.join(max(0.0, deadline - time.monotonic()))
+        return not self._thread.is_alive()
+
+
+class EventBus:
+    """
+    Typed publish/subscribe bus for deployment lifecycle events.
+
+    Every emit method checks its pre-computed handler tuple first and returns
+    before building the event object when nobody listens to that hook.
+    """
+
+    def __init__(self):
+        self._subscribers: list = []
+        self._lock = threading.Lock()
+        self._rebuild()
+
+    def subscribe(self, subscriber, asynchronous: bool = False):
+        """Registriere einen Subscriber
+
+        Args:
+            subscriber: Object implementing any of the DeploymentSubscriber hooks
+            asynchronous: Run the subscriber on a background thread
+
+        Returns:
+            The registered subscriber (the AsyncSubscriber wrapper if asynchronous)
+        """
+        if asynchronous:
+            subscriber = AsyncSubscriber(subscriber)
+        with self._lock:
+            self._subscribers.append(subscriber)
+            self._rebuild()
+        return subscriber
+
+    def unsubscribe(self, subscriber) -> None:
+        with self._lock:
+            removed = [
+                s for s in self._subscribers
+                if s is subscriber or getattr(s, "subscriber", None) is subscriber
+            ]
+            self._subscribers = [s for s in self._subscribers if s not in removed]
+            self._rebuild()
+        # Outside the lock: the worker may still be delivering queued events
+        for s in removed:
+            if isinstance(s, AsyncSubscriber):
+                s.close()
+
+    def wants(self, hook: str) -> bool:
+        """Prüfe ob mindestens ein Subscriber auf den Hook hört"""
+        return bool(self._handlers[hook])
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Warte auf alle asynchronen Subscriber"""
+        for subscriber in list(self._subscribers):
+            flush = getattr(subscriber, "flush", None)
+            if flush is not None:
+                flush(timeout)
+
+    def _rebuild(self) -> None:
+        handlers = {hook: [] for hook in HOOKS}
+        for subscriber in self._subscribers:
+            for hook in _handled_hooks(subscriber):
+                handlers[hook].append(getattr(subscriber, hook))
+        self._handlers = {hook: tuple(methods) for hook, methods in handlers.items()}
+
+    @staticmethod
+    def _dispatch(handlers: tuple, event) -> None:
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:
+                # A broken subscriber must never break the deployment
+                logger.exception(f"Event Subscriber fehlgeschlagen: {handler}")
+
+    def refresh(self, resource_id: str, resource_type: str, tech_id: str, duration: float) -> None:
+        handlers = self._handlers["on_refresh"]
+        if handlers:
+            self._dispatch(handlers, RefreshEvent(resource_id, resource_type, tech_id, duration))
+
+    def plan(self, resource_id: str, resource_type: str, action: str) -> None:
+        handlers = self._handlers["on_plan"]
+        if handlers:
+            self._dispatch(handlers, PlanEvent(resource_id, resource_type, action))
+
+    def resource_start(self, resource_id: str, resource_type: str, action: str) -> None:
+        handlers = self._handlers["on_resource_start"]
+        if handlers:
+            self._dispatch(handlers, ResourceStartEvent(resource_id, resource_type, action))
+
+    def resource_finish(self, resource_id: str, resource_type: str, action: str,
+                        tech_id: Optional[str], duration: float) -> None:
+        handlers = self._handlers["on_resource_finish"]
+        if handlers:
+            self._dispatch(handlers, ResourceFinishEvent(resource_id, resource_type, action, tech_id, duration))
+
+    def resource_fail(self, resource_id: str, resource_type: str, action: str,
+                      error: BaseException, duration: float) -> None:
+        handlers = self._handlers["on_resource_fail"]
+        if handlers:
+            self._dispatch(handlers, ResourceFailEvent(resource_id, resource_type, action, error, duration))
+
+    def wait(self, resource: str, reason: str, attempt: int, delay: float) -> None:
+        handlers = self._handlers["on_wait"]
+        if handlers:
+            self._dispatch(handlers, WaitEvent(resource, reason, attempt, delay))
+
+    def api_call(self, service: str, operation: str, duration: float, error_code: Optional[str] = None) -> None:
+        handlers = self._handlers["on_api_call"]
+        if handlers:
+            self._dispatch(handlers, ApiCallEvent(service, operation, duration, error_code))
+
+
+# Process-wide default bus used by the deployment engine and all resources
+bus = EventBus()
+
+_active: Optional[EventBus] = None
+
+
+def activate(event_bus: Optional[EventBus]) -> None:
+    global _active
+    _active = event_bus
+
+
+def active() -> EventBus:
+    """Bus der laufenden Deployment (TransactionalDeploymentContext(events=...)), sonst der globale bus"""
+    return _active if _active is not None else bus
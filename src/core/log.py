@@ -0,0 +1,173 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import IO, Optional, Union
+
+ROOT_LOGGER = "myzel"
+
+# Attributes every LogRecord has - everything else was passed via extra={...}
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_configured = False
+_configure_lock = threading.Lock()
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formatiert jeden Log Record als eine JSON Zeile (für CI Auswertung)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str, ensure_ascii=False)
+
+
+def configure_logging(
+    level: Union[int, str] = "INFO",
+    json_lines: Union[str, Path, IO, None] = None,
+    console: bool = True
+) -> logging.Logger:
+    """
+    Konfiguriere die Myzel Log-Ausgabe.
+
+    Args:
+        level: Minimum level for all sinks (e.g. "DEBUG" shows per-file lines)
+        json_lines: Path or stream for a JSON-lines sink, "-" for stdout
+        console: Human readable output on stdout
+
+    Returns:
+        The configured root "myzel" logger
+    """
+    global _configured
+    logger = logging.getLogger(ROOT_LOGGER)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+    logger.propagate = False
+
+    if console:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(console_handler)
+
+    if json_lines is not None:
+        if json_lines == "-":
+            json_handler = logging.StreamHandler(sys.stdout)
+        elif isinstance(json_lines, (str, Path)):
+            json_handler = logging.FileHandler(json_lines, encoding="utf-8")
+        else:
+            json_handler = logging.StreamHandler(json_lines)
+        json_handler.setFormatter(JsonLinesFormatter())
+        logger.addHandler(json_handler)
+
+    _configured = True
+    return logger
+
+
+def _ensure_configured() -> None:
+    """Default Konfiguration aus MYZEL_LOG_LEVEL / MYZEL_LOG_JSON, falls noch nichts konfiguriert ist"""
+    global _configured
+    if _configured:
+        return
+    with _configure_lock:
+        if _configured:
+            return
+        if logging.getLogger(ROOT_LOGGER).handlers:
+            _configured = True
+            return
+        configure_logging(
+            level=os.getenv("MYZEL_LOG_LEVEL", "INFO"),
+            json_lines=os.getenv("MYZEL_LOG_JSON") or None,
+            console=os.getenv("MYZEL_LOG_CONSOLE", "1") != "0"
+        )
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Hole einen Logger unterhalb von 'myzel' (z.B. 'myzel.lambda')"""
+    _ensure_configured()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+class ProgressCounter:
+    """
+    Aggregated progress for per-item work of one resource (files packed,
+    objects uploaded or deleted).
+
+    Individual items are only logged at DEBUG level; at INFO level one
+    progress line is written every `interval` seconds plus a final summary.
+    """
+
+    def __init__(self, logger: logging.Logger, resource: str, action: str, interval: float = 5.0):
+        self.logger = logger
+        self.resource = resource
+        self.action = action
+        self.interval = interval
+        self.count = 0
+        self.bytes = 0
+        self._started = time.monotonic()
+        self._last_report = self._started
+        self._lock = threading.Lock()
+        self._debug = logger.isEnabledFor(logging.DEBUG)
+
+    def add(self, item: Optional[str] = None, size: int = 0) -> None:
+        """Zähle ein verarbeitetes Element"""
+        with self._lock:
+            self.count += 1
+            self.bytes += size
+            report = time.monotonic() - self._last_report >= self.interval
+            if report:
+                self._last_report = time.monotonic()
+
+        if self._debug and item is not None:
+            self.logger.debug(f"  {self.action}: {item}",
+                              extra={"resource": self.resource, "action": self.action, "item": item, "bytes": size})
+        if report:
+            self._report(final=False)
+
+    def done(self) -> None:
+        """Schreibe die Zusammenfassung"""
+        self._report(final=True)
+
+    def _report(self, final: bool) -> None:
+        duration = time.monotonic() - self._started
+        prefix = "" if final else "  ... "
+        self.logger.info(
+            f"{prefix}{self.resource}: {self.count} {self.action} ({format_bytes(self.bytes)}, {duration:.1f}s)",
+            extra={
+                "resource": self.resource,
+                "action": self.action,
+                "count": self.count,
+                "bytes": self.bytes,
+                "duration": round(duration, 3),
+                "final": final,
+            }
+        )
+
+    def __enter__(self) -> "ProgressCounter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.done()
+        return False
+
+
+def format_bytes(size: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
@@ -0,0 +1,71 @@
+import math
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+# On-demand Lambda prices (USD, us-east-1/eu-central-1 tier 1)
+PRICE_PER_GB_SECOND = {"x86_64": 0.0000166667, "arm64": 0.0000133334}
+PRICE_PER_REQUEST = 0.0000002
+
+_REPORT_FIELDS = {
+    "duration_ms": r"Duration: ([\d.]+) ms",
+    "billed_duration_ms": r"Billed Duration: ([\d.]+) ms",
+    "memory_size_mb": r"Memory Size: (\d+) MB",
+    "max_memory_used_mb": r"Max Memory Used: (\d+) MB",
+    "init_duration_ms": r"Init Duration: ([\d.]+) ms",
+}
+_REPORT_PATTERNS = {name: re.compile(r"(?:^|\t)" + pattern) for name, pattern in _REPORT_FIELDS.items()}
+
+
+@dataclass(frozen=True)
+class InvocationReport:
+    """Werte der REPORT Zeile einer Invocation"""
+    request_id: str
+    duration_ms: float
+    billed_duration_ms: float
+    memory_size_mb: int
+    max_memory_used_mb: int
+    # Only set for the first invocation of a fresh execution environment
+    init_duration_ms: Optional[float] = None
+
+    @property
+    def cold_start(self) -> bool:
+        return self.init_duration_ms is not None
+
+    def cost(self, architecture: str = "x86_64") -> float:
+        """Kosten der Invocation in USD (Compute plus Request)"""
+        gb_seconds = self.billed_duration_ms / 1000 * self.memory_size_mb / 1024
+        return gb_seconds * PRICE_PER_GB_SECOND[architecture] + PRICE_PER_REQUEST
+
+
+def parse_report(log: str) -> Optional[InvocationReport]:
+    """Finde die REPORT Zeile im (LogType=Tail) Log einer Invocation"""
+    for line in reversed(log.splitlines()):
+        if not line.startswith("REPORT RequestId:"):
+            continue
+        values = {}
+        for name, pattern in _REPORT_PATTERNS.items():
+            match = pattern.search(line)
+            if match:
+                values[name] = float(match.group(1)) if name.endswith("_ms") else int(match.group(1))
+        if "duration_ms" not in values or "billed_duration_ms" not in values:
+            return None
+        request_id = line.split("RequestId:", 1)[1].split()[0]
+        return InvocationReport(
+            request_id=request_id,
+            duration_ms=values["duration_ms"],
+            billed_duration_ms=values["billed_duration_ms"],
+            memory_size_mb=values.get("memory_size_mb", 0),
+            max_memory_used_mb=values.get("max_memory_used_mb", 0),
+            init_duration_ms=values.get("init_duration_ms"),
+        )
+    return None
+
+
+def percentile(values: Iterable[float], p: float) -> Optional[float]:
+    """Nearest-rank Perzentil (None für keine Werte)"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = max(math.ceil(p / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
@@ -0,0 +1,78 @@
+import time
+
+import boto3
+
+from src.core import describe_cache, events, watchdog
+from src.model import AwsEnviroment
+
+
+def create_session(env: AwsEnviroment) -> boto3.session.Session:
+    """
+    Erstelle eine boto3 Session für ein AwsEnviroment.
+
+    All resources obtain their sessions here so engine-wide botocore hooks
+    (API call events, ...) are registered in exactly one place. Hooks are only
+    registered when someone listens, so the default path is a plain session.
+    """
+    session = boto3.session.Session(
+        profile_name=env.profile,
+        region_name=env.region
+    )
+
+    if events.active().wants("on_api_call"):
+        _register_api_call_events(session)
+
+    if watchdog.active() is not None:
+        _register_watchdog(session)
+
+    # Registered last: cache hits must not skip the watchdog's deadline check
+    cache = describe_cache.active()
+    if cache is not None:
+        cache.register(session)
+
+    return session
+
+
+def _register_watchdog(session: boto3.session.Session) -> None:
+    """Melde laufende API Calls an den Watchdog und brich nach der Deadline vor jedem Call ab"""
+
+    def before_call(event_name, **kwargs):
+        current = watchdog.active()
+        if current is None:
+            return
+        current.check_deadline()
+        _, service, operation = event_name.split(".", 2)
+        current.api_call_started(service, operation)
+
+    def after_call(**kwargs):
+        current = watchdog.active()
+        if current is not None:
+            current.api_call_finished()
+
+    session.events.register("before-call", before_call, unique_id="myzel-watchdog-start")
+    session.events.register("after-call", after_call, unique_id="myzel-watchdog-finish")
+    session.events.register("after-call-error", after_call, unique_id="myzel-watchdog-error")
+
+
+def _register_api_call_events(session: boto3.session.Session) -> None:
+    """Melde jeden AWS API Call mit Dauer und Fehlercode an den Event Bus"""
+
+    def before_call(context, **kwargs):
+        context["myzel_call_started"] = time.perf_counter()
+
+    def after_call(event_name, http_response, parsed, context, **kwargs):
+        _, service, operation = event_name.split(".", 2)
+        started = context.get("myzel_call_started", time.perf_counter())
+        error_code = None
+        if http_response is not None and http_response.status_code >= 300:
+            error_code = parsed.get("Error", {}).get("Code")
+        events.active().api_call(service, operation, time.perf_counter() - started, error_code)
+
+    def after_call_error(event_name, exception, context, **kwargs):
+        _, service, operation = event_name.split(".", 2)
+        started = context.get("myzel_call_started", time.perf_counter())
+        events.active().api_call(service, operation, time.perf_counter() - started, type(exception).__name__)
+
+    session.events.register("before-call", before_call, unique_id="myzel-api-call-start")
+    session.events.register("after-call", after_call, unique_id="myzel-api-call-finish")
+    session.events.register("after-call-error", after_call_error, unique_id="myzel-api-call-error")
@@ -1,18 +1,36 @@
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from src.core import describe_cache
+from src.core.events import EventBus, bus, activate as activate_events
+from src.core.log import get_logger
+from src.core.watchdog import Watchdog, activate as activate_watchdog
 from src.model import MyzelApp, Resources, IacMapping, ResourceMapping, DeploymentProgress
 from src.model.registry import get_resource_class, get_resource_type
+from src.packaging import pool as package_pool
+
+logger = get_logger("deploy")
 
 
 class TransactionalDeploymentContext:
     """Context manager for transactional resource deployment"""
 
-    def __init__(self, app: MyzelApp, config_dir: Path = Path("config")):
+    def __init__(
+        self,
+        app: MyzelApp,
+        config_dir: Path = Path("config"),
+        events: Optional[EventBus] = None,
+        watchdog: Optional[Watchdog] = None,
+        packages: Optional[package_pool.PackagePool] = None
+    ):
         self.app = app
         self.config_dir = config_dir
         self.config_file = config_dir / f"app_{app.name}.yaml"
+        self.events = events or bus
+        self.watchdog = watchdog or Watchdog(history_file=config_dir / ".myzel_timings.json")
+        self.packages = packages or package_pool.PackagePool()
 
         # Track deployment state
         self.new_deployed_state: dict[str, Resources] = {}
@@ -20,6 +38,14 @@ class TransactionalDeploymentContext:
         self.deployment_progress = DeploymentProgress()
         self.deployment_failed = False
 
+    def prepackage(self, *sources) -> None:
+        """Baue Lambda Packages vorab parallel (Code-Pfade oder LambdaFunction Objekte)
+
+        Packaging runs on a process pool while the deployment continues with
+        other resources; LambdaFunction.create/update pick up the results.
+        """
+        self.packages.prepackage(*sources)
+
     def add_resource(self, resource_id: str, resource: Resources) -> None:
         """Add and immediately deploy a resource"""
 
@@ -33,21 +59,25 @@ class TransactionalDeploymentContext:
 
             # Check if update is needed
             if resource != deployed:
-                print(f"[DEPLOY] Updating: {resource_id} ({resource_class_name})")
-                new_tech_id = deployed.update(tech_id, resource)
+                self.events.plan(resource_id, resource_type, "update")
+                logger.info(f"[DEPLOY] Updating: {resource_id} ({resource_class_name})")
+                new_tech_id = self._run(resource_id, resource_type, "update",
+                                        lambda: deployed.update(tech_id, resource))
                 tech_id = new_tech_id if new_tech_id is not None else tech_id
                 resource.set_tech_id(tech_id)
-                print(f"[DEPLOY] ✓ Updated: {resource_id} → {tech_id}")
+                logger.info(f"[DEPLOY] ✓ Updated: {resource_id} → {tech_id}")
             else:
-                print(f"[DEPLOY] No changes: {resource_id} ({resource_class_name})")
+                self.events.plan(resource_id, resource_type, "noop")
+                logger.info(f"[DEPLOY] No changes: {resource_id} ({resource_class_name})")
                 # Set tech_id from deployed state
                 resource.set_tech_id(tech_id)
         else:
             # Create new resource
-            print(f"[DEPLOY] Creating: {resource_id} ({resource_class_name})")
-            tech_id = resource.create()
+            self.events.plan(resource_id, resource_type, "create")
+            logger.info(f"[DEPLOY] Creating: {resource_id} ({resource_class_name})")
+            tech_id = self._run(resource_id, resource_type, "create", resource.create)
             resource.set_tech_id(tech_id)
-            print(f"[DEPLOY] ✓ Created: {resource_id} → {tech_id}")
+            logger.info(f"[DEPLOY] ✓ Created: {resource_id} → {tech_id}")
         self.new_deployed_state[resource_id] = resource
         self.new_iac_mapping.resources[resource_id] = ResourceMapping(
             type=resource_type,
@@ -59,6 +89,19 @@ class TransactionalDeploymentContext:
         # Save intermediate state for recovery
         self._save_intermediate_config()
 
+    def _run(self, resource_id: str, resource_type: str, action: str, operation):
+        """Führe eine Resource-Operation aus und melde Start, Ende und Fehler an den Event Bus"""
+        self.events.resource_start(resource_id, resource_type, action)
+        started = time.perf_counter()
+        try:
+            with self.watchdog.watch(resource_id, resource_type, action):
+                tech_id = operation()
+        except Exception as e:
+            self.events.resource_fail(resource_id, resource_type, action, e, time.perf_counter() - started)
+            raise
+        self.events.resource_finish(resource_id, resource_type, action, tech_id, time.perf_counter() - started)
+        return tech_id
+
     def _save_intermediate_config(self) -> None:
         """Save intermediate deployment state for recovery"""
         from dataclasses import asdict
@@ -70,23 +113,42 @@ class TransactionalDeploymentContext:
 
     def __enter__(self) -> "TransactionalDeploymentContext":
         """Enter context manager"""
-        print(f"[DEPLOY] Starting deployment for app: {self.app.name}")
+        logger.info(f"[DEPLOY] Starting deployment for app: {self.app.name}")
+        activate_events(self.events)
+        activate_watchdog(self.watchdog)
+        describe_cache.activate(self.app.describe_cache)
+        package_pool.activate(self.packages)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
         """Exit context manager and handle cleanup"""
+        try:
+            return self._finish(exc_type, exc_val)
+        finally:
+            package_pool.activate(None)
+            self.packages.shutdown()
+            describe_cache.activate(None)
+            self.app.describe_cache.clear()
+            activate_watchdog(None)
+            self.watchdog.close()
+            activate_events(None)
+
+    def _finish(self, exc_type, exc_val) -> bool:
+        """Finalize config on success or keep the partial state on failure"""
         if exc_type is not None:
             # Deployment failed - save partial state for recovery
-            print(f"[ERROR] Deployment failed: {exc_val}")
-            print(f"[RECOVERY] Saved partial state: {self.deployment_progress.total_deployed} resources deployed")
+            logger.error(f"[ERROR] Deployment failed: {exc_val}")
+            logger.warning(f"[RECOVERY] Saved partial state: {self.deployment_progress.total_deployed} resources deployed")
             self.deployment_failed = True
+            self.events.flush()
             # Config with progress is already saved via _save_intermediate_config()
             return False  # Re-raise the exception
 
         # Deployment succeeded - cleanup old resources
-        print(f"[DEPLOY] All resources deployed successfully ({self.deployment_progress.total_deployed}/{len(self.app.constructs)})")
+        logger.info(f"[DEPLOY] All resources deployed successfully ({self.deployment_progress.total_deployed}/{len(self.app.constructs)})")
         self._cleanup_old_resources()
         self._finalize_config()
+        self.events.flush()
         return False
 
     def _cleanup_old_resources(self) -> None:
@@ -97,11 +159,11 @@ class TransactionalDeploymentContext:
                 to_delete[resource_id] = resource
 
         if not to_delete:
-            print("[CLEANUP] No resources to delete")
+            logger.info("[CLEANUP] No resources to delete")
             return
 
         # Delete in reverse order of deployment
-        print(f"[CLEANUP] Deleting {len(to_delete)} old resources in reverse order...")
+        logger.info(f"[CLEANUP] Deleting {len(to_delete)} old resources in reverse order...")
 
         # Build reverse order - first deployed resources that need to be deleted
         reverse_order = [rid for rid in reversed(self.deployment_progress.deployed_resource_ids) if rid in to_delete]
@@ -112,12 +174,14 @@ class TransactionalDeploymentContext:
             resource = to_delete[resource_id]
             tech_id = self.app.current_config.resources[resource_id].tech_id
             resource_class_name = resource.__class__.__name__
-            print(f"[CLEANUP] Deleting: {resource_id} ({resource_class_name})")
-            resource.delete(tech_id)
-            print(f"[CLEANUP] ✓ Deleted: {resource_id}")
+            resource_type = self.app.current_config.resources[resource_id].type
+            self.events.plan(resource_id, resource_type, "delete")
+            logger.info(f"[CLEANUP] Deleting: {resource_id} ({resource_class_name})")
+            self._run(resource_id, resource_type, "delete", lambda: resource.delete(tech_id))
+            logger.info(f"[CLEANUP] ✓ Deleted: {resource_id}")
 
     def _finalize_config(self) -> None:
         """Save final configuration without deployment progress"""
         final_mapping = IacMapping(resources=self.new_iac_mapping.resources)
         final_mapping.to_yaml(self.config_file)
-        print(f"[SUCCESS] Config saved: {self.config_file}")
+        logger.info(f"[SUCCESS] Config saved: {self.config_file}")
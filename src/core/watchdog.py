@@ -0,0 +1,269 @@
+import json
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from src.core.log import get_logger
+
+logger = get_logger("watchdog")
+
+# Expected duration (seconds) of a single create/update/delete per resource type
+DEFAULT_BUDGETS = {
+    "iam_role": 30,
+    "lambda": 90,
+    "lambda_layer": 60,
+    "lambda_function_url": 20,
+    "schedule_rule": 20,
+    "s3": 20,
+    "s3_deploy": 120,
+    "dynamodb": 90,
+    "api_gateway": 60,
+    "cloudfront": 900,
+}
+
+# Hard limit (seconds) after which the operation is aborted with DeadlineExceededError
+DEFAULT_DEADLINES = {
+    "iam_role": 180,
+    "lambda": 300,
+    "lambda_layer": 300,
+    "lambda_function_url": 120,
+    "schedule_rule": 120,
+    "s3": 180,
+    "s3_deploy": 1800,
+    "dynamodb": 600,
+    "api_gateway": 300,
+    "cloudfront": 1500,
+}
+
+FALLBACK_BUDGET = 60
+FALLBACK_DEADLINE = 900
+
+# Keep this many durations per type/operation in the history file
+HISTORY_SIZE = 20
+
+
+class DeadlineExceededError(TimeoutError):
+    """Eine Resource-Operation hat ihre harte Deadline überschritten"""
+
+
+@dataclass
+class _Operation:
+    resource_id: str
+    resource_type: str
+    operation: str
+    thread_id: int
+    started: float
+    budget: float
+    deadline: float
+    warnings: int = 0
+    api_call: Optional[str] = None
+    api_call_started: Optional[float] = None
+
+
+@dataclass
+class _History:
+    path: Optional[Path]
+    durations: dict[str, list[float]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Optional[Path]) -> "_History":
+        if path is None or not path.exists():
+            return cls(path=path)
+        try:
+            with path.open() as f:
+                return cls(path=path, durations=json.load(f))
+        except (OSError, ValueError):
+            logger.warning(f"Warnung: Timing-Historie {path} ist nicht lesbar, verwende Defaults")
+            return cls(path=path)
+
+    def record(self, key: str, duration: float) -> None:
+        samples = self.durations.setdefault(key, [])
+        samples.append(round(duration, 3))
+        del samples[:-HISTORY_SIZE]
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w") as f:
+            json.dump(self.durations, f, indent=2, sort_keys=True)
+
+
+class Watchdog:
+    """
+    Überwacht laufende Resource-Operationen.
+
+    Each operation gets a budget (expected duration, from the timing history
+    or DEFAULT_BUDGETS) and a hard deadline. A monitor thread logs a warning
+    with the in-flight API call and a stack dump of the stuck thread whenever
+    an operation runs past its budget. check_deadline() - called before every
+    AWS API call and in every polling loop - raises DeadlineExceededError once
+    the hard deadline has passed.
+    """
+
+    def __init__(
+        self,
+        history_file: Optional[Path] = None,
+        budgets: Optional[dict] = None,
+        deadlines: Optional[dict] = None,
+        slack: float = 2.0,
+        poll_interval: float = 5.0
+    ):
+        self.budgets = {**DEFAULT_BUDGETS, **(budgets or {})}
+        self.deadlines = {**DEFAULT_DEADLINES, **(deadlines or {})}
+        self.slack = slack
+        self.poll_interval = poll_interval
+        self._history = _History.load(history_file)
+        self._operations: dict[int, _Operation] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def budget_for(self, resource_type: str, operation: str) -> float:
+        """Erwartete Dauer: aus der Historie wenn vorhanden, sonst Default pro Typ"""
+        samples = self._history.durations.get(f"{resource_type}:{operation}", [])
+        if len(samples) >= 3:
+            return max(max(samples) * self.slack, 1.0)
+        return self.budgets.get(resource_type, FALLBACK_BUDGET)
+
+    def deadline_for(self, resource_type: str) -> float:
+        return self.deadlines.get(resource_type, FALLBACK_DEADLINE)
+
+    @contextmanager
+    def watch(self, resource_id: str, resource_type: str, operation: str):
+        """Überwache eine Resource-Operation im aktuellen Thread"""
+        thread_id = threading.get_ident()
+        op = _Operation(
+            resource_id=resource_id,
+            resource_type=resource_type,
+            operation=operation,
+            thread_id=thread_id,
+            started=time.monotonic(),
+            budget=self.budget_for(resource_type, operation),
+            deadline=self.deadline_for(resource_type)
+        )
+        with self._lock:
+            previous = self._operations.get(thread_id)
+            self._operations[thread_id] = op
+        self._ensure_monitor()
+
+        try:
+            yield op
+        finally:
+            duration = time.monotonic() - op.started
+            with self._lock:
+                if previous is not None:
+                    self._operations[thread_id] = previous
+                else:
+                    self._operations.pop(thread_id, None)
+
+        # Only successful operations feed the history
+        self._history.record(f"{resource_type}:{operation}", duration)
+        self._history.save()
+
+    def api_call_started(self, service: str, operation: str) -> None:
+        op = self._operations.get(threading.get_ident())
+        if op is not None:
+            op.api_call = f"{service}.{operation}"
+            op.api_call_started = time.monotonic()
+
+    def api_call_finished(self) -> None:
+        op = self._operations.get(threading.get_ident())
+        if op is not None:
+            op.api_call = None
+            op.api_call_started = None
+
+    def check_deadline(self) -> None:
+        """Brich ab, wenn die Operation des aktuellen Threads ihre Deadline überschritten hat"""
+        op = self._operations.get(threading.get_ident())
+        if op is None:
+            return
+        elapsed = time.monotonic() - op.started
+        if elapsed > op.deadline:
+            raise DeadlineExceededError(
+                f"{op.resource_id} ({op.resource_type}) {op.operation}: "
+                f"Deadline von {op.deadline:.0f}s überschritten nach {elapsed:.0f}s"
+            )
+
+    def extend_deadline(self, seconds: float) -> None:
+        """Mehr Zeit für die Operation des aktuellen Threads (z.B. Canary Beobachtung)"""
+        op = self._operations.get(threading.get_ident())
+        if op is not None:
+            op.budget += seconds
+            op.deadline += seconds
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval)
+            self._thread = None
+
+    def _ensure_monitor(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._monitor, name="myzel-watchdog", daemon=True)
+        self._thread.start()
+
+    def _monitor(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            now = time.monotonic()
+            with self._lock:
+                operations = list(self._operations.values())
+            for op in operations:
+                elapsed = now - op.started
+                # Warn once per exceeded budget multiple (1x, 2x, 3x, ...)
+                if elapsed > op.budget * (op.warnings + 1):
+                    op.warnings += 1
+                    self._report_slow(op, elapsed)
+
+    def _report_slow(self, op: _Operation, elapsed: float) -> None:
+        if op.api_call:
+            call = f"{op.api_call} (seit {time.monotonic() - op.api_call_started:.0f}s)"
+        else:
+            call = "kein laufender API Call"
+        frame = sys._current_frames().get(op.thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else "<thread beendet>"
+        logger.warning(
+            f"Warnung: {op.resource_id} ({op.resource_type}) {op.operation} läuft seit {elapsed:.0f}s "
+            f"(erwartet {op.budget:.0f}s, Deadline {op.deadline:.0f}s) - {call}\n{stack}",
+            extra={
+                "resource": op.resource_id,
+                "resource_type": op.resource_type,
+                "operation": op.operation,
+                "elapsed": round(elapsed, 1),
+                "budget": op.budget,
+                "deadline": op.deadline,
+                "api_call": op.api_call,
+            }
+        )
+
+
+# Watchdog of the currently running deployment (None outside of a deployment)
+_active: Optional[Watchdog] = None
+
+
+def activate(watchdog: Optional[Watchdog]) -> None:
+    global _active
+    _active = watchdog
+
+
+def active() -> Optional[Watchdog]:
+    return _active
+
+
+def check_deadline() -> None:
+    """Prüfe die Deadline der laufenden Operation (no-op ohne aktiven Watchdog)"""
+    if _active is not None:
+        _active.check_deadline()
+
+
+def extend_deadline(seconds: float) -> None:
+    """Verlängere Budget und Deadline der laufenden Operation (no-op ohne aktiven Watchdog)"""
+    if _active is not None:
+        _active.extend_deadline(seconds)
@@ -0,0 +1,3 @@
+from src.local.emulator import LocalApi, LocalResponse, LocalWorker
+
+__all__ = ["LocalApi", "LocalResponse", "LocalWorker"]
@@ -0,0 +1,383 @@
+import base64
+import importlib.util
+import json
+import os
+import re
+import sys
+import threading
+import time
+import traceback
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterable, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from src.core.log import get_logger
+from src.core.report import percentile
+from src.packaging.package import install_runtime_modules
+
+logger = get_logger("local")
+
+# Handlers read os.environ at import and call time. The process has a single
+# environment, so imports and invocations are serialized - every function
+# behaves like one Lambda execution environment handling one event at a time.
+_environ_lock = threading.RLock()
+
+# Local credentials so boto3 clients of the handlers never pick up real ones
+_LOCAL_AWS_ENV = {
+    "AWS_ACCESS_KEY_ID": "local",
+    "AWS_SECRET_ACCESS_KEY": "local",
+    "AWS_DEFAULT_REGION": "eu-central-1",
+}
+
+
+class LambdaContext:
+    """Minimaler Lambda Context für lokale Aufrufe"""
+
+    def __init__(self, function, request_id: str):
+        self.function_name = function.function_name
+        self.function_version = "$LATEST"
+        self.memory_limit_in_mb = function.memory_size
+        self.aws_request_id = request_id
+        self.invoked_function_arn = f"arn:aws:lambda:local:000000000000:function:{function.function_name}"
+        self.log_group_name = f"/aws/lambda/{function.function_name}"
+        self.log_stream_name = "local"
+        self._deadline = time.monotonic() + function.timeout
+
+    def get_remaining_time_in_millis(self) -> int:
+        return max(int((self._deadline - time.monotonic()) * 1000), 0)
+
+
+class LocalWorker:
+    """
+    Warm in-process execution environment of one LambdaFunction.
+
+    The handler module is imported once on the first event (the local "cold
+    start", timed like Lambda's Init Duration) and reused for all following
+    events.
+    """
+
+    def __init__(self, function, environment: Optional[dict] = None):
+        self.function = function
+        self.environment = {**_LOCAL_AWS_ENV, **function.environment_variables, **(environment or {})}
+        self.init_duration_ms: Optional[float] = None
+        self._handler = None
+
+    def invoke(self, event: dict) -> Any:
+        with _environ_lock, self._environ():
+            if self._handler is None:
+                started = time.perf_counter()
+                self._handler = self._load()
+                self.init_duration_ms = (time.perf_counter() - started) * 1000
+                logger.info(f"{self.function.function_name}: Init {self.init_duration_ms:.1f} ms")
+            return self._handler(event, LambdaContext(self.function, event["requestContext"]["requestId"]))
+
+    def _load(self):
+        module_name, _, attribute = self.function.handler.rpartition(".")
+        code_path = Path(self.function.code_path).resolve()
+        module_path = code_path / (module_name.replace(".", "/") + ".py")
+        if not module_path.exists():
+            raise FileNotFoundError(f"Handler Modul nicht gefunden: {module_path}")
+
+        spec = importlib.util.spec_from_file_location(
+            f"myzel_local.{self.function.function_name.replace('-', '_')}.{module_name}", module_path)
+        module = importlib.util.module_from_spec(spec)
+        # Sibling modules of the function and the shipped helpers are importable, like in /var/task
+        install_runtime_modules()
+        sys.path.insert(0, str(code_path))
+        try:
+            spec.loader.exec_module(module)
+        finally:
+            sys.path.remove(str(code_path))
+        return getattr(module, attribute)
+
+    @contextmanager
+    def _environ(self):
+        previous = {key: os.environ.get(key) for key in self.environment}
+        os.environ.update({key: str(value) for key, value in self.environment.items()})
+        try:
+            yield
+        finally:
+            for key, value in previous.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+
+@dataclass
+class LocalResponse:
+    status: int
+    headers: dict = field(default_factory=dict)
+    body: bytes = b""
+    cookies: list = field(default_factory=list)
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+@dataclass
+class _Route:
+    route_key: str
+    method: str
+    pattern: re.Pattern
+    worker: LocalWorker
+    # Static routes win over parameterized ones
+    priority: tuple = ()
+
+
+class LocalApi:
+    """
+    Local API Gateway (HTTP API, payload format 2.0) in front of Lambda handlers.
+
+    Reads the routes of an ApiGateway and maps each route's lambda_name to
+    the LambdaFunction with that function_name; its code_path/handler is
+    invoked in a warm in-process worker. Events carry routeKey,
+    pathParameters, queryStringParameters, headers, cookies and body like
+    the real integration; responses are mapped back the same way.
+
+    environment overrides the functions' environment variables (e.g.
+    {"TABLE_NAME": "todos-local"}); dynamodb_endpoint points the handlers'
+    boto3 DynamoDB clients at a local DynamoDB (AWS_ENDPOINT_URL_DYNAMODB).
+
+    Usage:
+        api = LocalApi(api_gateway, [lambda_todo_list, ...], dynamodb_endpoint="http://localhost:8000")
+        api.serve(port=3000)                    # blocking
+        response = api.request("GET", "/api/todos")  # without HTTP, e.g. for benchmarks
+    """
+
+    def __init__(
+        self,
+        api_gateway,
+        functions: Iterable,
+        environment: Optional[dict] = None,
+        dynamodb_endpoint: Optional[str] = None
+    ):
+        environment = dict(environment or {})
+        if dynamodb_endpoint:
+            environment["AWS_ENDPOINT_URL_DYNAMODB"] = dynamodb_endpoint
+
+        functions = {function.function_name: function for function in functions}
+        workers: dict[str, LocalWorker] = {}
+        self.routes: list[_Route] = []
+        for route_path, config in api_gateway.routes.items():
+            lambda_name = config['lambda_name']
+            if lambda_name not in functions:
+                raise ValueError(f"Route {route_path}: keine LambdaFunction '{lambda_name}' angegeben")
+            if lambda_name not in workers:
+                workers[lambda_name] = LocalWorker(functions[lambda_name], environment)
+            method = config.get('method', 'GET')
+            self.routes.append(_Route(
+                route_key=f"{method} {route_path}",
+                method=method,
+                pattern=_route_pattern(route_path),
+                worker=workers[lambda_name],
+                priority=(route_path.count("{"), -len(route_path)),
+            ))
+        self.routes.sort(key=lambda route: route.priority)
+        self.workers = workers
+        self.durations: dict[str, list[float]] = {}
+        self._stats_lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def request(self, method: str, path: str, headers: Optional[dict] = None,
+                body: bytes = b"", source_ip: str = "127.0.0.1") -> LocalResponse:
+        """Bearbeite einen Request wie API Gateway (ohne HTTP Server)"""
+        url = urlsplit(path)
+        match = self._match(method, url.path)
+        if match is None:
+            return _json_response(404, {"message": "Not Found"})
+        route, path_parameters = match
+
+        event = _event(route.route_key, method, url, headers or {}, body, path_parameters, source_ip)
+        started = time.perf_counter()
+        try:
+            result = route.worker.invoke(event)
+        except Exception:
+            logger.error(f"{route.route_key}: Handler Fehler\n{traceback.format_exc()}")
+            return _json_response(500, {"message": "Internal Server Error"})
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            with self._stats_lock:
+                self.durations.setdefault(route.route_key, []).append(duration_ms)
+
+        response = _response(result)
+        logger.info(f"{method} {url.path} → {response.status} ({duration_ms:.1f} ms)",
+                    extra={"route_key": route.route_key, "status": response.status, "duration_ms": duration_ms})
+        return response
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Starte den HTTP Server im Hintergrund, gibt die Basis URL zurück"""
+        self._server = ThreadingHTTPServer((host, port), _handler_class(self))
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-api", daemon=True)
+        self._thread.start()
+        url = f"http://{host}:{self._server.server_address[1]}"
+        logger.info(f"Lokales API Gateway: {url} ({len(self.routes)} Routes)")
+        return url
+
+    def serve(self, host: str = "127.0.0.1", port: int = 3000) -> None:
+        """Blockierender HTTP Server (Strg+C beendet und zeigt die Latenzen)"""
+        self.start(host, port)
+        try:
+            self._thread.join()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self.report()
+
+    def report(self) -> dict:
+        """Latenzen pro Route (ms) - gleiche Kennzahlen wie das Power Tuning"""
+        with self._stats_lock:
+            stats = {
+                route_key: {
+                    "count": len(durations),
+                    "p50_ms": percentile(durations, 50),
+                    "p95_ms": percentile(durations, 95),
+                }
+                for route_key, durations in self.durations.items()
+            }
+        for route_key, values in stats.items():
+            logger.info(f"  {route_key}: {values['count']} Requests, "
+                        f"p50 {values['p50_ms']:.1f} ms, p95 {values['p95_ms']:.1f} ms")
+        return stats
+
+    def _match(self, method: str, path: str) -> Optional[tuple[_Route, dict]]:
+        for route in self.routes:
+            if route.method not in (method, "ANY"):
+                continue
+            match = route.pattern.fullmatch(path)
+            if match is not None:
+                return route, match.groupdict()
+        return None
+
+    def __enter__(self) -> "LocalApi":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.stop()
+        return False
+
+
+def _route_pattern(route_path: str) -> re.Pattern:
+    """/api/todos/{id}/update -> Regex mit benannten Gruppen ({proxy+} greedy)"""
+    regex = ""
+    for part in re.split(r"(\{[^}]+\})", route_path):
+        if part.startswith("{") and part.endswith("+}"):
+            regex += f"(?P<{part[1:-2]}>.+)"
+        elif part.startswith("{"):
+            regex += f"(?P<{part[1:-1]}>[^/]+)"
+        else:
+            regex += re.escape(part)
+    return re.compile(regex)
+
+
+def _event(route_key: str, method: str, url, headers: dict, body: bytes,
+           path_parameters: dict, source_ip: str) -> dict:
+    """API Gateway HTTP API Event (Payload Format 2.0)"""
+    headers = {key.lower(): value for key, value in headers.items()}
+    query: dict[str, list[str]] = {}
+    for key, value in parse_qsl(url.query, keep_blank_values=True):
+        query.setdefault(key, []).append(value)
+    now = datetime.now(timezone.utc)
+
+    event = {
+        "version": "2.0",
+        "routeKey": route_key,
+        "rawPath": url.path,
+        "rawQueryString": url.query,
+        "headers": {key: value for key, value in headers.items() if key != "cookie"},
+        "requestContext": {
+            "accountId": "000000000000",
+            "apiId": "local",
+            "domainName": headers.get("host", "localhost"),
+            "domainPrefix": "local",
+            "http": {
+                "method": method,
+                "path": url.path,
+                "protocol": "HTTP/1.1",
+                "sourceIp": source_ip,
+                "userAgent": headers.get("user-agent", ""),
+            },
+            "requestId": str(uuid.uuid4()),
+            "routeKey": route_key,
+            "stage": "$default",
+            "time": now.strftime("%d/%b/%Y:%H:%M:%S +0000"),
+            "timeEpoch": int(now.timestamp() * 1000),
+        },
+        "isBase64Encoded": False,
+    }
+    if "cookie" in headers:
+        event["cookies"] = [cookie.strip() for cookie in headers["cookie"].split(";")]
+    if query:
+        event["queryStringParameters"] = {key: ",".join(values) for key, values in query.items()}
+    if path_parameters:
+        event["pathParameters"] = path_parameters
+    if body:
+        try:
+            event["body"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            event["body"] = base64.b64encode(body).decode()
+            event["isBase64Encoded"] = True
+    return event
+
+
+def _response(result: Any) -> LocalResponse:
+    """Handler Ergebnis -> HTTP Response (Regeln von Payload Format 2.0)"""
+    if not isinstance(result, dict) or "statusCode" not in result:
+        # Without statusCode the return value is the JSON body
+        return _json_response(200, result)
+
+    body = result.get("body") or ""
+    if result.get("isBase64Encoded"):
+        body_bytes = base64.b64decode(body)
+    else:
+        body_bytes = body.encode("utf-8") if isinstance(body, str) else json.dumps(body).encode()
+    headers = {key: str(value) for key, value in (result.get("headers") or {}).items()}
+    return LocalResponse(int(result["statusCode"]), headers, body_bytes, list(result.get("cookies") or []))
+
+
+def _json_response(status: int, data: Any) -> LocalResponse:
+    return LocalResponse(status, {"Content-Type": "application/json"}, json.dumps(data).encode())
+
+
+def _handler_class(api: LocalApi):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _dispatch(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            headers: dict[str, str] = {}
+            for key, value in self.headers.items():
+                key = key.lower()
+                headers[key] = f"{headers[key]},{value}" if key in headers else value
+            response = api.request(self.command, self.path, headers, body, self.client_address[0])
+
+            self.send_response(response.status)
+            for key, value in response.headers.items():
+                self.send_header(key, value)
+            for cookie in response.cookies:
+                self.send_header("Set-Cookie", cookie)
+            self.send_header("Content-Length", str(len(response.body)))
+            self.end_headers()
+            self.wfile.write(response.body)
+
+        do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = do_OPTIONS = _dispatch
+
+        def log_message(self, format, *args):
+            # Requests are logged by LocalApi.request
+            pass
+
+    return Handler
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TypeVar, Type, Dict, Optional
+from typing import TypeVar, Type, Dict, Optional, Callable, Any
 
 import yaml
 from pydantic import BaseModel, Field
@@ -19,6 +19,38 @@ class AwsEnviroment:
 T = TypeVar('T', bound='Resources')
 
 
+class lazy_field:
+    """
+    Attribute whose remote value is only fetched on first access.
+
+    get() implementations register a loader via Resources.defer(); the loader
+    runs the first time the attribute is read and its result is memoized on
+    the instance. Assigning a value (e.g. in __init__) replaces the loader.
+    """
+
+    def __init__(self, default: Any = None):
+        self.default = default
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            pass
+        loader = instance.__dict__.get('_loaders', {}).pop(self.name, None)
+        value = loader() if loader is not None else self.default
+        instance.__dict__[self.name] = value
+        return value
+
+    def __set__(self, instance, value) -> None:
+        instance.__dict__.get('_loaders', {}).pop(self.name, None)
+        instance.__dict__[self.name] = value
+
+
 class Resources(ABC):
     """
     Abstract base class for all AWS resources in Myzel.
@@ -30,9 +62,39 @@ class Resources(ABC):
     - delete: Remove resource from AWS
 
     All implementations MUST be idempotent and handle graceful degradation.
+
+    Diffing: two instances are equal when all `_diff_fields` match. Fields are
+    compared in declaration order and comparison stops at the first mismatch,
+    so cheap fields go first and expensive lazy_field attributes last - they
+    are only fetched from AWS when everything before them already matches.
+    Resources without `_diff_fields` always count as changed. Lists of strings
+    are compared in order unless the field is listed in `_unordered_fields`.
     """
 
     _tech_id: Optional[str] = None
+    _diff_fields: tuple[str, ...] = ()
+    # Diff fields whose string lists are sets (e.g. policy ARNs), compared sorted
+    _unordered_fields: tuple[str, ...] = ()
+    # Set by get() when the resource does not exist in AWS
+    _missing: bool = False
+
+    def defer(self, field_name: str, loader: Callable[[], Any]) -> None:
+        """Lade ein lazy_field erst beim ersten Zugriff"""
+        self.__dict__.pop(field_name, None)
+        self.__dict__.setdefault('_loaders', {})[field_name] = loader
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Resources) or not self._diff_fields or self._diff_fields != other._diff_fields:
+            return NotImplemented
+        if self._missing or other._missing:
+            return False
+        return all(
+            _normalize(getattr(self, name), name in self._unordered_fields)
+            == _normalize(getattr(other, name), name in self._unordered_fields)
+            for name in self._diff_fields
+        )
+
+    __hash__ = object.__hash__
 
     def get_tech_id(self) -> Optional[str]:
         """Get the technical identifier of this resource instance"""
@@ -172,6 +234,16 @@ class Resources(ABC):
         """
         pass
 
+
+def _normalize(value: Any, unordered: bool = False) -> Any:
+    """Vergleichbarer Wert eines Diff-Felds - ungeordnete Listen von Strings werden sortiert"""
+    if unordered and isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return sorted(value)
+    if isinstance(value, Path):
+        return str(value)
+    return value
+
+
 @dataclass
 class DeploymentProgress:
     """Tracks deployment progress for recovery on failure"""
@@ -188,9 +260,13 @@ class MyzelApp:
     current_config: Optional["IacMapping"] = None
     current_state: dict[str, Resources] = field(default_factory=dict)
     config_dir: Path = field(default_factory=lambda: Path("config"))
+    describe_cache: Optional[Any] = None
 
     def __post_init__(self):
         """Load existing config and state from AWS"""
+        if self.describe_cache is None:
+            from src.core.describe_cache import DescribeCache
+            self.describe_cache = DescribeCache()
         if self.current_config is None:
             self._load_current_state(self.config_dir)
 
@@ -201,12 +277,22 @@ class MyzelApp:
         self.current_config = IacMapping.from_yaml(config_file)
 
         # Load current state from AWS
+        import time
+        from src.core import describe_cache
+        from src.core import events
         from src.model.registry import get_resource_class
-        for resource_id, resource_mapping in self.current_config.resources.items():
-            resource_class = get_resource_class(resource_mapping.type)
-            if resource_class:
-                resource = resource_class.get(resource_mapping.tech_id, self.env)
-                self.current_state[resource_id] = resource
+        describe_cache.activate(self.describe_cache)
+        try:
+            for resource_id, resource_mapping in self.current_config.resources.items():
+                resource_class = get_resource_class(resource_mapping.type)
+                if resource_class:
+                    started = time.perf_counter()
+                    resource = resource_class.get(resource_mapping.tech_id, self.env)
+                    self.current_state[resource_id] = resource
+                    events.active().refresh(resource_id, resource_mapping.type, resource_mapping.tech_id,
+                                            time.perf_counter() - started)
+        finally:
+            describe_cache.activate(None)
 
     def begin_deploy(self):
         """Start a transactional deployment"""
@@ -257,4 +343,5 @@ class DiffResult:
 
     def print(self) -> None:
         """Gebe DiffResult als YAML aus"""
-        print(self.to_yaml_str())
\ No newline at end of file
+        from src.core.log import get_logger
+        get_logger("diff").info(self.to_yaml_str())
\ No newline at end of file
@@ -0,0 +1,12 @@
+from src.packaging.artifact_store import ArtifactStore, artifact_store
+from src.packaging.cache import PackageCache, PackageEntry, package_cache
+from src.packaging.ignore import IgnoreRules
+from src.packaging.optimize import OptimizeOptions
+from src.packaging.layers import LayerBuilder, group_by_lock, locked_wheels
+from src.packaging.package import collect_files, package_files, source_hash
+from src.packaging.pool import PackagePool
+from src.packaging.router import Router
+
+__all__ = ["ArtifactStore", "artifact_store", "PackageCache", "PackageEntry", "package_cache",
+           "collect_files", "package_files", "source_hash", "PackagePool", "LayerBuilder", "group_by_lock", "locked_wheels",
+           "OptimizeOptions", "IgnoreRules", "Router"]
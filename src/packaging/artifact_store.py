@@ -0,0 +1,112 @@
+import threading
+
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
+from src.core.log import get_logger
+from src.core.session import create_session
+from src.model import AwsEnviroment
+from src.packaging.cache import PackageEntry
+
+logger = get_logger("packaging")
+
+ARTIFACT_PREFIX = "lambda-packages/"
+
+# Packages above this size are uploaded in parts
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+
+
+class ArtifactStore:
+    """
+    Content-addressed S3 store for Lambda deployment packages.
+
+    Packages are stored once under their SHA-256 (lambda-packages/<sha256>.zip),
+    so functions with identical code share one object and a package that is
+    already in the bucket is never uploaded again. Lambda only reads code from
+    a bucket in its own region - use "{region}" (and "{account}") in the
+    bucket name to get one store per target region.
+    """
+
+    def __init__(self, bucket_name: str, env: AwsEnviroment):
+        self.bucket_name = bucket_name.format(region=env.region, account=env.account)
+        self.env = env
+        self._uploaded: set[str] = set()
+        self._bucket_ready = False
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def key_for(package: PackageEntry) -> str:
+        return f"{ARTIFACT_PREFIX}{package.sha256_hex}.zip"
+
+    def upload(self, package: PackageEntry) -> dict:
+        """Lade das Package hoch, falls es noch nicht im Bucket liegt
+
+        Returns:
+            Lambda code location ({'S3Bucket': ..., 'S3Key': ...})
+        """
+        key = self.key_for(package)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # One upload per key, even when several functions share the package
+        with key_lock:
+            if key not in self._uploaded:
+                s3_client = create_session(self.env).client('s3')
+                self._ensure_bucket(s3_client)
+                if self._exists(s3_client, key):
+                    logger.info(f"Package bereits im Artifact Store: s3://{self.bucket_name}/{key}")
+                else:
+                    # Streamed from the package cache - the archive is never loaded into memory
+                    s3_client.upload_file(
+                        str(package.zip_path),
+                        self.bucket_name,
+                        key,
+                        ExtraArgs={'ContentType': 'application/zip'},
+                        Config=TransferConfig(
+                            multipart_threshold=MULTIPART_THRESHOLD,
+                            multipart_chunksize=MULTIPART_CHUNKSIZE
+                        )
+                    )
+                    logger.info(f"Package hochgeladen: s3://{self.bucket_name}/{key} ({package.size} Bytes)")
+                self._uploaded.add(key)
+
+        return {'S3Bucket': self.bucket_name, 'S3Key': key}
+
+    def _exists(self, s3_client, key: str) -> bool:
+        try:
+            s3_client.head_object(Bucket=self.bucket_name, Key=key)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+
+    def _ensure_bucket(self, s3_client) -> None:
+        if self._bucket_ready:
+            return
+        try:
+            s3_client.head_bucket(Bucket=self.bucket_name)
+        except ClientError as e:
+            if e.response['Error']['Code'] not in ('404', 'NoSuchBucket', 'NotFound'):
+                raise
+            params = {'Bucket': self.bucket_name}
+            if self.env.region != 'us-east-1':
+                params['CreateBucketConfiguration'] = {'LocationConstraint': self.env.region}
+            s3_client.create_bucket(**params)
+            logger.info(f"Artifact Bucket erstellt: {self.bucket_name}")
+        self._bucket_ready = True
+
+
+_stores: dict[tuple, ArtifactStore] = {}
+_stores_lock = threading.Lock()
+
+
+def artifact_store(bucket_name: str, env: AwsEnviroment) -> ArtifactStore:
+    """Hole den (prozessweit geteilten) Artifact Store für Bucket und Environment"""
+    key = (bucket_name, env.profile, env.account, env.region)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = ArtifactStore(bucket_name, env)
+        return _stores[key]
@@ -0,0 +1,128 @@
+import hashlib
+import io
+import os
+import tempfile
+from typing import BinaryIO, Optional
+
+# Packages up to this size are built purely in memory
+DEFAULT_SPILL_THRESHOLD = int(os.getenv("MYZEL_PACKAGE_SPILL_BYTES", 64 * 1024 * 1024))
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class ZipBuffer(io.RawIOBase):
+    """
+    Seekable write target for zipfile.ZipFile.
+
+    Data lives in a bytearray until it grows beyond spill_threshold; then it
+    moves to an anonymous temporary file (deleted by the OS on close, nothing
+    left behind). In memory, the finished archive is handed out without a
+    copy: payload() returns the bytearray itself and view() a memoryview.
+    """
+
+    def __init__(self, spill_threshold: int = DEFAULT_SPILL_THRESHOLD):
+        super().__init__()
+        self.spill_threshold = spill_threshold
+        self._data = bytearray()
+        self._file: Optional[BinaryIO] = None
+        self._pos = 0
+
+    @property
+    def spilled(self) -> bool:
+        return self._file is not None
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._file.tell() if self._file is not None else self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if self._file is not None:
+            return self._file.seek(offset, whence)
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._data)
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def write(self, data) -> int:
+        if self._file is None and self._pos + len(data) > self.spill_threshold:
+            self._spill()
+        if self._file is not None:
+            return self._file.write(data)
+
+        end = self._pos + len(data)
+        if self._pos > len(self._data):
+            self._data.extend(bytes(self._pos - len(self._data)))
+        self._data[self._pos:end] = data
+        self._pos = end
+        return len(data)
+
+    def readinto(self, target) -> int:
+        if self._file is not None:
+            return self._file.readinto(target)
+        chunk = memoryview(self._data)[self._pos:self._pos + len(target)]
+        size = len(chunk)
+        target[:size] = chunk
+        chunk.release()
+        self._pos += size
+        return size
+
+    def size(self) -> int:
+        if self._file is None:
+            return len(self._data)
+        position = self._file.tell()
+        size = self._file.seek(0, io.SEEK_END)
+        self._file.seek(position)
+        return size
+
+    def view(self) -> memoryview:
+        """Zero-copy Sicht auf das Archiv (nur solange es im Speicher liegt)"""
+        if self._file is not None:
+            raise ValueError("ZipBuffer wurde auf Disk ausgelagert")
+        return memoryview(self._data)
+
+    def payload(self) -> bytearray:
+        """Archiv als bytearray für botocore (ohne Kopie, nur im Speicher)"""
+        if self._file is not None:
+            raise ValueError("ZipBuffer wurde auf Disk ausgelagert")
+        return self._data
+
+    def sha256(self) -> bytes:
+        digest = hashlib.sha256()
+        if self._file is None:
+            digest.update(self.view())
+        else:
+            self._file.seek(0)
+            for chunk in iter(lambda: self._file.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.digest()
+
+    def write_to(self, target: BinaryIO) -> None:
+        """Schreibe das Archiv in eine Datei (ein einziger Durchgang)"""
+        if self._file is None:
+            target.write(self.view())
+        else:
+            self._file.seek(0)
+            for chunk in iter(lambda: self._file.read(CHUNK_SIZE), b""):
+                target.write(chunk)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        super().close()
+
+    def _spill(self) -> None:
+        self._file = tempfile.TemporaryFile()
+        self._file.write(self._data)
+        self._file.seek(self._pos)
+        self._data = bytearray()
@@ -0,0 +1,121 @@
+import base64
+import json
+import os
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional, Union
+
+from src.core.log import get_logger
+from src.packaging.buffer import ZipBuffer
+from src.packaging.optimize import OptimizeOptions, write_optimized
+from src.packaging.package import file_entries, package_files, source_hash
+
+logger = get_logger("packaging")
+
+
+def default_cache_dir() -> Path:
+    """Cache Verzeichnis aus MYZEL_CACHE_DIR, sonst ~/.cache/myzel"""
+    return Path(os.getenv("MYZEL_CACHE_DIR", Path.home() / ".cache" / "myzel")) / "packages"
+
+
+@dataclass
+class PackageEntry:
+    """Gebautes Deployment Package im Cache"""
+    source_hash: str
+    zip_path: Path
+    # Base64 encoded SHA-256 of the zip - the format Lambda reports as CodeSha256
+    code_sha256: str
+    size: int
+
+    @cached_property
+    def zip_bytes(self) -> Union[bytes, bytearray]:
+        """Archiv für Inline-Uploads (freshly built packages keep their in-memory buffer)"""
+        return self.zip_path.read_bytes()
+
+    @property
+    def sha256_hex(self) -> str:
+        return base64.b64decode(self.code_sha256).hex()
+
+
+class PackageCache:
+    """
+    Content-addressed cache for Lambda deployment packages.
+
+    Entries are keyed by source_hash() - a hash over all packaged file names,
+    their contents and the exclude rules - so an unchanged function is never
+    zipped twice, on any run. Each entry stores the zip and its CodeSha256,
+    which lets LambdaFunction skip update_function_code entirely when the
+    deployed code already matches.
+    """
+
+    def __init__(self, directory: Union[str, Path, None] = None):
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+
+    def lookup(self, key: str) -> Optional[PackageEntry]:
+        meta_path = self.directory / f"{key}.json"
+        zip_path = self.directory / f"{key}.zip"
+        if not meta_path.exists() or not zip_path.exists():
+            return None
+        try:
+            with meta_path.open() as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return PackageEntry(source_hash=key, zip_path=zip_path,
+                            code_sha256=meta["code_sha256"], size=meta["size"])
+
+    def package(self, code_path: Path, name: str, optimize: Optional[OptimizeOptions] = None,
+                runtime: str = "python3.13") -> PackageEntry:
+        """Hole das Package für code_path aus dem Cache oder baue es"""
+        files = package_files(code_path)
+        key = source_hash(files, optimize.cache_key(runtime) if optimize is not None else "")
+
+        entry = self.lookup(key)
+        if entry is not None:
+            logger.info(f"Deployment Package aus Cache: {name} ({key[:12]})")
+            return entry
+
+        return self.build(key, name, lambda buffer: write_optimized(
+            buffer, file_entries(files), optimize, runtime, "/var/task/", name))
+
+    def build(self, key: str, name: str, write_archive: Callable[[BinaryIO], None]) -> PackageEntry:
+        """Baue ein Archiv über write_archive und lege es unter key im Cache ab"""
+        # Built in memory (spills to an anonymous temp file only for huge packages)
+        # and written to the cache exactly once
+        buffer = ZipBuffer()
+        try:
+            write_archive(buffer)
+            size = buffer.size()
+            code_sha256 = base64.b64encode(buffer.sha256()).decode()
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            zip_path = self.directory / f"{key}.zip"
+            tmp_path = self.directory / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with tmp_path.open("wb") as f:
+                    buffer.write_to(f)
+                # Atomic rename - concurrent builders of the same key produce the same entry
+                os.replace(tmp_path, zip_path)
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+
+            entry = PackageEntry(source_hash=key, zip_path=zip_path, code_sha256=code_sha256, size=size)
+            if not buffer.spilled:
+                entry.zip_bytes = buffer.payload()
+        finally:
+            buffer.close()
+
+        meta_tmp = self.directory / f"{key}.json.{os.getpid()}.{threading.get_ident()}.tmp"
+        with meta_tmp.open("w") as f:
+            json.dump({"code_sha256": code_sha256, "size": size, "name": name}, f)
+        os.replace(meta_tmp, self.directory / f"{key}.json")
+
+        logger.info(f"Deployment Package erstellt: {name} ({key[:12]}, {size} Bytes)")
+        return entry
+
+
+# Process-wide default cache (MYZEL_CACHE_DIR)
+package_cache = PackageCache()
@@ -0,0 +1,127 @@
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Per-function ignore file, gitignore-style glob rules (see IgnoreRules)
+IGNORE_FILE = ".myzelignore"
+
+# Rules every deployment package starts with; a .myzelignore extends them
+# and can re-include files with "!pattern"
+DEFAULT_IGNORE_RULES = (
+    ".*",
+    "__pycache__/",
+    "*.pyc",
+    "*.pyo",
+    "node_modules/",
+    "test_lambda.py",
+    "README.md",
+    "pyproject.toml",
+    "uv.lock",
+)
+
+
+class IgnoreRules:
+    """
+    Glob rules that decide which files end up in a deployment package.
+
+    Syntax follows .gitignore: "#" comments, "!" negates, a trailing "/"
+    matches directories only, a pattern containing "/" is anchored at the
+    function directory, "*" and "?" stay within one path segment and "**"
+    spans segments. The last matching rule wins.
+
+    All rules are compiled into one regex per kind (files, directories), so
+    a path is checked with a single match call. Ignored directories are
+    pruned during the walk and never descended into.
+    """
+
+    def __init__(self, rules: Iterable[str] = DEFAULT_IGNORE_RULES):
+        self.rules = tuple(line for line in (raw.strip() for raw in rules) if line and not line.startswith("#"))
+        parsed = [_parse(rule) for rule in self.rules]
+        self._dir_negated, self._dir_pattern = _compile(parsed)
+        self._file_negated, self._file_pattern = _compile([rule for rule in parsed if not rule[2]])
+
+    @classmethod
+    def for_directory(cls, code_path: Path) -> "IgnoreRules":
+        """Default Regeln plus die .myzelignore der Function (falls vorhanden)"""
+        ignore_file = code_path / IGNORE_FILE
+        if not ignore_file.is_file():
+            return cls()
+        return cls(DEFAULT_IGNORE_RULES + tuple(ignore_file.read_text(encoding="utf-8").splitlines()))
+
+    def ignored(self, path: str, is_dir: bool = False) -> bool:
+        """Prüfe einen relativen POSIX Pfad"""
+        pattern, negated = (self._dir_pattern, self._dir_negated) if is_dir else \
+            (self._file_pattern, self._file_negated)
+        if pattern is None:
+            return False
+        match = pattern.fullmatch(path)
+        return match is not None and not negated[match.lastindex - 1]
+
+    def walk(self, code_path: Path) -> list[tuple[Path, str]]:
+        """Alle nicht ignorierten Dateien als (Pfad, Archivname), sortiert"""
+        files = []
+        for directory, dirnames, filenames in os.walk(code_path):
+            relative = Path(directory).relative_to(code_path).as_posix()
+            prefix = "" if relative == "." else relative + "/"
+            # Prune in place - os.walk does not descend into removed directories
+            dirnames[:] = [name for name in dirnames if not self.ignored(prefix + name, is_dir=True)]
+            for name in filenames:
+                arcname = prefix + name
+                if not self.ignored(arcname):
+                    files.append((Path(directory) / name, arcname))
+        files.sort(key=lambda item: item[1])
+        return files
+
+    def __repr__(self) -> str:
+        return f"IgnoreRules({list(self.rules)!r})"
+
+
+def _parse(rule: str) -> tuple[str, bool, bool]:
+    """Regel -> (regex, negiert, nur Verzeichnisse)"""
+    negated = rule.startswith("!")
+    rule = rule[1:] if negated else rule
+    directory_only = rule.endswith("/")
+    rule = rule.rstrip("/")
+    anchored = "/" in rule
+    regex = _translate(rule.lstrip("/"))
+    return (regex if anchored else f"(?:.*/)?{regex}"), negated, directory_only
+
+
+def _compile(parsed: list[tuple[str, bool, bool]]) -> tuple[tuple[bool, ...], Optional[re.Pattern]]:
+    # Later rules first: the first matching alternative is the last matching rule,
+    # match.lastindex tells which one it was
+    ordered = parsed[::-1]
+    if not ordered:
+        return (), None
+    pattern = re.compile("|".join(f"({regex})" for regex, _, _ in ordered))
+    return tuple(negated for _, negated, _ in ordered), pattern
+
+
+def _translate(glob: str) -> str:
+    """Glob -> Regex ohne Capturing Groups ("*" bleibt innerhalb eines Segments)"""
+    result, i = [], 0
+    while i < len(glob):
+        char = glob[i]
+        if glob.startswith("**/", i):
+            result.append("(?:.*/)?")
+            i += 3
+            continue
+        if glob.startswith("**", i):
+            result.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            result.append("[^/]*")
+        elif char == "?":
+            result.append("[^/]")
+        elif char == "[" and "]" in glob[i + 2:]:
+            end = glob.index("]", i + 2)
+            body = glob[i + 1:end]
+            result.append(f"[^{body[1:]}]" if body.startswith("!") else f"[{body}]")
+            i = end + 1
+            continue
+        else:
+            result.append(re.escape(char))
+        i += 1
+    return "".join(result)
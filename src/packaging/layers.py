@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import tomllib
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from packaging import tags
+from packaging.utils import canonicalize_name, parse_wheel_filename
+
+from src.core.log import get_logger
+from src.packaging.cache import PackageCache, PackageEntry, package_cache
+from src.packaging.optimize import OptimizeOptions, write_optimized
+from src.packaging.package import python_version
+
+logger = get_logger("packaging")
+
+# Lambda extracts layers to /opt - Python packages live in /opt/python
+LAYER_PREFIX = "python/"
+
+# Bump when the layer layout changes so old cache entries are not reused
+LAYER_FORMAT = "1"
+
+# glibc minor version of the Lambda Python runtimes (Amazon Linux 2023);
+# manylinux wheels up to this version are accepted
+LAMBDA_GLIBC_MINOR = 34
+
+LAMBDA_ARCHITECTURES = {"x86_64": "x86_64", "arm64": "aarch64"}
+
+
+def default_wheel_dir() -> Path:
+    """Lokaler Wheel Cache aus MYZEL_WHEEL_DIR, sonst ~/.cache/myzel/wheels"""
+    return Path(os.getenv("MYZEL_WHEEL_DIR", Path.home() / ".cache" / "myzel" / "wheels"))
+
+
+@dataclass(frozen=True)
+class LockedWheel:
+    """Eine gelockte Abhängigkeit mit der für Lambda passenden Wheel"""
+    name: str
+    version: str
+    filename: str
+    sha256: str
+
+
+def supported_tags(runtime: str, architecture: str) -> list[tags.Tag]:
+    """Wheel Tags, die die Lambda Runtime laden kann (bevorzugte zuerst)"""
+    version = python_version(runtime)
+    machine = LAMBDA_ARCHITECTURES[architecture]
+    platforms = [f"manylinux_2_{minor}_{machine}" for minor in range(LAMBDA_GLIBC_MINOR, 16, -1)]
+    platforms += [f"manylinux2014_{machine}"]
+    if machine == "x86_64":
+        platforms += ["manylinux2010_x86_64", "manylinux1_x86_64"]
+    interpreter = f"cp{version[0]}{version[1]}"
+    return [
+        *tags.cpython_tags(version, abis=[interpreter, "abi3", "none"], platforms=platforms),
+        *tags.compatible_tags(version, interpreter, platforms),
+    ]
+
+
+def locked_wheels(function_dir: Union[str, Path], runtime: str = "python3.13",
+                  architecture: str = "x86_64") -> list[LockedWheel]:
+    """Lese die gelockten Abhängigkeiten einer Function aus uv.lock
+
+    Only third-party packages from a registry are returned - the function's
+    own (editable/virtual) project is skipped. Packages without a wheel for
+    the Lambda platform (e.g. Windows-only dependencies behind a marker)
+    are skipped with a warning.
+    """
+    function_dir = Path(function_dir)
+    lock_file = function_dir / "uv.lock"
+    if not lock_file.exists():
+        pyproject = function_dir / "pyproject.toml"
+        if pyproject.exists():
+            with pyproject.open("rb") as f:
+                dependencies = tomllib.load(f).get("project", {}).get("dependencies", [])
+            if dependencies:
+                raise ValueError(f"{function_dir}: Abhängigkeiten ohne uv.lock - bitte 'uv lock' ausführen")
+        return []
+
+    with lock_file.open("rb") as f:
+        lock = tomllib.load(f)
+
+    priorities = {tag: index for index, tag in enumerate(supported_tags(runtime, architecture))}
+    wheels = []
+    for package in lock.get("package", []):
+        if "registry" not in package.get("source", {}):
+            continue
+
+        best = None
+        for wheel in package.get("wheels", []):
+            filename = wheel["url"].rsplit("/", 1)[-1]
+            _, _, _, wheel_tags = parse_wheel_filename(filename)
+            priority = min((priorities[tag] for tag in wheel_tags if tag in priorities), default=None)
+            if priority is not None and (best is None or priority < best[0]):
+                best = (priority, filename, wheel["hash"].removeprefix("sha256:"))
+
+        if best is None:
+            logger.warning(f"Warnung: keine Wheel für {runtime}/{architecture}: "
+                           f"{package['name']} {package['version']}, übersprungen")
+            continue
+        wheels.append(LockedWheel(canonicalize_name(package["name"]), package["version"], best[1], best[2]))
+    return wheels
+
+
+def lock_hash(wheels: Iterable[LockedWheel], runtime: str, architecture: str,
+              optimize: Optional[OptimizeOptions] = None) -> str:
+    """Hash über das Lock-Set - identische Abhängigkeiten (und Optimierung) ergeben denselben Layer"""
+    payload = {
+        "format": LAYER_FORMAT,
+        "runtime": runtime,
+        "architecture": architecture,
+        "wheels": sorted((w.name, w.version, w.sha256) for w in wheels),
+    }
+    if optimize is not None:
+        # Only optimized layers carry the key - hashes of plain layers stay as published
+        payload["optimize"] = optimize.cache_key(runtime)
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def merge_locks(function_dirs: Iterable[Union[str, Path]], runtime: str = "python3.13",
+                architecture: str = "x86_64") -> list[LockedWheel]:
+    """Vereinige die Locks mehrerer Functions (Versionskonflikte sind ein Fehler)"""
+    merged: dict[str, LockedWheel] = {}
+    for function_dir in function_dirs:
+        for wheel in locked_wheels(function_dir, runtime, architecture):
+            existing = merged.get(wheel.name)
+            if existing is not None and existing.version != wheel.version:
+                raise ValueError(f"Versionskonflikt für {wheel.name}: {existing.version} vs. {wheel.version} "
+                                 f"({function_dir})")
+            merged[wheel.name] = wheel
+    return sorted(merged.values(), key=lambda w: w.name)
+
+
+def group_by_lock(root: Union[str, Path], runtime: str = "python3.13",
+                  architecture: str = "x86_64") -> dict[str, list[Path]]:
+    """Gruppiere functions/*/ nach Lock-Hash (Functions ohne Abhängigkeiten fehlen)"""
+    groups: dict[str, list[Path]] = {}
+    for pyproject in sorted(Path(root).glob("*/pyproject.toml")):
+        wheels = locked_wheels(pyproject.parent, runtime, architecture)
+        if wheels:
+            groups.setdefault(lock_hash(wheels, runtime, architecture), []).append(pyproject.parent)
+    return groups
+
+
+class LayerBuilder:
+    """
+    Builds a Lambda layer zip from locked dependencies - offline.
+
+    Wheels are taken from a local wheel directory (fill it e.g. with
+    `pip download --only-binary=:all: --platform manylinux2014_x86_64
+    --python-version 3.13 -d ~/.cache/myzel/wheels -r requirements.txt`),
+    verified against the hashes in uv.lock and unpacked below python/.
+    Layers are cached per lock hash, so identical lock sets are built once.
+    """
+
+    def __init__(self, wheel_dir: Union[str, Path, None] = None, cache: Optional[PackageCache] = None):
+        self.wheel_dir = Path(wheel_dir) if wheel_dir is not None else default_wheel_dir()
+        self.cache = cache or package_cache
+
+    def build(self, wheels: list[LockedWheel], runtime: str, architecture: str, name: str,
+              optimize: Optional[OptimizeOptions] = None) -> PackageEntry:
+        key = f"layer-{lock_hash(wheels, runtime, architecture, optimize)}"
+        entry = self.cache.lookup(key)
+        if entry is not None:
+            logger.info(f"Layer aus Cache: {name} ({key[6:18]})")
+            return entry
+
+        paths = [self._wheel_path(wheel) for wheel in wheels]
+        return self.cache.build(key, name, lambda buffer: write_optimized(
+            buffer, self._entries(paths), optimize, runtime, "/opt/", name))
+
+    def _wheel_path(self, wheel: LockedWheel) -> Path:
+        path = self.wheel_dir / wheel.filename
+        if not path.exists():
+            raise FileNotFoundError(
+                f"Wheel nicht im lokalen Cache: {path} ({wheel.name} {wheel.version}) - "
+                f"bitte vorab herunterladen (MYZEL_WHEEL_DIR)"
+            )
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        if digest != wheel.sha256:
+            raise ValueError(f"Hash von {path.name} passt nicht zu uv.lock ({digest} != {wheel.sha256})")
+        return path
+
+    @staticmethod
+    def _entries(paths: list[Path]) -> list[tuple[str, bytes, bool]]:
+        entries: dict[str, tuple[str, bytes, bool]] = {}
+        for path in paths:
+            with zipfile.ZipFile(path) as wheel:
+                for info in wheel.infolist():
+                    if info.is_dir():
+                        continue
+                    target = _install_path(info.filename)
+                    if target is None:
+                        continue
+                    executable = bool((info.external_attr >> 16) & 0o100)
+                    arcname = LAYER_PREFIX + target
+                    entries[arcname] = (arcname, wheel.read(info), executable)
+        return [entries[arcname] for arcname in sorted(entries)]
+
+
+def _install_path(filename: str) -> Optional[str]:
+    """Pfad einer Wheel-Datei in site-packages (None für scripts/headers/data)"""
+    top, _, rest = filename.partition("/")
+    if top.endswith(".data"):
+        scheme, _, path = rest.partition("/")
+        return path if scheme in ("purelib", "platlib") and path else None
+    return filename
@@ -0,0 +1,159 @@
+import base64
+import fnmatch
+import importlib.util
+import json
+import marshal
+import shutil
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+from src.core.log import format_bytes, get_logger
+from src.packaging.buffer import ZipBuffer
+from src.packaging.package import python_version, write_archive
+
+logger = get_logger("packaging")
+
+# Files vendored packages ship that are never needed at runtime. A pattern
+# ending in "/" matches a directory name anywhere in the path, every other
+# pattern is matched against the file name.
+DEFAULT_STRIP_PATTERNS = (
+    "tests/", "test/", "testing/", "docs/", "doc/", "examples/", "benchmarks/",
+    "*.pyi", "*.pyx", "*.pxd", "*.c", "*.h", "*.cpp", "*.md", "*.rst",
+)
+
+# pyc flags: hash-based, unchecked - valid regardless of the extracted mtimes
+_UNCHECKED_HASH_FLAGS = (0b01).to_bytes(4, "little")
+
+_COMPILE_SCRIPT = """
+import base64, importlib.util, json, marshal, sys
+result = {}
+for arcname, filename, source in json.load(sys.stdin):
+    source = base64.b64decode(source)
+    try:
+        code = compile(source, filename, "exec", dont_inherit=True)
+    except SyntaxError:
+        continue
+    data = (importlib.util.MAGIC_NUMBER + (1).to_bytes(4, "little")
+            + importlib.util.source_hash(source) + marshal.dumps(code))
+    result[arcname] = base64.b64encode(data).decode()
+json.dump(result, sys.stdout)
+"""
+
+
+@dataclass(frozen=True)
+class OptimizeOptions:
+    """
+    Opt-in optimization of deployment packages.
+
+    Args:
+        precompile: Add __pycache__/*.pyc for the target runtime (needs a
+            matching interpreter - the current one or pythonX.Y on PATH)
+        strip: Patterns of non-runtime files to drop (see DEFAULT_STRIP_PATTERNS)
+    """
+    precompile: bool = True
+    strip: tuple[str, ...] = DEFAULT_STRIP_PATTERNS
+
+    def cache_key(self, runtime: str) -> str:
+        return repr((self.precompile, runtime if self.precompile else None, self.strip))
+
+
+def optimize_entries(
+    entries: list[tuple[str, bytes, bool]],
+    options: OptimizeOptions,
+    runtime: str,
+    root: str,
+    name: str
+) -> list[tuple[str, bytes, bool]]:
+    """Entferne nicht benötigte Dateien und füge vorkompilierten Bytecode hinzu
+
+    Args:
+        entries: Sorted (archive name, content, executable) entries
+        root: Extraction directory on Lambda (/var/task/ or /opt/), used for tracebacks
+    """
+    kept = [entry for entry in entries if not _stripped(entry[0], options.strip)]
+    if len(kept) < len(entries):
+        logger.info(f"{name}: {len(entries) - len(kept)} nicht benötigte Dateien entfernt")
+
+    if options.precompile:
+        compiled = _precompile([entry for entry in kept if entry[0].endswith(".py")], runtime, root, name)
+        kept.extend(compiled)
+        kept.sort(key=lambda entry: entry[0])
+    return kept
+
+
+def write_optimized(target, entries, options: Optional[OptimizeOptions], runtime: str, root: str, name: str) -> None:
+    """Schreibe ein (optional optimiertes) Archiv und berichte die Größe vorher/nachher"""
+    if options is None:
+        write_archive(target, entries, name)
+        return
+
+    entries = list(entries)
+    with ZipBuffer() as plain:
+        write_archive(plain, entries, f"{name} (unoptimiert)")
+        size_before = plain.size()
+    start = target.tell()
+    write_archive(target, optimize_entries(entries, options, runtime, root, name), name)
+    size_after = target.tell() - start
+    logger.info(
+        f"{name}: Package optimiert {format_bytes(size_before)} → {format_bytes(size_after)}",
+        extra={"resource": name, "size_before": size_before, "size_after": size_after}
+    )
+
+
+def _stripped(arcname: str, patterns: tuple[str, ...]) -> bool:
+    parts = arcname.split("/")
+    for pattern in patterns:
+        if pattern.endswith("/"):
+            if pattern[:-1] in parts[:-1]:
+                return True
+        elif fnmatch.fnmatchcase(parts[-1], pattern):
+            return True
+    return False
+
+
+def _pyc_path(arcname: str, tag: str) -> str:
+    directory, _, filename = arcname.rpartition("/")
+    prefix = f"{directory}/" if directory else ""
+    return f"{prefix}__pycache__/{filename[:-3]}.{tag}.pyc"
+
+
+def _precompile(sources: list[tuple[str, bytes, bool]], runtime: str, root: str, name: str) -> list:
+    version = python_version(runtime)
+    tag = f"cpython-{version[0]}{version[1]}"
+
+    if sys.version_info[:2] == version:
+        compiled = {}
+        for arcname, source, _ in sources:
+            try:
+                code = compile(source, root + arcname, "exec", dont_inherit=True)
+            except SyntaxError:
+                continue
+            compiled[arcname] = (importlib.util.MAGIC_NUMBER + _UNCHECKED_HASH_FLAGS
+                                 + importlib.util.source_hash(source) + marshal.dumps(code))
+    else:
+        compiled = _compile_external(sources, version, root, name)
+        if compiled is None:
+            return []
+
+    logger.info(f"{name}: {len(compiled)} Module für {runtime} vorkompiliert")
+    return [(_pyc_path(arcname, tag), data, False) for arcname, data in compiled.items()]
+
+
+def _compile_external(sources, version: tuple[int, int], root: str, name: str) -> Optional[dict]:
+    """Kompiliere mit einem passenden Interpreter (pythonX.Y auf dem PATH)"""
+    interpreter = shutil.which(f"python{version[0]}.{version[1]}")
+    payload = json.dumps([
+        (arcname, root + arcname, base64.b64encode(source).decode()) for arcname, source, _ in sources
+    ])
+    if interpreter is not None:
+        try:
+            result = subprocess.run([interpreter, "-c", _COMPILE_SCRIPT], input=payload,
+                                    capture_output=True, text=True, check=True)
+            return {arcname: base64.b64decode(data) for arcname, data in json.loads(result.stdout).items()}
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            pass
+    logger.warning(f"Warnung: {name}: kein Python {version[0]}.{version[1]} Interpreter gefunden, "
+                   f"Bytecode wird nicht vorkompiliert")
+    return None
@@ -0,0 +1,114 @@
+import hashlib
+import importlib.util
+import stat
+import sys
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional
+
+from src.core.log import ProgressCounter, get_logger
+from src.packaging.ignore import IgnoreRules
+
+logger = get_logger("packaging")
+
+# Bump when the zip layout changes so old cache entries are not reused
+PACKAGE_FORMAT = "2"
+
+# Deterministic archives: every entry gets the same timestamp, normalized
+# permissions and the same compression level, independent of the machine
+ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+ZIP_COMPRESSION_LEVEL = 6
+FILE_MODE = 0o644
+EXECUTABLE_MODE = 0o755
+
+# Helpers shipped with every directory package: archive name -> source
+RUNTIME_FILES = {
+    "myzel_warmer.py": Path(__file__).with_name("warmer_runtime.py"),
+}
+
+
+def python_version(runtime: str) -> tuple[int, int]:
+    """'python3.13' -> (3, 13)"""
+    major, minor = runtime.removeprefix("python").split(".")[:2]
+    return int(major), int(minor)
+
+
+def collect_files(code_path: Path, rules: Optional[IgnoreRules] = None) -> list[tuple[Path, str]]:
+    """Sammle alle Dateien eines Deployment Packages
+
+    Args:
+        rules: Ignore-Regeln (Default: DEFAULT_IGNORE_RULES plus .myzelignore der Function)
+
+    Returns:
+        (file path, archive name) pairs, sorted by archive name
+    """
+    if not code_path.exists():
+        raise FileNotFoundError(f"Code Pfad existiert nicht: {code_path}")
+
+    if code_path.is_file():
+        return [(code_path, code_path.name)]
+
+    return (rules or IgnoreRules.for_directory(code_path)).walk(code_path)
+
+
+def package_files(code_path: Path) -> list[tuple[Path, str]]:
+    """collect_files plus die mitgelieferten Runtime Helper (RUNTIME_FILES)"""
+    files = collect_files(code_path)
+    if code_path.is_dir():
+        present = {arcname for _, arcname in files}
+        files = files + [(path, arcname) for arcname, path in RUNTIME_FILES.items() if arcname not in present]
+    return sorted(files, key=lambda item: item[1])
+
+
+def install_runtime_modules() -> None:
+    """Mache die Runtime Helper lokal unter ihrem Package-Namen importierbar (z.B. myzel_warmer)"""
+    for arcname, path in RUNTIME_FILES.items():
+        name = arcname.removesuffix(".py")
+        if name in sys.modules:
+            continue
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules[name] = module
+
+
+def source_hash(files: list[tuple[Path, str]], options: str = "") -> str:
+    """Hash über Archivnamen und Inhalte aller Dateien (plus Build-Optionen)"""
+    digest = hashlib.sha256((PACKAGE_FORMAT + options).encode())
+    for file_path, arcname in sorted(files, key=lambda item: item[1]):
+        digest.update(arcname.encode())
+        digest.update(b"\0x" if _is_executable(file_path) else b"\0")
+        digest.update(hashlib.sha256(file_path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def file_entries(files: list[tuple[Path, str]]) -> Iterable[tuple[str, bytes, bool]]:
+    """(Archivname, Inhalt, ausführbar) Einträge sortiert nach Archivname"""
+    for file_path, arcname in sorted(files, key=lambda item: item[1]):
+        yield arcname, file_path.read_bytes(), _is_executable(file_path)
+
+
+def write_archive(target: BinaryIO, entries: Iterable[tuple[str, bytes, bool]], name: str) -> None:
+    """Schreibe (Archivname, Inhalt, ausführbar) Einträge reproduzierbar in ein ZIP
+
+    Entries must already be sorted by archive name.
+    """
+    with zipfile.ZipFile(target, 'w') as zipf, \
+            ProgressCounter(logger, name, "Dateien gepackt") as progress:
+        for arcname, data, executable in entries:
+            zipf.writestr(_zip_info(arcname, executable), data,
+                          compress_type=zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSION_LEVEL)
+            progress.add(arcname, len(data))
+
+
+def _zip_info(arcname: str, executable: bool) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(arcname, date_time=ZIP_TIMESTAMP)
+    mode = EXECUTABLE_MODE if executable else FILE_MODE
+    info.external_attr = (stat.S_IFREG | mode) << 16
+    # Unix - ZipInfo would otherwise record the building platform
+    info.create_system = 3
+    return info
+
+
+def _is_executable(file_path: Path) -> bool:
+    return bool(file_path.stat().st_mode & stat.S_IXUSR)
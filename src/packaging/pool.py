@@ -0,0 +1,122 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Union
+
+from src.core.log import get_logger
+from src.packaging.cache import PackageCache, PackageEntry, package_cache
+from src.packaging.optimize import OptimizeOptions
+from src.packaging.package import package_files, source_hash
+
+logger = get_logger("packaging")
+
+
+def _build_package(code_path: str, name: str, cache_dir: str,
+                   optimize: Optional[OptimizeOptions], runtime: str) -> PackageEntry:
+    """Worker: baue ein Package in den gemeinsamen Cache"""
+    entry = PackageCache(cache_dir).package(Path(code_path), name, optimize, runtime)
+    # The parent reads the zip from the cache file - don't pickle it back
+    entry.__dict__.pop('zip_bytes', None)
+    return entry
+
+
+def _variant(optimize: Optional[OptimizeOptions], runtime: str) -> str:
+    """Build Variante eines Code-Pfads (ohne optimize ist das Package für jede Runtime gleich)"""
+    return optimize.cache_key(runtime) if optimize is not None else ""
+
+
+class PackagePool:
+    """
+    Builds deployment packages ahead of time on a process pool.
+
+    Deflate compression is CPU-bound, so packages of all functions are
+    submitted up front and built in parallel (one worker per CPU) while the
+    deployment is busy with other resources. Packages already in the cache
+    are skipped, identical sources are built once. LambdaFunction picks up
+    the result for its code_path instead of packaging inline.
+    """
+
+    def __init__(self, cache: Optional[PackageCache] = None, max_workers: Optional[int] = None):
+        self.cache = cache or package_cache
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.skipped = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # (resolved path, variant) - the same directory may be built optimized and plain
+        self._futures: dict[tuple[Path, str], Future] = {}
+        self._by_key: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def prepackage(self, *sources) -> None:
+        """Starte den Build für Code-Pfade oder Resources mit code_path"""
+        for source in sources:
+            if isinstance(source, (str, Path)):
+                self.submit(Path(source), Path(source).name)
+            elif getattr(source, 'code_path', None) and getattr(source, 'function_name', None):
+                self.submit(source.code_path, source.function_name,
+                            getattr(source, 'optimize', None), getattr(source, 'runtime', "python3.13"))
+
+    def submit(self, code_path: Union[str, Path], name: str, optimize: Optional[OptimizeOptions] = None,
+               runtime: str = "python3.13") -> Future:
+        path = Path(code_path).resolve()
+        variant = _variant(optimize, runtime)
+        with self._lock:
+            if (path, variant) in self._futures:
+                return self._futures[path, variant]
+
+            key = source_hash(package_files(path), variant)
+            # Identical sources share the build - even if it finished in the meantime
+            if key in self._by_key:
+                future = self._by_key[key]
+            elif (entry := self.cache.lookup(key)) is not None:
+                future = Future()
+                future.set_result(entry)
+                self.skipped += 1
+            else:
+                future = self._pool().submit(_build_package, str(path), name, str(self.cache.directory),
+                                             optimize, runtime)
+                self._by_key[key] = future
+            self._futures[path, variant] = future
+            return future
+
+    def result(self, code_path: Union[str, Path], optimize: Optional[OptimizeOptions] = None,
+               runtime: str = "python3.13") -> Optional[PackageEntry]:
+        """Package für code_path in dieser Variante, falls es vorab gebaut wurde (wartet auf den Worker)"""
+        future = self._futures.get((Path(code_path).resolve(), _variant(optimize, runtime)))
+        return future.result() if future is not None else None
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._by_key:
+            logger.info(f"Packaging: {len(self._by_key)} Packages gebaut, {self.skipped} aus Cache")
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # fork: spawn would re-run the (unguarded) deployment script in every worker
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if "fork" in methods else None)
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+        return self._executor
+
+    def __enter__(self) -> "PackagePool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.shutdown()
+        return False
+
+
+# Pool of the currently running deployment (None outside of a deployment)
+_active: Optional[PackagePool] = None
+
+
+def activate(pool: Optional[PackagePool]) -> None:
+    global _active
+    _active = pool
+
+
+def active() -> Optional[PackagePool]:
+    return _active
@@ -0,0 +1,147 @@
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Optional, Union
+
+from src.core.log import get_logger
+from src.packaging.package import RUNTIME_FILES, collect_files, source_hash
+
+logger = get_logger("packaging")
+
+ROUTER_MODULE = "myzel_router"
+ROUTES_FILE = "myzel_routes.json"
+
+HTTP_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS", "ANY")
+
+
+def default_build_root() -> Path:
+    """Build Verzeichnis aus MYZEL_CACHE_DIR, sonst ~/.cache/myzel"""
+    return Path(os.getenv("MYZEL_CACHE_DIR", Path.home() / ".cache" / "myzel")) / "routers"
+
+
+class Router:
+    """
+    Consolidated deployment of several function directories as one function.
+
+    build() copies every function directory (with its .myzelignore rules)
+    into one bundle next to a router handler (router_runtime.py) and the
+    route table. The router imports all handlers during init and dispatches
+    on the routeKey of API Gateway payload 2.0 events. Events without a
+    matching routeKey, e.g. from a function URL, are matched by method and
+    path. All routes share one warm pool instead of one per function.
+    Sibling modules share one sys.path, so build() rejects a module name
+    that two directories ship with different content.
+
+    The bundle is an ordinary code_path for LambdaFunction (package cache,
+    PackagePool and optimize work as usual); api_routes() generates the
+    matching ApiGateway routes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        routes: dict[str, Union[str, Path]],
+        handler: str = "lambda_function.lambda_handler",
+        build_root: Union[str, Path, None] = None
+    ):
+        """
+        Args:
+            name: Name des Bundles (z.B. der Function Name)
+            routes: routeKey -> Function Verzeichnis, z.B.
+                {"GET /api/todos": "./functions/todo_list",
+                 "PUT /api/todos/{id}/update": "./functions/todo_update"}
+            handler: Handler in jedem Function Verzeichnis
+            build_root: Basis für das Bundle (Default: MYZEL_CACHE_DIR/routers)
+        """
+        directories = {}
+        for route_key, code_path in routes.items():
+            method, _, path = route_key.partition(" ")
+            if method not in HTTP_METHODS or not path.startswith("/"):
+                raise ValueError(f"Router {name}: ungültiger routeKey {route_key!r} (erwartet 'GET /pfad')")
+            code_path = Path(code_path)
+            other = directories.setdefault(code_path.name, code_path)
+            if other.resolve() != code_path.resolve():
+                raise ValueError(f"Router {name}: Verzeichnisname {code_path.name} doppelt ({other}, {code_path})")
+
+        self.name = name
+        self.routes = {route_key: Path(code_path) for route_key, code_path in routes.items()}
+        self.function_handler = handler
+        self.build_root = Path(build_root) if build_root is not None else default_build_root()
+
+    @property
+    def code_path(self) -> Path:
+        return self.build_root / self.name
+
+    @property
+    def handler(self) -> str:
+        """Handler der gebündelten Function"""
+        return f"{ROUTER_MODULE}.lambda_handler"
+
+    def build(self) -> Path:
+        """Baue das Bundle neu (deterministisch - unveränderte Quellen ergeben den gleichen Package Hash)"""
+        target = self.code_path
+        if target.exists():
+            shutil.rmtree(target)
+        target.mkdir(parents=True)
+
+        directories = {code_path.name: code_path for code_path in self.routes.values()}
+        files = {directory: collect_files(code_path) for directory, code_path in directories.items()}
+        self._check_modules(files)
+        for directory, code_path in sorted(directories.items()):
+            for file_path, arcname in files[directory]:
+                destination = target / directory / arcname
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(file_path, destination)
+                shutil.copymode(file_path, destination)
+
+        shutil.copyfile(Path(__file__).with_name("router_runtime.py"), target / f"{ROUTER_MODULE}.py")
+        for arcname, source in RUNTIME_FILES.items():
+            shutil.copyfile(source, target / arcname)
+        config = {
+            "handler": self.function_handler,
+            "routes": {route_key: code_path.name for route_key, code_path in sorted(self.routes.items())},
+        }
+        (target / ROUTES_FILE).write_text(json.dumps(config, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+        logger.info(f"Router {self.name}: {len(self.routes)} Routes aus {len(directories)} Functions → {target}")
+        return target
+
+    def _check_modules(self, files: dict[str, list]) -> None:
+        """
+        All directories share sys.path and sys.modules at runtime: a top-level
+        module (or package) name in two directories resolves to the first
+        copy for every handler. Identical copies are fine, different ones
+        are an error. The handler modules are loaded under unique names.
+        """
+        handler_module = self.function_handler.rsplit(".", 1)[0].split(".")[0]
+        modules: dict[str, tuple[str, str]] = {}
+        for directory, directory_files in sorted(files.items()):
+            by_module: dict[str, list] = {}
+            for file_path, arcname in directory_files:
+                top, _, rest = arcname.partition("/")
+                if rest or top.endswith(".py"):
+                    by_module.setdefault(top.removesuffix(".py"), []).append((file_path, arcname))
+            by_module.pop(handler_module, None)
+            for module, module_files in by_module.items():
+                digest = source_hash(module_files)
+                other = modules.setdefault(module, (directory, digest))
+                if other[1] != digest:
+                    raise ValueError(f"Router {self.name}: Modul {module} in {other[0]} und {directory} "
+                                     f"unterschiedlich - im Bundle würde für beide {other[0]}/{module} geladen")
+
+    def api_routes(self, lambda_arn: str, lambda_name: str, alias: Optional[str] = None) -> dict:
+        """Route Config für ApiGateway - alle Routes auf die gebündelte Function"""
+        routes = {}
+        for route_key in self.routes:
+            method, path = route_key.split(" ", 1)
+            if path in routes:
+                # ApiGateway routes are keyed by path: one method per path
+                raise ValueError(f"Router {self.name}: mehrere Methoden für {path} - nicht als ApiGateway Route")
+            routes[path] = {"method": method, "lambda_arn": lambda_arn, "lambda_name": lambda_name}
+            if alias:
+                routes[path]["alias"] = alias
+        return routes
+
+    def __repr__(self) -> str:
+        return f"Router(name='{self.name}', routes={len(self.routes)})"
@@ -0,0 +1,79 @@
+"""
+Router handler of a consolidated function (see src/packaging/router.py).
+
+Shipped as myzel_router.py next to the bundled function directories and
+myzel_routes.json. Standalone on purpose - only the standard library is
+available at runtime.
+"""
+import importlib.util
+import json
+import os
+import re
+import sys
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+with open(os.path.join(_ROOT, "myzel_routes.json"), encoding="utf-8") as _f:
+    _CONFIG = json.load(_f)
+
+ROUTES: dict = _CONFIG["routes"]
+_MODULE, _FUNCTION = _CONFIG["handler"].rsplit(".", 1)
+_DIRECTORIES = sorted(set(ROUTES.values()))
+
+# Sibling modules of the handlers stay importable, also lazily; the bundle root
+# (myzel_warmer.py) is on sys.path in Lambda already, added for local runs
+sys.path[:0] = [os.path.join(_ROOT, directory) for directory in _DIRECTORIES]
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from myzel_warmer import skip_warmer  # noqa: E402
+
+
+def _load(directory: str):
+    # Unique module name per directory - every handler file is called lambda_function.py
+    spec = importlib.util.spec_from_file_location(
+        f"myzel_route_{directory}", os.path.join(_ROOT, directory, f"{_MODULE}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, _FUNCTION)
+
+
+def _pattern(route_key: str):
+    method, path = route_key.split(" ", 1)
+    regex = re.sub(r"\{(\w+)\+\}", r"(?P<\1>.+)", path)
+    regex = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", regex)
+    return method, re.compile(f"^{regex}$")
+
+
+# All handlers are imported during init: one cold start warms every route
+_HANDLERS = {directory: _load(directory) for directory in _DIRECTORIES}
+_PATTERNS = [(*_pattern(route_key), directory) for route_key, directory in ROUTES.items()]
+
+
+def _resolve(event: dict):
+    """Handler und Pfad-Parameter: routeKey (API Gateway) oder Methode + Pfad (Function URL)"""
+    directory = ROUTES.get(event.get("routeKey"))
+    if directory is not None:
+        return _HANDLERS[directory], None
+
+    http = event.get("requestContext", {}).get("http", {})
+    method, path = http.get("method", ""), event.get("rawPath") or http.get("path", "")
+    for route_method, regex, directory in _PATTERNS:
+        match = regex.match(path)
+        if match and route_method in (method, "ANY"):
+            return _HANDLERS[directory], match.groupdict()
+    return None, None
+
+
+@skip_warmer
+def lambda_handler(event, context):
+    handler, path_parameters = _resolve(event)
+    if handler is None:
+        return {
+            'statusCode': 404,
+            'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps({'error': f"Keine Route für {event.get('routeKey') or event.get('rawPath')}"})
+        }
+    if path_parameters:
+        event = {**event, "pathParameters": {**(event.get("pathParameters") or {}), **path_parameters}}
+    return handler(event, context)
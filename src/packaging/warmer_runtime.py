@@ -0,0 +1,33 @@
+"""
+Warmer helper shipped with every function package (see src/packaging/package.py).
+
+Packaged as myzel_warmer.py, handlers use it via
+`from myzel_warmer import skip_warmer`. Standalone on purpose - only the
+standard library is available at runtime. WARMER_MARKER is declared here
+once; src.resources.schedule_rule imports it for the warmer targets.
+"""
+import functools
+import time
+
+WARMER_MARKER = "myzel-warmer"
+
+
+def is_warmer_event(event) -> bool:
+    return isinstance(event, dict) and WARMER_MARKER in event
+
+
+def skip_warmer(handler):
+    """
+    Answers warmer events (LambdaFunction(warmer=WarmerConfig(...))) before
+    the handler runs - no DynamoDB call, no business logic. The invocation
+    stays busy for delay_ms, so the parallel warmer events of one schedule
+    each need their own execution environment.
+    """
+    @functools.wraps(handler)
+    def wrapper(event, context):
+        if is_warmer_event(event):
+            time.sleep(event[WARMER_MARKER].get("delay_ms", 100) / 1000)
+            return {"warmed": True}
+        return handler(event, context)
+
+    return wrapper
@@ -1,16 +1,22 @@
 import json
 import time
 
-import boto3
-
-from src.model import AwsEnviroment, Resources
+from src.core.log import get_logger
+from src.core.session import create_session
+from src.model import AwsEnviroment, Resources, lazy_field
 from src.model.registry import register_resource
 
+logger = get_logger("api_gateway")
+
 
 @register_resource("api_gateway")
 class ApiGateway(Resources):
     """API Gateway Resource für AWS API Gateway Management"""
 
+    _diff_fields = ('api_name', 'description', 'routes')
+
+    routes = lazy_field()
+
     def __init__(
         self,
         api_name: str,
@@ -26,14 +32,17 @@ class ApiGateway(Resources):
                     "/hello": {
                         "method": "GET",
                         "lambda_arn": "arn:aws:lambda:...",
-                        "lambda_name": "hallo-welt"
+                        "lambda_name": "hallo-welt",
+                        "alias": "live"  # optional, Route ruft den Alias auf
                     }
                 }
+                Statt "alias" kann lambda_arn auch direkt die Alias ARN sein
+                (LambdaFunction.get_alias_arn()).
             env: AWS Environment
             description: API Beschreibung
         """
         self.api_name = api_name
-        self.routes = routes
+        self.routes = {route_path: _split_alias(config) for route_path, config in routes.items()}
         self.env = env
         self.description = description
 
@@ -41,37 +50,36 @@ class ApiGateway(Resources):
     def get(cls, tech_id: str, env: AwsEnviroment) -> 'ApiGateway':
         """Hole ein spezifisches API Gateway"""
         api_id = cls._extract_api_id(tech_id)
-        session = boto3.session.Session(
-            profile_name=env.profile,
-            region_name=env.region
-        )
+        session = create_session(env)
         apigateway_client = session.client('apigatewayv2')
 
         try:
             response = apigateway_client.get_api(ApiId=api_id)
 
-            return cls(
+            api_gateway = cls(
                 api_name=response['Name'],
                 routes={},
                 env=env,
                 description=response.get('Description', '')
             )
+            # The route table is only fetched when the diff compares it
+            api_gateway.defer('routes', lambda: cls._fetch_routes(apigateway_client, api_id))
+            return api_gateway
         except apigateway_client.exceptions.NotFoundException:
-            return cls(
+            api_gateway = cls(
                 api_name="",
                 routes={},
                 env=env
             )
+            api_gateway._missing = True
+            return api_gateway
         except Exception as e:
-            print(f"Fehler beim Abrufen des API Gateway {api_id}: {e}")
+            logger.error(f"Fehler beim Abrufen des API Gateway {api_id}: {e}")
             raise
 
     def create(self) -> str:
         """Erstelle ein neues API Gateway oder verwende existierendes"""
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         apigateway_client = session.client('apigatewayv2')
         lambda_client = session.client('lambda')
 
@@ -84,19 +92,19 @@ class ApiGateway(Resources):
                     break
 
             if existing_api:
-                print(f"API Gateway existiert bereits: {self.api_name}")
+                logger.info(f"API Gateway existiert bereits: {self.api_name}")
                 api_id = existing_api['ApiId']
 
                 # Lösche existierende Routes und Integrationen
                 existing_routes = apigateway_client.get_routes(ApiId=api_id)
                 for route in existing_routes['Items']:
                     apigateway_client.delete_route(ApiId=api_id, RouteId=route['RouteId'])
-                    print(f"  Route gelöscht: {route['RouteKey']}")
+                    logger.info(f"  Route gelöscht: {route['RouteKey']}")
 
                 existing_integrations = apigateway_client.get_integrations(ApiId=api_id)
                 for integration in existing_integrations['Items']:
                     apigateway_client.delete_integration(ApiId=api_id, IntegrationId=integration['IntegrationId'])
-                    print(f"  Integration gelöscht")
+                    logger.info(f"  Integration gelöscht")
             else:
                 api_config = {
                     'Name': self.api_name,
@@ -107,38 +115,63 @@ class ApiGateway(Resources):
 
                 response = apigateway_client.create_api(**api_config)
                 api_id = response['ApiId']
-                print(f"API Gateway erstellt: {self.api_name}")
-                print(f"API ID: {api_id}")
+                logger.info(f"API Gateway erstellt: {self.api_name}")
+                logger.info(f"API ID: {api_id}")
 
             self._setup_routes(apigateway_client, lambda_client, api_id)
 
             stage_name = '$default'
             try:
                 apigateway_client.get_stage(ApiId=api_id, StageName=stage_name)
-                print(f"Stage existiert bereits: {stage_name}")
+                logger.info(f"Stage existiert bereits: {stage_name}")
             except apigateway_client.exceptions.NotFoundException:
                 apigateway_client.create_stage(
                     ApiId=api_id,
                     StageName=stage_name,
                     AutoDeploy=True
                 )
-                print(f"Stage erstellt: {stage_name}")
+                logger.info(f"Stage erstellt: {stage_name}")
 
             api_endpoint = f"https://{api_id}.execute-api.{self.env.region}.amazonaws.com"
-            print(f"API Endpoint: {api_endpoint}")
+            logger.info(f"API Endpoint: {api_endpoint}")
 
             return api_endpoint
 
         except Exception as e:
-            print(f"Fehler beim Erstellen des API Gateway: {e}")
+            logger.error(f"Fehler beim Erstellen des API Gateway: {e}")
             raise
 
+    @staticmethod
+    def _fetch_routes(apigateway_client, api_id: str) -> dict:
+        """Baue die Route Config (gleiches Format wie im Konstruktor) aus Routes und Integrationen"""
+        integrations = {
+            integration['IntegrationId']: integration
+            for integration in apigateway_client.get_integrations(ApiId=api_id)['Items']
+        }
+
+        routes = {}
+        for route in apigateway_client.get_routes(ApiId=api_id)['Items']:
+            method, route_path = route['RouteKey'].split(' ', 1)
+            integration_id = route.get('Target', '').split('/')[-1]
+            lambda_arn = integrations.get(integration_id, {}).get('IntegrationUri', '')
+            arn_parts = lambda_arn.split(':')
+            routes[route_path] = _split_alias({
+                'method': method,
+                'lambda_arn': lambda_arn,
+                'lambda_name': arn_parts[6] if len(arn_parts) > 6 else ''
+            })
+        return routes
+
     def _setup_routes(self, apigateway_client, lambda_client, api_id):
         """Setup Routes und Integrationen"""
         for route_path, route_config in self.routes.items():
             method = route_config.get('method', 'GET')
             lambda_arn = route_config['lambda_arn']
             lambda_name = route_config['lambda_name']
+            alias = route_config.get('alias')
+            if alias:
+                # The alias ARN - provisioned concurrency on the alias avoids cold starts
+                lambda_arn = f"{lambda_arn}:{alias}"
 
             integration_response = apigateway_client.create_integration(
                 ApiId=api_id,
@@ -147,7 +180,7 @@ class ApiGateway(Resources):
                 PayloadFormatVersion='2.0'
             )
             integration_id = integration_response['IntegrationId']
-            print(f"  Integration erstellt für {route_path}")
+            logger.info(f"  Integration erstellt für {route_path}")
 
             route_key = f"{method} {route_path}"
             apigateway_client.create_route(
@@ -155,30 +188,31 @@ class ApiGateway(Resources):
                 RouteKey=route_key,
                 Target=f"integrations/{integration_id}"
             )
-            print(f"  Route erstellt: {route_key}")
+            logger.info(f"  Route erstellt: {route_key}")
 
             source_arn = f"arn:aws:execute-api:{self.env.region}:{self.env.account}:{api_id}/*/{method}{route_path}"
 
+            permission = {
+                'FunctionName': lambda_name,
+                'StatementId': f"apigateway-{api_id}-{method}-{route_path.replace('/', '-').replace('{', '').replace('}', '')}",
+                'Action': 'lambda:InvokeFunction',
+                'Principal': 'apigateway.amazonaws.com',
+                'SourceArn': source_arn
+            }
+            if alias:
+                permission['Qualifier'] = alias
+
             try:
-                lambda_client.add_permission(
-                    FunctionName=lambda_name,
-                    StatementId=f"apigateway-{api_id}-{method}-{route_path.replace('/', '-').replace('{', '').replace('}', '')}",
-                    Action='lambda:InvokeFunction',
-                    Principal='apigateway.amazonaws.com',
-                    SourceArn=source_arn
-                )
-                print(f"  Lambda Permission hinzugefügt für {lambda_name}")
+                lambda_client.add_permission(**permission)
+                logger.info(f"  Lambda Permission hinzugefügt für {lambda_name}")
             except lambda_client.exceptions.ResourceConflictException:
-                print(f"  Lambda Permission existiert bereits für {lambda_name}")
+                logger.info(f"  Lambda Permission existiert bereits für {lambda_name}")
             except lambda_client.exceptions.ResourceNotFoundException as e:
-                print(f"  Warnung: Lambda Funktion {lambda_name} nicht gefunden, überspringe Permission: {e}")
+                logger.warning(f"  Warnung: Lambda Funktion {lambda_name} nicht gefunden, überspringe Permission: {e}")
 
     def update(self, deployed_tech_id: str, new_value: 'ApiGateway') -> str:
         """Update ein API Gateway"""
-        session = boto3.session.Session(
-            profile_name=new_value.env.profile,
-            region_name=new_value.env.region
-        )
+        session = create_session(new_value.env)
         apigateway_client = session.client('apigatewayv2')
         lambda_client = session.client('lambda')
 
@@ -191,37 +225,34 @@ class ApiGateway(Resources):
                     break
 
             if not api_id:
-                print(f"API Gateway {new_value.api_name} existiert nicht, erstelle neue...")
+                logger.info(f"API Gateway {new_value.api_name} existiert nicht, erstelle neue...")
                 return new_value.create()
 
             existing_routes = apigateway_client.get_routes(ApiId=api_id)
             for route in existing_routes['Items']:
                 apigateway_client.delete_route(ApiId=api_id, RouteId=route['RouteId'])
-                print(f"  Route gelöscht: {route['RouteKey']}")
+                logger.info(f"  Route gelöscht: {route['RouteKey']}")
 
             existing_integrations = apigateway_client.get_integrations(ApiId=api_id)
             for integration in existing_integrations['Items']:
                 apigateway_client.delete_integration(ApiId=api_id, IntegrationId=integration['IntegrationId'])
-                print(f"  Integration gelöscht")
+                logger.info(f"  Integration gelöscht")
 
             new_value._setup_routes(apigateway_client, lambda_client, api_id)
 
             api_endpoint = f"https://{api_id}.execute-api.{new_value.env.region}.amazonaws.com"
-            print(f"API Gateway aktualisiert: {new_value.api_name}")
-            print(f"API Endpoint: {api_endpoint}")
+            logger.info(f"API Gateway aktualisiert: {new_value.api_name}")
+            logger.info(f"API Endpoint: {api_endpoint}")
 
             return api_endpoint
 
         except Exception as e:
-            print(f"Fehler beim Update des API Gateway: {e}")
+            logger.error(f"Fehler beim Update des API Gateway: {e}")
             raise
 
     def delete(self, tech_id: str):
         """Lösche ein API Gateway"""
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         apigateway_client = session.client('apigatewayv2')
 
         try:
@@ -234,12 +265,12 @@ class ApiGateway(Resources):
 
             if api_id:
                 apigateway_client.delete_api(ApiId=api_id)
-                print(f"API Gateway gelöscht: {self.api_name}")
+                logger.info(f"API Gateway gelöscht: {self.api_name}")
             else:
-                print(f"API Gateway nicht gefunden: {self.api_name}")
+                logger.info(f"API Gateway nicht gefunden: {self.api_name}")
 
         except Exception as e:
-            print(f"Fehler beim Löschen des API Gateway: {e}")
+            logger.error(f"Fehler beim Löschen des API Gateway: {e}")
             raise
 
     @staticmethod
@@ -251,3 +282,11 @@ class ApiGateway(Resources):
 
     def __repr__(self) -> str:
         return f"ApiGateway(name='{self.api_name}', routes={len(self.routes)})"
+
+
+def _split_alias(route_config: dict) -> dict:
+    """Alias ARN als lambda_arn -> unqualifizierte ARN plus "alias" Key (ein Format für den Diff)"""
+    arn_parts = route_config.get('lambda_arn', '').split(':')
+    if len(arn_parts) <= 7:
+        return route_config
+    return {**route_config, 'lambda_arn': ':'.join(arn_parts[:7]), 'alias': arn_parts[7]}
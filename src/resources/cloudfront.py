@@ -1,62 +1,186 @@
 import time
 import uuid
+from typing import Union
+
+from src.core import events
+from src.core.describe_cache import uncached
+from src.core.log import get_logger
+from src.core.session import create_session
+from src.core.watchdog import check_deadline
+from src.model import AwsEnviroment, Resources, lazy_field
+from src.model.registry import register_resource
+from src.resources.lambda_function_url import LambdaFunctionUrl
 
-import boto3
+logger = get_logger("cloudfront")
 
-from src.model import AwsEnviroment, Resources
-from src.model.registry import register_resource
+# Managed policies: CachingDisabled and AllViewerExceptHostHeader (Lambda
+# function URLs and API Gateway reject a foreign Host header)
+CACHING_DISABLED_POLICY = '4135ea2d-6df8-44a3-9df3-4b5a84be39ad'
+ALL_VIEWER_EXCEPT_HOST_POLICY = 'b689b0a8-53d0-40ab-baf2-68738e2966ac'
 
 
 @register_resource("cloudfront")
 class CloudFront(Resources):
     """CloudFront Resource für AWS CDN Distribution Management"""
 
+    _diff_fields = ('bucket_name', 'api_gateway_endpoint', 'function_urls')
+
+    bucket_name = lazy_field()
+    api_gateway_endpoint = lazy_field()
+    function_urls = lazy_field()
+
     def __init__(
         self,
         env: AwsEnviroment,
         bucket_name: str = None,
         api_gateway_endpoint: str = None,
         distribution_name: str = None,
+        function_urls: dict[str, Union[str, LambdaFunctionUrl]] = None,
         _skip_validation: bool = False
     ):
+        """
+        Args:
+            function_urls: Path Pattern -> Lambda Function URL (oder LambdaFunctionUrl), z.B.
+                {"/api/todos": todo_list_url} - eigene Behaviors vor /api/*, ohne API Gateway
+        """
         self.bucket_name = bucket_name
         self.api_gateway_endpoint = api_gateway_endpoint
         self.distribution_name = distribution_name
         self.env = env
+        # LambdaFunctionUrl objects are resolved on first access - after they were deployed
+        self.defer('function_urls', lambda: {
+            path_pattern: _origin_url(url.get_url() if isinstance(url, LambdaFunctionUrl) else url)
+            for path_pattern, url in (function_urls or {}).items()
+        })
 
-        if not _skip_validation and not bucket_name and not api_gateway_endpoint:
-            raise ValueError("Entweder bucket_name oder api_gateway_endpoint muss angegeben werden")
+        if not _skip_validation and not bucket_name and not api_gateway_endpoint and not function_urls:
+            raise ValueError("Entweder bucket_name, api_gateway_endpoint oder function_urls muss angegeben werden")
 
     @classmethod
     def get(cls, tech_id: str, env: AwsEnviroment) -> 'CloudFront':
         """Hole eine spezifische CloudFront Distribution"""
         distribution_id = cls._extract_distribution_id(tech_id)
-        session = boto3.session.Session(
-            profile_name=env.profile,
-            region_name=env.region
-        )
+        session = create_session(env)
         cloudfront_client = session.client('cloudfront')
 
-        try:
-            response = cloudfront_client.get_distribution(Id=distribution_id)
-            distribution = response['Distribution']
+        cloudfront = cls(env=env, _skip_validation=True)
+        loaded = {}
+
+        def load_config() -> dict:
+            """Hole die Distribution Config einmalig beim ersten Zugriff auf ein Origin-Feld"""
+            if 'config' not in loaded:
+                try:
+                    response = cloudfront_client.get_distribution_config(Id=distribution_id)
+                    loaded['config'] = response['DistributionConfig']
+                except cloudfront_client.exceptions.NoSuchDistribution:
+                    cloudfront._missing = True
+                    loaded['config'] = {'Origins': {'Items': []}}
+                except Exception as e:
+                    logger.error(f"Fehler beim Abrufen der Distribution {distribution_id}: {e}")
+                    raise
+            return loaded['config']
+
+        cloudfront.defer('bucket_name', lambda: cls._bucket_from_origins(load_config()['Origins']['Items']))
+        cloudfront.defer('api_gateway_endpoint',
+                         lambda: cls._api_endpoint_from_origins(load_config()['Origins']['Items']))
+        cloudfront.defer('function_urls', lambda: cls._function_urls_from_config(load_config()))
+        return cloudfront
 
-            origin_domain = distribution['DistributionConfig']['Origins']['Items'][0]['DomainName']
-            bucket_name = origin_domain.split('.s3.')[0]
+    @staticmethod
+    def _bucket_from_origins(origins: list):
+        """Bucket Name des S3 Origins (falls vorhanden)"""
+        for origin in origins:
+            if 'S3OriginConfig' in origin:
+                return origin['DomainName'].split('.s3.')[0]
+        return None
 
-            return cls(bucket_name=bucket_name, env=env)
-        except cloudfront_client.exceptions.NoSuchDistribution:
-            return cls(env=env, _skip_validation=True)
-        except Exception as e:
-            print(f"Fehler beim Abrufen der Distribution {distribution_id}: {e}")
-            raise
+    @staticmethod
+    def _api_endpoint_from_origins(origins: list):
+        """API Gateway Endpoint des Custom Origins (falls vorhanden)"""
+        for origin in origins:
+            if 'CustomOriginConfig' in origin and '.execute-api.' in origin['DomainName']:
+                return f"https://{origin['DomainName']}"
+        return None
+
+    @staticmethod
+    def _function_urls_from_config(distribution_config: dict) -> dict:
+        """Path Pattern -> Function URL der Behaviors mit Lambda Function URL Origin"""
+        domains = {
+            origin['Id']: origin['DomainName']
+            for origin in distribution_config['Origins']['Items']
+            if '.lambda-url.' in origin['DomainName']
+        }
+        return {
+            behavior['PathPattern']: f"https://{domains[behavior['TargetOriginId']]}"
+            for behavior in distribution_config.get('CacheBehaviors', {}).get('Items', [])
+            if behavior['TargetOriginId'] in domains
+        }
+
+    def _function_url_origins(self, distribution_config: dict) -> tuple[list, list]:
+        """Origins und Behaviors der Function URLs - existierende werden wiederverwendet"""
+        existing_origins = {
+            origin['DomainName']: origin for origin in distribution_config.get('Origins', {}).get('Items', [])
+        }
+        existing_behaviors = {
+            behavior['PathPattern']: behavior
+            for behavior in distribution_config.get('CacheBehaviors', {}).get('Items', [])
+        }
+
+        origins = {}
+        behaviors = []
+        for path_pattern, url in self.function_urls.items():
+            domain = url.replace('https://', '')
+            if domain not in origins:
+                origins[domain] = existing_origins.get(domain) or {
+                    'Id': f"url-{uuid.uuid4().hex[:11]}",
+                    'DomainName': domain,
+                    'OriginPath': '',
+                    'CustomHeaders': {'Quantity': 0},
+                    'CustomOriginConfig': {
+                        'HTTPPort': 80,
+                        'HTTPSPort': 443,
+                        'OriginProtocolPolicy': 'https-only',
+                        'OriginSslProtocols': {
+                            'Quantity': 1,
+                            'Items': ['TLSv1.2']
+                        },
+                        'OriginReadTimeout': 30,
+                        'OriginKeepaliveTimeout': 5
+                    },
+                    'ConnectionAttempts': 3,
+                    'ConnectionTimeout': 10,
+                    'OriginShield': {'Enabled': False}
+                }
+            origin_id = origins[domain]['Id']
+
+            behavior = existing_behaviors.get(path_pattern)
+            if behavior is not None and behavior['TargetOriginId'] == origin_id:
+                behaviors.append(behavior)
+                continue
+            behaviors.append({
+                'PathPattern': path_pattern,
+                'TargetOriginId': origin_id,
+                'ViewerProtocolPolicy': 'https-only',
+                'AllowedMethods': {
+                    'Quantity': 7,
+                    'Items': ['GET', 'HEAD', 'OPTIONS', 'PUT', 'POST', 'PATCH', 'DELETE'],
+                    'CachedMethods': {
+                        'Quantity': 2,
+                        'Items': ['HEAD', 'GET']
+                    }
+                },
+                'Compress': True,
+                'CachePolicyId': CACHING_DISABLED_POLICY,
+                'OriginRequestPolicyId': ALL_VIEWER_EXCEPT_HOST_POLICY,
+                'TrustedSigners': {'Enabled': False, 'Quantity': 0},
+                'TrustedKeyGroups': {'Enabled': False, 'Quantity': 0},
+                'FieldLevelEncryptionId': ''
+            })
+        return list(origins.values()), behaviors
 
     def create(self) -> str:
         """Erstelle eine neue CloudFront Distribution"""
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         cloudfront_client = session.client('cloudfront')
 
         origins = []
@@ -136,13 +260,20 @@ class CloudFront(Resources):
                     }
                 },
                 'Compress': True,
-                'CachePolicyId': '4135ea2d-6df8-44a3-9df3-4b5a84be39ad',
-                'OriginRequestPolicyId': 'b689b0a8-53d0-40ab-baf2-68738e2966ac',
+                'CachePolicyId': CACHING_DISABLED_POLICY,
+                'OriginRequestPolicyId': ALL_VIEWER_EXCEPT_HOST_POLICY,
                 'TrustedSigners': {'Enabled': False, 'Quantity': 0},
                 'TrustedKeyGroups': {'Enabled': False, 'Quantity': 0},
                 'FieldLevelEncryptionId': ''
             })
 
+        if self.function_urls:
+            # Behaviors are matched in order: the function URL paths go before /api/*
+            url_origins, url_behaviors = self._function_url_origins({})
+            origins.extend(url_origins)
+            behaviors = url_behaviors + behaviors
+            comment_parts.append(f"Function URLs: {len(self.function_urls)}")
+
         default_origin_id = origins[0]['Id'] if origins else None
 
         distribution_config = {
@@ -198,20 +329,25 @@ class CloudFront(Resources):
         arn = distribution['ARN']
         distribution_id = distribution['Id']
 
-        print(f"CloudFront Distribution erstellt: {distribution_id}")
-        print(f"Domain Name: {distribution['DomainName']}")
-        print(f"Status: {distribution['Status']}")
+        logger.info(f"CloudFront Distribution erstellt: {distribution_id}")
+        logger.info(f"Domain Name: {distribution['DomainName']}")
+        logger.info(f"Status: {distribution['Status']}")
 
-        print("Warte auf Deployment...")
+        logger.info("Warte auf Deployment...")
+        attempt = 0
         while True:
-            response = cloudfront_client.get_distribution(Id=distribution_id)
+            with uncached():
+                response = cloudfront_client.get_distribution(Id=distribution_id)
             status = response['Distribution']['Status']
-            print(f"Status: {status}")
+            logger.info(f"Status: {status}")
 
             if status == 'Deployed':
-                print("CloudFront Distribution ist deployed")
+                logger.info("CloudFront Distribution ist deployed")
                 break
 
+            attempt += 1
+            events.active().wait(f"cloudfront:{distribution_id}", "distribution deployment", attempt, 30)
+            check_deadline()
             time.sleep(30)
 
         return arn
@@ -220,10 +356,7 @@ class CloudFront(Resources):
         """Update eine CloudFront Distribution"""
         distribution_id = self._extract_distribution_id(deployed_tech_id)
 
-        session = boto3.session.Session(
-            profile_name=new_value.env.profile,
-            region_name=new_value.env.region
-        )
+        session = create_session(new_value.env)
         cloudfront_client = session.client('cloudfront')
 
         try:
@@ -231,7 +364,7 @@ class CloudFront(Resources):
             distribution_config = response['DistributionConfig']
             etag = response['ETag']
         except cloudfront_client.exceptions.NoSuchDistribution:
-            print(f"CloudFront Distribution {distribution_id} existiert nicht, erstelle neue...")
+            logger.info(f"CloudFront Distribution {distribution_id} existiert nicht, erstelle neue...")
             return new_value.create()
 
         current_origins = {origin['DomainName']: origin for origin in distribution_config['Origins']['Items']}
@@ -247,7 +380,7 @@ class CloudFront(Resources):
             s3_domain = f"{new_value.bucket_name}.s3.{bucket_region}.amazonaws.com"
 
             if s3_domain not in current_origins:
-                print(f"Füge S3 Origin hinzu: {s3_domain}")
+                logger.info(f"Füge S3 Origin hinzu: {s3_domain}")
                 needs_update = True
 
                 oac_response = cloudfront_client.create_origin_access_control(
@@ -286,7 +419,7 @@ class CloudFront(Resources):
             api_domain = new_value.api_gateway_endpoint.replace('https://', '').rstrip('/')
 
             if api_domain not in current_origins:
-                print(f"Füge API Gateway Origin hinzu: {api_domain}")
+                logger.info(f"Füge API Gateway Origin hinzu: {api_domain}")
                 needs_update = True
 
                 api_origin_id = f"api-{uuid.uuid4().hex[:11]}"
@@ -324,8 +457,8 @@ class CloudFront(Resources):
                         }
                     },
                     'Compress': True,
-                    'CachePolicyId': '4135ea2d-6df8-44a3-9df3-4b5a84be39ad',
-                    'OriginRequestPolicyId': 'b689b0a8-53d0-40ab-baf2-68738e2966ac',
+                    'CachePolicyId': CACHING_DISABLED_POLICY,
+                    'OriginRequestPolicyId': ALL_VIEWER_EXCEPT_HOST_POLICY,
                     'TrustedSigners': {'Enabled': False, 'Quantity': 0},
                     'TrustedKeyGroups': {'Enabled': False, 'Quantity': 0},
                     'FieldLevelEncryptionId': ''
@@ -339,8 +472,15 @@ class CloudFront(Resources):
                     if behavior['PathPattern'] == '/api/*':
                         new_behaviors.append(behavior)
 
+        url_origins, url_behaviors = new_value._function_url_origins(distribution_config)
+        if self._function_urls_from_config(distribution_config) != new_value.function_urls:
+            logger.info(f"Function URL Behaviors geändert: {', '.join(new_value.function_urls) or '-'}")
+            needs_update = True
+        new_origins.extend(url_origins)
+        new_behaviors = url_behaviors + new_behaviors
+
         if not needs_update:
-            print(f"CloudFront Distribution {distribution_id} ist bereits aktuell")
+            logger.info(f"CloudFront Distribution {distribution_id} ist bereits aktuell")
             return deployed_tech_id
 
         distribution_config['Origins'] = {
@@ -363,8 +503,8 @@ class CloudFront(Resources):
         )
 
         updated_distribution = update_response['Distribution']
-        print(f"CloudFront Distribution {distribution_id} erfolgreich aktualisiert")
-        print(f"Status: {updated_distribution['Status']}")
+        logger.info(f"CloudFront Distribution {distribution_id} erfolgreich aktualisiert")
+        logger.info(f"Status: {updated_distribution['Status']}")
 
         return updated_distribution['ARN']
 
@@ -372,10 +512,7 @@ class CloudFront(Resources):
         """Lösche eine CloudFront Distribution"""
         distribution_id = self._extract_distribution_id(tech_id)
 
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         cloudfront_client = session.client('cloudfront')
 
         try:
@@ -383,11 +520,11 @@ class CloudFront(Resources):
             distribution_config = response['DistributionConfig']
             etag = response['ETag']
         except cloudfront_client.exceptions.NoSuchDistribution:
-            print(f"CloudFront Distribution {distribution_id} existiert nicht")
+            logger.info(f"CloudFront Distribution {distribution_id} existiert nicht")
             return
 
         if distribution_config['Enabled']:
-            print(f"Distribution {distribution_id} ist enabled. Deaktiviere sie zuerst...")
+            logger.info(f"Distribution {distribution_id} ist enabled. Deaktiviere sie zuerst...")
 
             distribution_config['Enabled'] = False
             cloudfront_client.update_distribution(
@@ -396,29 +533,34 @@ class CloudFront(Resources):
                 IfMatch=etag
             )
 
-            print("Distribution deaktiviert. Warte auf Deployment...")
+            logger.info("Distribution deaktiviert. Warte auf Deployment...")
 
+            attempt = 0
             while True:
-                response = cloudfront_client.get_distribution(Id=distribution_id)
+                with uncached():
+                    response = cloudfront_client.get_distribution(Id=distribution_id)
                 status = response['Distribution']['Status']
-                print(f"Status: {status}")
+                logger.info(f"Status: {status}")
 
                 if status == 'Deployed':
-                    print("Distribution ist deployed und deaktiviert")
+                    logger.info("Distribution ist deployed und deaktiviert")
                     etag = response['ETag']
                     break
 
+                attempt += 1
+                events.active().wait(f"cloudfront:{distribution_id}", "distribution disable", attempt, 30)
+                check_deadline()
                 time.sleep(30)
         else:
-            print(f"Distribution {distribution_id} ist bereits deaktiviert")
+            logger.info(f"Distribution {distribution_id} ist bereits deaktiviert")
 
-        print(f"Lösche Distribution {distribution_id}...")
+        logger.info(f"Lösche Distribution {distribution_id}...")
         cloudfront_client.delete_distribution(
             Id=distribution_id,
             IfMatch=etag
         )
 
-        print(f"CloudFront Distribution {distribution_id} erfolgreich gelöscht")
+        logger.info(f"CloudFront Distribution {distribution_id} erfolgreich gelöscht")
 
     @staticmethod
     def _extract_distribution_id(arn: str) -> str:
@@ -427,3 +569,8 @@ class CloudFront(Resources):
 
     def __repr__(self) -> str:
         return f"CloudFront(bucket='{self.bucket_name}')"
+
+
+def _origin_url(url: str) -> str:
+    """https://<domain> ohne abschließenden Slash (Format von _function_urls_from_config)"""
+    return f"https://{url.replace('https://', '').rstrip('/')}"
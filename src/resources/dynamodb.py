@@ -1,13 +1,25 @@
-import boto3
+import time
 
+from src.core import events
+from src.core.describe_cache import uncached
+from src.core.log import get_logger
+from src.core.session import create_session
+from src.core.watchdog import check_deadline
 from src.model import AwsEnviroment, Resources
 from src.model.registry import register_resource
 
+logger = get_logger("dynamodb")
+
+PROJECTION_TYPES = ("ALL", "KEYS_ONLY")
+
 
 @register_resource("dynamodb")
 class DynamoDB(Resources):
     """DynamoDB Resource für AWS DynamoDB Table Management"""
 
+    _diff_fields = ('table_name', 'partition_key', 'sort_key', 'billing_mode', 'stream_enabled',
+                    'global_secondary_indexes')
+
     def __init__(
         self,
         table_name: str,
@@ -24,14 +36,27 @@ class DynamoDB(Resources):
             partition_key: Dict mit 'name' und 'type' (S, N, B)
             sort_key: Optional, Dict mit 'name' und 'type'
             billing_mode: PAY_PER_REQUEST oder PROVISIONED
-            global_secondary_indexes: Optional, Liste von GSI Configs
+            global_secondary_indexes: Optional, Liste von GSI Configs, z.B.:
+                [
+                    {
+                        "index_name": "by-created",
+                        "partition_key": {"name": "entity", "type": "S"},
+                        "sort_key": {"name": "created_at", "type": "N"},  # optional
+                        "projection": ["title", "completed"]  # oder "ALL" / "KEYS_ONLY"
+                    }
+                ]
+                Configs im AWS Format (IndexName, KeySchema, Projection) gehen auch,
+                deren Key Attribute sind dann vom Typ S.
             stream_enabled: Stream für CDC aktivieren
         """
         self.table_name = table_name
         self.partition_key = partition_key
         self.sort_key = sort_key
         self.billing_mode = billing_mode
-        self.global_secondary_indexes = global_secondary_indexes or []
+        self.global_secondary_indexes = sorted(
+            (self._normalize_index(gsi) for gsi in global_secondary_indexes or []),
+            key=lambda gsi: gsi["index_name"]
+        )
         self.stream_enabled = stream_enabled
         self.env = env
 
@@ -39,57 +64,44 @@ class DynamoDB(Resources):
     def get(cls, tech_id: str, env: AwsEnviroment) -> 'DynamoDB':
         """Hole eine spezifische DynamoDB Tabelle"""
         table_name = cls._extract_table_name(tech_id)
-        session = boto3.session.Session(
-            profile_name=env.profile,
-            region_name=env.region
-        )
+        session = create_session(env)
         dynamodb_client = session.client('dynamodb')
 
         try:
             response = dynamodb_client.describe_table(TableName=table_name)
             table = response['Table']
 
-            partition_key = None
-            sort_key = None
-            for key_schema in table['KeySchema']:
-                if key_schema['KeyType'] == 'HASH':
-                    for attr in table['AttributeDefinitions']:
-                        if attr['AttributeName'] == key_schema['AttributeName']:
-                            partition_key = {'name': attr['AttributeName'], 'type': attr['AttributeType']}
-                elif key_schema['KeyType'] == 'RANGE':
-                    for attr in table['AttributeDefinitions']:
-                        if attr['AttributeName'] == key_schema['AttributeName']:
-                            sort_key = {'name': attr['AttributeName'], 'type': attr['AttributeType']}
+            partition_key, sort_key = cls._keys_from_schema(table['KeySchema'], table['AttributeDefinitions'])
 
             return cls(
                 table_name=table['TableName'],
                 partition_key=partition_key,
                 sort_key=sort_key,
                 billing_mode=table.get('BillingModeSummary', {}).get('BillingMode', 'PAY_PER_REQUEST'),
+                global_secondary_indexes=cls._indexes_from_table(table),
                 stream_enabled=table.get('StreamSpecification', {}).get('StreamEnabled', False),
                 env=env
             )
         except dynamodb_client.exceptions.ResourceNotFoundException:
-            return cls(
+            table = cls(
                 table_name=table_name,
                 partition_key={'name': 'id', 'type': 'S'},
                 env=env
             )
+            table._missing = True
+            return table
         except Exception as e:
-            print(f"Fehler beim Abrufen der DynamoDB Tabelle {table_name}: {e}")
+            logger.error(f"Fehler beim Abrufen der DynamoDB Tabelle {table_name}: {e}")
             raise
 
     def create(self) -> str:
         """Erstelle eine neue DynamoDB Tabelle oder verwende existierende"""
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         dynamodb_client = session.client('dynamodb')
 
         try:
             response = dynamodb_client.describe_table(TableName=self.table_name)
-            print(f"DynamoDB Tabelle existiert bereits: {self.table_name}")
+            logger.info(f"DynamoDB Tabelle existiert bereits: {self.table_name}")
             return response['Table']['TableArn']
         except dynamodb_client.exceptions.ResourceNotFoundException:
             pass
@@ -132,30 +144,26 @@ class DynamoDB(Resources):
             }
 
         if self.global_secondary_indexes:
-            table_config['GlobalSecondaryIndexes'] = self.global_secondary_indexes
+            table_config['GlobalSecondaryIndexes'] = [self._index_config(gsi) for gsi in self.global_secondary_indexes]
             for gsi in self.global_secondary_indexes:
-                for key in gsi['KeySchema']:
-                    attr_name = key['AttributeName']
-                    if not any(attr['AttributeName'] == attr_name for attr in attribute_definitions):
-                        attribute_definitions.append({
-                            'AttributeName': attr_name,
-                            'AttributeType': 'S'
-                        })
+                self._add_attribute_definitions(attribute_definitions, gsi)
 
         response = dynamodb_client.create_table(**table_config)
 
         arn = response['TableDescription']['TableArn']
-        print(f"DynamoDB Tabelle erstellt: {self.table_name}")
-        print(f"ARN: {arn}")
-        print(f"Partition Key: {self.partition_key['name']} ({self.partition_key['type']})")
+        logger.info(f"DynamoDB Tabelle erstellt: {self.table_name}")
+        logger.info(f"ARN: {arn}")
+        logger.info(f"Partition Key: {self.partition_key['name']} ({self.partition_key['type']})")
         if self.sort_key:
-            print(f"Sort Key: {self.sort_key['name']} ({self.sort_key['type']})")
-        print(f"Billing Mode: {self.billing_mode}")
+            logger.info(f"Sort Key: {self.sort_key['name']} ({self.sort_key['type']})")
+        logger.info(f"Billing Mode: {self.billing_mode}")
 
-        print("Warte auf Tabelle...")
+        logger.info("Warte auf Tabelle...")
+        events.active().wait(f"dynamodb:{self.table_name}", "table_exists", 1, 20)
         waiter = dynamodb_client.get_waiter('table_exists')
-        waiter.wait(TableName=self.table_name)
-        print("Tabelle ist bereit")
+        with uncached():
+            waiter.wait(TableName=self.table_name)
+        logger.info("Tabelle ist bereit")
 
         return arn
 
@@ -163,52 +171,163 @@ class DynamoDB(Resources):
         """Update eine DynamoDB Tabelle"""
         table_name = self._extract_table_name(deployed_tech_id)
 
-        session = boto3.session.Session(
-            profile_name=new_value.env.profile,
-            region_name=new_value.env.region
-        )
+        session = create_session(new_value.env)
         dynamodb_client = session.client('dynamodb')
 
         try:
             response = dynamodb_client.describe_table(TableName=table_name)
             arn = response['Table']['TableArn']
 
-            print(f"DynamoDB Tabelle {table_name} ist bereits aktuell")
+            deployed = {gsi["index_name"]: gsi for gsi in self._indexes_from_table(response['Table'])}
+            desired = {gsi["index_name"]: gsi for gsi in new_value.global_secondary_indexes}
+            # Keys and projection of an index are immutable: a changed index is dropped and rebuilt
+            stale = sorted(name for name in deployed if deployed[name] != desired.get(name))
+            missing = sorted(name for name in desired if name not in deployed or name in stale)
+            if not stale and not missing:
+                logger.info(f"DynamoDB Tabelle {table_name} ist bereits aktuell")
+                return arn
+
+            # UpdateTable accepts a single index create or delete per call
+            for index_name in stale:
+                dynamodb_client.update_table(
+                    TableName=table_name,
+                    GlobalSecondaryIndexUpdates=[{'Delete': {'IndexName': index_name}}]
+                )
+                logger.info(f"GSI wird gelöscht: {index_name}")
+                self._wait_for_index(dynamodb_client, table_name, index_name, deleted=True)
+
+            for index_name in missing:
+                attribute_definitions = []
+                self._add_attribute_definitions(attribute_definitions, desired[index_name])
+                dynamodb_client.update_table(
+                    TableName=table_name,
+                    AttributeDefinitions=attribute_definitions,
+                    GlobalSecondaryIndexUpdates=[{'Create': self._index_config(desired[index_name])}]
+                )
+                logger.info(f"GSI wird erstellt: {index_name} (Backfill der bestehenden Items)")
+                self._wait_for_index(dynamodb_client, table_name, index_name)
+
             return arn
 
         except dynamodb_client.exceptions.ResourceNotFoundException:
-            print(f"DynamoDB Tabelle {table_name} existiert nicht, erstelle neue...")
+            logger.info(f"DynamoDB Tabelle {table_name} existiert nicht, erstelle neue...")
             return new_value.create()
 
         except Exception as e:
-            print(f"Fehler beim Update der DynamoDB Tabelle: {e}")
+            logger.error(f"Fehler beim Update der DynamoDB Tabelle: {e}")
             raise
 
     def delete(self, tech_id: str):
         """Lösche eine DynamoDB Tabelle"""
         table_name = self._extract_table_name(tech_id)
 
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         dynamodb_client = session.client('dynamodb')
 
         try:
             dynamodb_client.delete_table(TableName=table_name)
-            print(f"DynamoDB Tabelle gelöscht: {table_name}")
+            logger.info(f"DynamoDB Tabelle gelöscht: {table_name}")
 
-            print("Warte auf Löschung...")
+            logger.info("Warte auf Löschung...")
+            events.active().wait(f"dynamodb:{table_name}", "table_not_exists", 1, 20)
             waiter = dynamodb_client.get_waiter('table_not_exists')
-            waiter.wait(TableName=table_name)
-            print("Tabelle wurde gelöscht")
+            with uncached():
+                waiter.wait(TableName=table_name)
+            logger.info("Tabelle wurde gelöscht")
 
         except dynamodb_client.exceptions.ResourceNotFoundException:
-            print(f"DynamoDB Tabelle existiert nicht: {table_name}")
+            logger.info(f"DynamoDB Tabelle existiert nicht: {table_name}")
         except Exception as e:
-            print(f"Fehler beim Löschen der DynamoDB Tabelle: {e}")
+            logger.error(f"Fehler beim Löschen der DynamoDB Tabelle: {e}")
             raise
 
+    @staticmethod
+    def _wait_for_index(dynamodb_client, table_name: str, index_name: str, deleted: bool = False) -> None:
+        """Warte bis der GSI ACTIVE bzw. gelöscht ist - vorher sind keine Queries / Index Updates möglich"""
+        attempt = 0
+        while True:
+            with uncached():
+                table = dynamodb_client.describe_table(TableName=table_name)['Table']
+            status = next((gsi['IndexStatus'] for gsi in table.get('GlobalSecondaryIndexes', [])
+                           if gsi['IndexName'] == index_name), None)
+            if status == 'ACTIVE' and not deleted or status is None and deleted:
+                logger.info(f"GSI {index_name} ist {'gelöscht' if deleted else 'bereit'}")
+                return
+
+            attempt += 1
+            events.active().wait(f"dynamodb:{table_name}", f"index {index_name}", attempt, 10)
+            check_deadline()
+            time.sleep(10)
+
+    @classmethod
+    def _normalize_index(cls, gsi: dict) -> dict:
+        """GSI Config (eigenes oder AWS Format) -> index_name, partition_key, sort_key, projection"""
+        if "IndexName" in gsi:
+            keys = {key['KeyType']: {'name': key['AttributeName'], 'type': 'S'} for key in gsi['KeySchema']}
+            gsi = {
+                "index_name": gsi['IndexName'],
+                "partition_key": keys['HASH'],
+                "sort_key": keys.get('RANGE'),
+                "projection": cls._projection(gsi.get('Projection', {'ProjectionType': 'ALL'})),
+            }
+
+        projection = gsi.get("projection", "ALL")
+        if isinstance(projection, str) and projection not in PROJECTION_TYPES:
+            raise ValueError(f"GSI {gsi['index_name']}: unbekannte Projection {projection}")
+        return {
+            "index_name": gsi["index_name"],
+            "partition_key": gsi["partition_key"],
+            "sort_key": gsi.get("sort_key"),
+            "projection": projection if isinstance(projection, str) else sorted(projection),
+        }
+
+    @classmethod
+    def _indexes_from_table(cls, table: dict) -> list:
+        """GSIs aus describe_table im Format von global_secondary_indexes"""
+        indexes = []
+        for gsi in table.get('GlobalSecondaryIndexes', []):
+            partition_key, sort_key = cls._keys_from_schema(gsi['KeySchema'], table['AttributeDefinitions'])
+            indexes.append({
+                "index_name": gsi['IndexName'],
+                "partition_key": partition_key,
+                "sort_key": sort_key,
+                "projection": cls._projection(gsi['Projection']),
+            })
+        return sorted(indexes, key=lambda gsi: gsi["index_name"])
+
+    @staticmethod
+    def _projection(projection: dict):
+        """AWS Projection -> "ALL", "KEYS_ONLY" oder Liste der NonKeyAttributes (INCLUDE)"""
+        if projection['ProjectionType'] == 'INCLUDE':
+            return sorted(projection.get('NonKeyAttributes', []))
+        return projection['ProjectionType']
+
+    @staticmethod
+    def _index_config(gsi: dict) -> dict:
+        """GSI im AWS Format für CreateTable / UpdateTable"""
+        key_schema = [{'AttributeName': gsi["partition_key"]['name'], 'KeyType': 'HASH'}]
+        if gsi["sort_key"]:
+            key_schema.append({'AttributeName': gsi["sort_key"]['name'], 'KeyType': 'RANGE'})
+        if isinstance(gsi["projection"], str):
+            projection = {'ProjectionType': gsi["projection"]}
+        else:
+            projection = {'ProjectionType': 'INCLUDE', 'NonKeyAttributes': gsi["projection"]}
+        return {'IndexName': gsi["index_name"], 'KeySchema': key_schema, 'Projection': projection}
+
+    @staticmethod
+    def _add_attribute_definitions(attribute_definitions: list, gsi: dict) -> None:
+        for key in (gsi["partition_key"], gsi["sort_key"]):
+            if key and not any(attr['AttributeName'] == key['name'] for attr in attribute_definitions):
+                attribute_definitions.append({'AttributeName': key['name'], 'AttributeType': key['type']})
+
+    @staticmethod
+    def _keys_from_schema(key_schema: list, attribute_definitions: list) -> tuple:
+        """(partition_key, sort_key) aus KeySchema und AttributeDefinitions"""
+        types = {attr['AttributeName']: attr['AttributeType'] for attr in attribute_definitions}
+        keys = {key['KeyType']: {'name': key['AttributeName'], 'type': types[key['AttributeName']]}
+                for key in key_schema}
+        return keys.get('HASH'), keys.get('RANGE')
+
     @staticmethod
     def _extract_table_name(arn: str) -> str:
         """Extrahiere Table Name aus ARN"""
@@ -220,18 +339,15 @@ class DynamoDB(Resources):
         Args:
             item: Dictionary with item data
         """
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         dynamodb = session.resource('dynamodb')
         table = dynamodb.Table(self.table_name)
 
         try:
             table.put_item(Item=item)
-            print(f"✓ Item hinzugefügt: {item}")
+            logger.info(f"✓ Item hinzugefügt: {item}")
         except Exception as e:
-            print(f"Fehler beim Hinzufügen des Items zu {self.table_name}: {e}")
+            logger.error(f"Fehler beim Hinzufügen des Items zu {self.table_name}: {e}")
             raise
 
     def get_item(self, key: dict) -> dict:
@@ -243,20 +359,17 @@ class DynamoDB(Resources):
         Returns:
             Item dictionary or None if not found
         """
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         dynamodb = session.resource('dynamodb')
         table = dynamodb.Table(self.table_name)
 
         try:
             response = table.get_item(Key=key)
             item = response.get('Item')
-            print(f"✓ Item abgerufen: {item}")
+            logger.info(f"✓ Item abgerufen: {item}")
             return item
         except Exception as e:
-            print(f"Fehler beim Abrufen des Items von {self.table_name}: {e}")
+            logger.error(f"Fehler beim Abrufen des Items von {self.table_name}: {e}")
             raise
 
     def query(self, key_condition: dict, **kwargs) -> list:
@@ -269,20 +382,17 @@ class DynamoDB(Resources):
         Returns:
             List of items matching the query
         """
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         dynamodb = session.resource('dynamodb')
         table = dynamodb.Table(self.table_name)
 
         try:
             response = table.query(**key_condition, **kwargs)
             items = response.get('Items', [])
-            print(f"✓ {len(items)} Items gefunden")
+            logger.info(f"✓ {len(items)} Items gefunden")
             return items
         except Exception as e:
-            print(f"Fehler beim Abfragen von {self.table_name}: {e}")
+            logger.error(f"Fehler beim Abfragen von {self.table_name}: {e}")
             raise
 
     def scan(self, **kwargs) -> list:
@@ -294,40 +404,82 @@ class DynamoDB(Resources):
         Returns:
             List of all items
         """
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         dynamodb = session.resource('dynamodb')
         table = dynamodb.Table(self.table_name)
 
         try:
             response = table.scan(**kwargs)
             items = response.get('Items', [])
-            print(f"✓ {len(items)} Items gescannt")
+            logger.info(f"✓ {len(items)} Items gescannt")
             return items
         except Exception as e:
-            print(f"Fehler beim Scannen von {self.table_name}: {e}")
+            logger.error(f"Fehler beim Scannen von {self.table_name}: {e}")
             raise
 
+    def fill_missing(self, attribute: str, value) -> int:
+        """Setze attribute = value auf allen Items, denen es fehlt (z.B. Backfill eines neuen GSI Keys)
+
+        Reads only the keys of the affected items (paginated scan with a
+        filter); the conditional update never overwrites a value written in
+        the meantime and never recreates a deleted item.
+
+        Returns:
+            Number of updated items
+        """
+        session = create_session(self.env)
+        dynamodb = session.resource('dynamodb')
+        table = dynamodb.Table(self.table_name)
+        key_names = [key['name'] for key in (self.partition_key, self.sort_key) if key]
+        names = {f'#k{index}': name for index, name in enumerate(key_names)}
+
+        scan = {
+            'FilterExpression': 'attribute_not_exists(#attr)',
+            'ProjectionExpression': ', '.join(names),
+            'ExpressionAttributeNames': {'#attr': attribute, **names},
+        }
+        updated = 0
+        try:
+            while True:
+                response = table.scan(**scan)
+                for key in response.get('Items', []):
+                    try:
+                        table.update_item(
+                            Key=key,
+                            UpdateExpression='SET #attr = :value',
+                            ConditionExpression='attribute_not_exists(#attr) AND attribute_exists(#k0)',
+                            ExpressionAttributeNames={'#attr': attribute, '#k0': key_names[0]},
+                            ExpressionAttributeValues={':value': value}
+                        )
+                        updated += 1
+                    except dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+                        pass
+                if 'LastEvaluatedKey' not in response:
+                    break
+                scan['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        except Exception as e:
+            logger.error(f"Fehler beim Backfill von {attribute} in {self.table_name}: {e}")
+            raise
+
+        if updated:
+            logger.info(f"✓ {attribute} auf {updated} Items gesetzt")
+        return updated
+
     def delete_item(self, key: dict) -> None:
         """Delete an item from the table
 
         Args:
             key: Dictionary with partition key (and sort key if applicable)
         """
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         dynamodb = session.resource('dynamodb')
         table = dynamodb.Table(self.table_name)
 
         try:
             table.delete_item(Key=key)
-            print(f"✓ Item gelöscht: {key}")
+            logger.info(f"✓ Item gelöscht: {key}")
         except Exception as e:
-            print(f"Fehler beim Löschen des Items von {self.table_name}: {e}")
+            logger.error(f"Fehler beim Löschen des Items von {self.table_name}: {e}")
             raise
 
     def __repr__(self) -> str:
@@ -1,15 +1,23 @@
 import json
 
-import boto3
-
-from src.model import AwsEnviroment, Resources
+from src.core.log import get_logger
+from src.core.session import create_session
+from src.model import AwsEnviroment, Resources, lazy_field
 from src.model.registry import register_resource
 
+logger = get_logger("iam_role")
+
 
 @register_resource("iam_role")
 class IamRole(Resources):
     """IAM Role Resource für AWS IAM Management"""
 
+    _diff_fields = ('role_name', 'description', 'assume_role_policy', 'managed_policies', 'inline_policies')
+    _unordered_fields = ('managed_policies',)
+
+    managed_policies = lazy_field()
+    inline_policies = lazy_field()
+
     def __init__(
         self,
         role_name: str,
@@ -30,54 +38,43 @@ class IamRole(Resources):
     def get(cls, tech_id: str, env: AwsEnviroment) -> 'IamRole':
         """Hole eine spezifische IAM Role"""
         role_name = cls._extract_role_name(tech_id)
-        session = boto3.session.Session(
-            profile_name=env.profile,
-            region_name=env.region
-        )
+        session = create_session(env)
         iam_client = session.client('iam')
 
         try:
             response = iam_client.get_role(RoleName=role_name)
             role = response['Role']
 
-            attached_policies = iam_client.list_attached_role_policies(RoleName=role_name)
-            managed_policies = [p['PolicyArn'] for p in attached_policies['AttachedPolicies']]
-
-            inline_policies_response = iam_client.list_role_policies(RoleName=role_name)
-            inline_policies = {}
-            for policy_name in inline_policies_response['PolicyNames']:
-                policy_response = iam_client.get_role_policy(RoleName=role_name, PolicyName=policy_name)
-                inline_policies[policy_name] = policy_response['PolicyDocument']
-
-            return cls(
+            iam_role = cls(
                 role_name=role['RoleName'],
                 assume_role_policy=role['AssumeRolePolicyDocument'],
                 env=env,
-                managed_policies=managed_policies,
-                inline_policies=inline_policies,
                 description=role.get('Description', '')
             )
+            # Policies are only fetched when the diff actually compares them
+            iam_role.defer('managed_policies', lambda: cls._fetch_managed_policies(iam_client, role_name))
+            iam_role.defer('inline_policies', lambda: cls._fetch_inline_policies(iam_client, role_name))
+            return iam_role
         except iam_client.exceptions.NoSuchEntityException:
-            return cls(
+            iam_role = cls(
                 role_name=role_name,
                 assume_role_policy={},
                 env=env
             )
+            iam_role._missing = True
+            return iam_role
         except Exception as e:
-            print(f"Fehler beim Abrufen der IAM Role {role_name}: {e}")
+            logger.error(f"Fehler beim Abrufen der IAM Role {role_name}: {e}")
             raise
 
     def create(self) -> str:
         """Erstelle eine neue IAM Role oder verwende existierende"""
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         iam_client = session.client('iam')
 
         try:
             existing_role = iam_client.get_role(RoleName=self.role_name)
-            print(f"IAM Role existiert bereits: {self.role_name}")
+            logger.info(f"IAM Role existiert bereits: {self.role_name}")
             arn = existing_role['Role']['Arn']
         except iam_client.exceptions.NoSuchEntityException:
             create_role_params = {
@@ -89,14 +86,29 @@ class IamRole(Resources):
 
             response = iam_client.create_role(**create_role_params)
             arn = response['Role']['Arn']
-            print(f"IAM Role erstellt: {self.role_name}")
-            print(f"ARN: {arn}")
+            logger.info(f"IAM Role erstellt: {self.role_name}")
+            logger.info(f"ARN: {arn}")
 
         self._sync_policies(iam_client)
-        self._wait_for_propagation(iam_client)
 
         return arn
 
+    @staticmethod
+    def _fetch_managed_policies(iam_client, role_name: str) -> list:
+        """Hole die ARNs aller attached Managed Policies"""
+        attached_policies = iam_client.list_attached_role_policies(RoleName=role_name)
+        return [p['PolicyArn'] for p in attached_policies['AttachedPolicies']]
+
+    @staticmethod
+    def _fetch_inline_policies(iam_client, role_name: str) -> dict:
+        """Hole alle Inline Policy Dokumente"""
+        inline_policies_response = iam_client.list_role_policies(RoleName=role_name)
+        inline_policies = {}
+        for policy_name in inline_policies_response['PolicyNames']:
+            policy_response = iam_client.get_role_policy(RoleName=role_name, PolicyName=policy_name)
+            inline_policies[policy_name] = policy_response['PolicyDocument']
+        return inline_policies
+
     def _sync_policies(self, iam_client, role_name: str = None):
         """Synchronisiere Policies mit gewünschtem Zustand
 
@@ -112,11 +124,11 @@ class IamRole(Resources):
 
         for policy_arn in current_policy_arns - new_policy_arns:
             iam_client.detach_role_policy(RoleName=target_role_name, PolicyArn=policy_arn)
-            print(f"  Managed Policy detached: {policy_arn}")
+            logger.info(f"  Managed Policy detached: {policy_arn}")
 
         for policy_arn in new_policy_arns - current_policy_arns:
             iam_client.attach_role_policy(RoleName=target_role_name, PolicyArn=policy_arn)
-            print(f"  Managed Policy attached: {policy_arn}")
+            logger.info(f"  Managed Policy attached: {policy_arn}")
 
         current_inline = iam_client.list_role_policies(RoleName=target_role_name)
         current_inline_names = set(current_inline['PolicyNames'])
@@ -124,7 +136,7 @@ class IamRole(Resources):
 
         for policy_name in current_inline_names - new_inline_names:
             iam_client.delete_role_policy(RoleName=target_role_name, PolicyName=policy_name)
-            print(f"  Inline Policy gelöscht: {policy_name}")
+            logger.info(f"  Inline Policy gelöscht: {policy_name}")
 
         for policy_name in new_inline_names:
             iam_client.put_role_policy(
@@ -133,30 +145,27 @@ class IamRole(Resources):
                 PolicyDocument=json.dumps(self.inline_policies[policy_name])
             )
             if policy_name in current_inline_names:
-                print(f"  Inline Policy aktualisiert: {policy_name}")
+                logger.info(f"  Inline Policy aktualisiert: {policy_name}")
             else:
-                print(f"  Inline Policy erstellt: {policy_name}")
+                logger.info(f"  Inline Policy erstellt: {policy_name}")
 
     def update(self, deployed_tech_id: str, new_value: 'IamRole') -> str:
         """Update eine IAM Role"""
         deployed_role_name = self._extract_role_name(deployed_tech_id)
 
-        session = boto3.session.Session(
-            profile_name=new_value.env.profile,
-            region_name=new_value.env.region
-        )
+        session = create_session(new_value.env)
         iam_client = session.client('iam')
 
         # If the role name changed, create a new role instead of updating
         if deployed_role_name != new_value.role_name:
-            print(f"IAM Role name changed ({deployed_role_name} → {new_value.role_name}), erstelle neue...")
+            logger.info(f"IAM Role name changed ({deployed_role_name} → {new_value.role_name}), erstelle neue...")
             return new_value.create()
 
         try:
             response = iam_client.get_role(RoleName=deployed_role_name)
             arn = response['Role']['Arn']
         except iam_client.exceptions.NoSuchEntityException:
-            print(f"IAM Role {deployed_role_name} existiert nicht, erstelle neue...")
+            logger.info(f"IAM Role {deployed_role_name} existiert nicht, erstelle neue...")
             return new_value.create()
 
         current_assume_policy = json.dumps(response['Role']['AssumeRolePolicyDocument'], sort_keys=True)
@@ -167,7 +176,7 @@ class IamRole(Resources):
                 RoleName=deployed_role_name,
                 PolicyDocument=json.dumps(new_value.assume_role_policy)
             )
-            print(f"Assume Role Policy aktualisiert: {deployed_role_name}")
+            logger.info(f"Assume Role Policy aktualisiert: {deployed_role_name}")
 
         new_value._sync_policies(iam_client, role_name=deployed_role_name)
 
@@ -176,22 +185,16 @@ class IamRole(Resources):
                 RoleName=deployed_role_name,
                 Description=new_value.description
             )
-            print(f"Description aktualisiert: {deployed_role_name}")
-
-        # Wait for role to be fully propagated after updates
-        new_value._wait_for_propagation(iam_client)
+            logger.info(f"Description aktualisiert: {deployed_role_name}")
 
-        print(f"IAM Role erfolgreich aktualisiert: {deployed_role_name}")
+        logger.info(f"IAM Role erfolgreich aktualisiert: {deployed_role_name}")
         return arn
 
     def delete(self, tech_id: str):
         """Lösche eine IAM Role"""
         role_name = self._extract_role_name(tech_id)
 
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         iam_client = session.client('iam')
 
         try:
@@ -201,7 +204,7 @@ class IamRole(Resources):
                     RoleName=role_name,
                     PolicyArn=policy['PolicyArn']
                 )
-                print(f"  Managed Policy detached: {policy['PolicyArn']}")
+                logger.info(f"  Managed Policy detached: {policy['PolicyArn']}")
 
             inline_policies = iam_client.list_role_policies(RoleName=role_name)
             for policy_name in inline_policies['PolicyNames']:
@@ -209,34 +212,17 @@ class IamRole(Resources):
                     RoleName=role_name,
                     PolicyName=policy_name
                 )
-                print(f"  Inline Policy gelöscht: {policy_name}")
+                logger.info(f"  Inline Policy gelöscht: {policy_name}")
 
             iam_client.delete_role(RoleName=role_name)
-            print(f"IAM Role gelöscht: {role_name}")
+            logger.info(f"IAM Role gelöscht: {role_name}")
 
         except iam_client.exceptions.NoSuchEntityException:
-            print(f"IAM Role existiert nicht: {role_name}")
+            logger.info(f"IAM Role existiert nicht: {role_name}")
         except Exception as e:
-            print(f"Fehler beim Löschen der IAM Role: {e}")
+            logger.error(f"Fehler beim Löschen der IAM Role: {e}")
             raise
 
-    def _wait_for_propagation(self, iam_client):
-        """Warte bis IAM Role vollständig propagiert ist"""
-        import time
-        max_attempts = 60
-        for attempt in range(max_attempts):
-            try:
-                iam_client.get_role(RoleName=self.role_name)
-                if attempt > 0:
-                    print(f"IAM Role propagiert und bereit")
-                return
-            except Exception as e:
-                if attempt < max_attempts - 1:
-                    time.sleep(1)
-                else:
-                    print(f"Warnung: Role Propagation timeout, fortfahren...")
-                    return
-
     def get_arn(self) -> str:
         """Get ARN for this role
 
@@ -1,20 +1,82 @@
+import base64
+import itertools
 import json
-import os
-import shutil
-import tempfile
-import zipfile
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from src.core import events
+from src.core.canary import Canary, CanaryConfig, CanaryRollbackError
+from src.core.describe_cache import uncached
+from src.core.log import get_logger
+from src.core.session import create_session
+from src.core.watchdog import DeadlineExceededError, check_deadline
+from src.model import AwsEnviroment, Resources, lazy_field
+from src.model.registry import register_resource
+from src.packaging import OptimizeOptions, PackageEntry, artifact_store, package_cache
+from src.packaging import pool as package_pool
+from src.resources.schedule_rule import ScheduleRule, WarmerConfig
 
-import boto3
+logger = get_logger("lambda")
 
-from src.model import AwsEnviroment, Resources
-from src.model.registry import register_resource
+# A freshly created IAM role is not assumable by Lambda right away. Instead of
+# polling IAM up front, create_function is tried immediately and retried with
+# exponential backoff only while Lambda rejects the role.
+ROLE_RETRY_ATTEMPTS = 10
+ROLE_RETRY_BASE_DELAY = 0.5
+ROLE_RETRY_MAX_DELAY = 8
+
+# Aliases created by myzel carry this description; get() finds the managed alias by it
+ALIAS_DESCRIPTION = "myzel-managed"
+
+# Python runtimes with SnapStart support
+SNAP_START_RUNTIMES = ("python3.12", "python3.13")
+
+# botocore's default connection pool size; invoke_many grows it to its concurrency
+MIN_POOL_CONNECTIONS = 10
+
+
+@dataclass
+class InvocationResult:
+    """Ergebnis eines Aufrufs aus LambdaFunction.invoke_many"""
+    index: int
+    payload: dict
+    status_code: Optional[int]
+    response: Optional[dict]
+    latency_ms: float
+    # "Handled"/"Unhandled" if the function raised
+    function_error: Optional[str] = None
+    # Client side error (throttling after retries, network, ...)
+    error: Optional[str] = None
+    log_result: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.function_error is None
 
 
 @register_resource("lambda")
 class LambdaFunction(Resources):
     """Lambda Function Resource für AWS Lambda Management"""
 
+    _diff_fields = (
+        'function_name', 'handler', 'runtime', 'role_arn', 'timeout', 'memory_size',
+        'environment_variables', 'layers', 'snap_start', 'code_sha256',
+        'reserved_concurrency', 'alias', 'provisioned_concurrency', 'warmer'
+    )
+
+    # Base64 SHA-256 of the deployment package (Lambda's CodeSha256). For a local
+    # definition it is taken from the package cache on first access.
+    code_sha256 = lazy_field()
+
+    # Concurrency and alias settings - fetched only when the diff reaches them
+    reserved_concurrency = lazy_field()
+    alias = lazy_field()
+    provisioned_concurrency = lazy_field(0)
+    warmer = lazy_field()
+
     def __init__(
         self,
         function_name: str,
@@ -25,8 +87,35 @@ class LambdaFunction(Resources):
         env: AwsEnviroment,
         environment_variables: dict = None,
         timeout: int = 30,
-        memory_size: int = 128
+        memory_size: int = 128,
+        artifact_bucket: Optional[str] = None,
+        layers: list = None,
+        optimize: Union[bool, OptimizeOptions] = False,
+        publish: bool = False,
+        alias: Optional[str] = None,
+        provisioned_concurrency: int = 0,
+        reserved_concurrency: Optional[int] = None,
+        snap_start: bool = False,
+        canary: Optional[CanaryConfig] = None,
+        warmer: Optional[WarmerConfig] = None
     ):
+        """
+        Args:
+            publish: Bei Änderungen eine neue Version veröffentlichen
+            alias: Name eines Alias auf die zuletzt veröffentlichte Version (impliziert publish)
+            provisioned_concurrency: Vorgewärmte Umgebungen auf dem Alias (0 = keine)
+            reserved_concurrency: Reservierte Concurrency der Function (None = unreserviert)
+            snap_start: SnapStart für veröffentlichte Versionen (python3.12+)
+            canary: Neue Versionen erst gewichtet über den Alias ausrollen (benötigt alias)
+            warmer: EventBridge Rule, die Umgebungen (des Alias) periodisch warm hält
+        """
+        if provisioned_concurrency and not alias:
+            raise ValueError(f"Lambda {function_name}: provisioned_concurrency benötigt einen alias")
+        if canary and not alias:
+            raise ValueError(f"Lambda {function_name}: canary benötigt einen alias")
+        if snap_start and runtime not in SNAP_START_RUNTIMES:
+            raise ValueError(f"Lambda {function_name}: SnapStart wird für {runtime} nicht unterstützt")
+
         self.function_name = function_name
         self.handler = handler
         self.runtime = runtime
@@ -36,22 +125,40 @@ class LambdaFunction(Resources):
         self.environment_variables = environment_variables or {}
         self.timeout = timeout
         self.memory_size = memory_size
+        # Optional S3 bucket ("{region}"/"{account}" placeholders allowed) for the code
+        self.artifact_bucket = artifact_bucket
+        # Layer version ARNs (LambdaLayer objects must already be deployed)
+        self.layers = [layer if isinstance(layer, str) else layer.get_arn() for layer in layers or []]
+        # Opt-in: precompiled bytecode and stripped non-runtime files (True = defaults)
+        self.optimize = OptimizeOptions() if optimize is True else (optimize or None)
+        self.publish = publish or alias is not None
+        self.alias = alias
+        self.provisioned_concurrency = provisioned_concurrency
+        self.reserved_concurrency = reserved_concurrency
+        self.snap_start = snap_start
+        self.canary = canary
+        self.warmer = warmer
+        # Size of the deployment package in bytes (CodeSize), known after get() or packaging
+        self.code_size: Optional[int] = None
+        self._package_entry: Optional[PackageEntry] = None
+        # Reused invoke client and its connection pool size (see _invoke_client)
+        self._invoke_client_pool: Optional[tuple] = None
+        self._client_lock = threading.Lock()
+        if code_path:
+            self.defer('code_sha256', lambda: self._package().code_sha256)
 
     @classmethod
     def get(cls, tech_id: str, env: AwsEnviroment) -> 'LambdaFunction':
         """Hole eine spezifische Lambda Function"""
         function_name = cls._extract_function_name(tech_id)
-        session = boto3.session.Session(
-            profile_name=env.profile,
-            region_name=env.region
-        )
+        session = create_session(env)
         lambda_client = session.client('lambda')
 
         try:
-            response = lambda_client.get_function(FunctionName=function_name)
-            config = response['Configuration']
+            # Configuration only - get_function would also presign a code download URL
+            config = lambda_client.get_function_configuration(FunctionName=function_name)
 
-            return cls(
+            lambda_function = cls(
                 function_name=config['FunctionName'],
                 handler=config['Handler'],
                 runtime=config['Runtime'],
@@ -60,10 +167,22 @@ class LambdaFunction(Resources):
                 env=env,
                 environment_variables=config.get('Environment', {}).get('Variables', {}),
                 timeout=config['Timeout'],
-                memory_size=config['MemorySize']
+                memory_size=config['MemorySize'],
+                layers=[layer['Arn'] for layer in config.get('Layers', [])]
             )
+            lambda_function.snap_start = config.get('SnapStart', {}).get('ApplyOn') == 'PublishedVersions'
+            lambda_function.code_sha256 = config.get('CodeSha256')
+            lambda_function.code_size = config.get('CodeSize')
+            lambda_function.defer('reserved_concurrency', lambda: lambda_client.get_function_concurrency(
+                FunctionName=function_name).get('ReservedConcurrentExecutions'))
+            lambda_function.defer('alias', lambda: cls._fetch_alias(lambda_client, function_name))
+            lambda_function.defer('provisioned_concurrency', lambda: cls._fetch_provisioned_concurrency(
+                lambda_client, function_name, lambda_function.alias))
+            lambda_function.defer('warmer', lambda: WarmerConfig.from_rule(
+                ScheduleRule.get(cls._warmer_rule_name(function_name), env)))
+            return lambda_function
         except lambda_client.exceptions.ResourceNotFoundException:
-            return cls(
+            lambda_function = cls(
                 function_name=function_name,
                 handler="index.handler",
                 runtime="python3.13",
@@ -71,226 +190,321 @@ class LambdaFunction(Resources):
                 role_arn="",
                 env=env
             )
+            lambda_function._missing = True
+            return lambda_function
         except Exception as e:
-            print(f"Fehler beim Abrufen der Lambda Function {function_name}: {e}")
+            logger.error(f"Fehler beim Abrufen der Lambda Function {function_name}: {e}")
             raise
 
     def create(self) -> str:
         """Erstelle eine neue Lambda Function oder verwende existierende"""
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         lambda_client = session.client('lambda')
-        iam_client = session.client('iam')
 
         try:
             existing_function = lambda_client.get_function(FunctionName=self.function_name)
-            print(f"Lambda Function existiert bereits: {self.function_name}")
+            logger.info(f"Lambda Function existiert bereits: {self.function_name}")
             arn = existing_function['Configuration']['FunctionArn']
 
             return self.update(arn, self)
 
         except lambda_client.exceptions.ResourceNotFoundException:
-            # Wait for role to be propagated before creating Lambda
-            self._wait_for_role_propagation(lambda_client, iam_client)
-
-            zip_file = self._create_deployment_package()
+            package = self._package()
+
+            function_config = {
+                'FunctionName': self.function_name,
+                'Runtime': self.runtime,
+                'Role': self.role_arn,
+                'Handler': self.handler,
+                'Code': self._code_location(package),
+                'Timeout': self.timeout,
+                'MemorySize': self.memory_size
+            }
 
-            try:
-                with open(zip_file, 'rb') as f:
-                    zip_content = f.read()
-
-                function_config = {
-                    'FunctionName': self.function_name,
-                    'Runtime': self.runtime,
-                    'Role': self.role_arn,
-                    'Handler': self.handler,
-                    'Code': {'ZipFile': zip_content},
-                    'Timeout': self.timeout,
-                    'MemorySize': self.memory_size
+            if self.environment_variables:
+                function_config['Environment'] = {
+                    'Variables': self.environment_variables
                 }
 
-                if self.environment_variables:
-                    function_config['Environment'] = {
-                        'Variables': self.environment_variables
-                    }
+            if self.layers:
+                function_config['Layers'] = self.layers
 
-                response = lambda_client.create_function(**function_config)
+            if self.snap_start:
+                function_config['SnapStart'] = {'ApplyOn': 'PublishedVersions'}
 
-                arn = response['FunctionArn']
-                print(f"Lambda Function erstellt: {self.function_name}")
-                print(f"ARN: {arn}")
-                print(f"Runtime: {self.runtime}")
-                print(f"Handler: {self.handler}")
+            response = self._with_role_retry(lambda_client, lambda_client.create_function, **function_config)
 
-                return arn
+            arn = response['FunctionArn']
+            logger.info(f"Lambda Function erstellt: {self.function_name}")
+            logger.info(f"ARN: {arn}")
+            logger.info(f"Runtime: {self.runtime}")
+            logger.info(f"Handler: {self.handler}")
 
-            finally:
-                if os.path.exists(zip_file):
-                    os.remove(zip_file)
+            self._apply_concurrency(lambda_client, self.function_name, existing=False)
+            self._apply_warmer(arn, existing=False)
+            return arn
 
     def update(self, deployed_tech_id: str, new_value: 'LambdaFunction') -> str:
         """Update eine Lambda Function"""
         function_name = self._extract_function_name(deployed_tech_id)
 
-        session = boto3.session.Session(
-            profile_name=new_value.env.profile,
-            region_name=new_value.env.region
-        )
+        session = create_session(new_value.env)
         lambda_client = session.client('lambda')
 
         try:
-            lambda_client.get_function(FunctionName=function_name)
+            existing_function = lambda_client.get_function(FunctionName=function_name)
         except lambda_client.exceptions.ResourceNotFoundException:
-            print(f"Lambda Function {function_name} existiert nicht, erstelle neue...")
+            logger.info(f"Lambda Function {function_name} existiert nicht, erstelle neue...")
             return new_value.create()
 
-        zip_file = new_value._create_deployment_package()
-
-        try:
-            with open(zip_file, 'rb') as f:
-                zip_content = f.read()
+        package = new_value._package()
 
+        if package.code_sha256 == existing_function['Configuration'].get('CodeSha256'):
+            logger.info(f"Lambda Code unverändert: {function_name}")
+        else:
             lambda_client.update_function_code(
                 FunctionName=function_name,
-                ZipFile=zip_content
+                **new_value._code_location(package)
             )
-            print(f"Lambda Code aktualisiert: {function_name}")
+            logger.info(f"Lambda Code aktualisiert: {function_name}")
 
-            print(f"Warte auf Code Update Abschluss...")
+            logger.info(f"Warte auf Code Update Abschluss...")
             new_value._wait_for_function_update(lambda_client, function_name)
 
-            iam_client = session.client('iam')
-            current_config = lambda_client.get_function(FunctionName=function_name)
-            current_role = current_config['Configuration']['Role']
-
-            config_updates = {
-                'FunctionName': function_name,
-                'Runtime': new_value.runtime,
-                'Role': new_value.role_arn,
-                'Handler': new_value.handler,
-                'Timeout': new_value.timeout,
-                'MemorySize': new_value.memory_size
+        config_updates = {
+            'FunctionName': function_name,
+            'Runtime': new_value.runtime,
+            'Role': new_value.role_arn,
+            'Handler': new_value.handler,
+            'Timeout': new_value.timeout,
+            'MemorySize': new_value.memory_size,
+            'Layers': new_value.layers,
+            'SnapStart': {'ApplyOn': 'PublishedVersions' if new_value.snap_start else 'None'}
+        }
+
+        if new_value.environment_variables:
+            config_updates['Environment'] = {
+                'Variables': new_value.environment_variables
             }
 
-            if new_value.environment_variables:
-                config_updates['Environment'] = {
-                    'Variables': new_value.environment_variables
-                }
-
-            response = lambda_client.update_function_configuration(**config_updates)
-
-            arn = response['FunctionArn']
-            print(f"Lambda Configuration aktualisiert: {function_name}")
+        response = new_value._with_role_retry(
+            lambda_client, lambda_client.update_function_configuration, **config_updates)
 
-            return arn
+        arn = response['FunctionArn']
+        logger.info(f"Lambda Configuration aktualisiert: {function_name}")
 
-        finally:
-            if os.path.exists(zip_file):
-                os.remove(zip_file)
+        new_value._apply_concurrency(lambda_client, function_name)
+        new_value._apply_warmer(arn)
+        return arn
 
     def delete(self, tech_id: str):
         """Lösche eine Lambda Function"""
         function_name = self._extract_function_name(tech_id)
 
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         lambda_client = session.client('lambda')
 
         try:
             lambda_client.delete_function(FunctionName=function_name)
-            print(f"Lambda Function gelöscht: {function_name}")
+            logger.info(f"Lambda Function gelöscht: {function_name}")
+            rule_name = self._warmer_rule_name(function_name)
+            ScheduleRule(rule_name, "", self.env).delete(rule_name)
         except lambda_client.exceptions.ResourceNotFoundException:
-            print(f"Lambda Function existiert nicht: {function_name}")
+            logger.info(f"Lambda Function existiert nicht: {function_name}")
         except Exception as e:
-            print(f"Fehler beim Löschen der Lambda Function: {e}")
+            logger.error(f"Fehler beim Löschen der Lambda Function: {e}")
             raise
 
-    def _create_deployment_package(self) -> str:
-        """Erstelle ZIP Deployment Package"""
-        if not self.code_path.exists():
-            raise FileNotFoundError(f"Code Pfad existiert nicht: {self.code_path}")
-
-        temp_dir = tempfile.mkdtemp()
-        zip_path = os.path.join(temp_dir, f"{self.function_name}.zip")
+    def get_arn(self) -> str:
+        """ARN der Function ($LATEST)"""
+        if self._tech_id:
+            return self._tech_id
+        return f"arn:aws:lambda:{self.env.region}:{self.env.account}:function:{self.function_name}"
+
+    def get_alias_arn(self) -> str:
+        """ARN des Alias - als lambda_arn einer ApiGateway Route vermeidet er Cold Starts"""
+        if not self.alias:
+            raise ValueError(f"Lambda Function {self.function_name} hat keinen alias")
+        return f"{self.get_arn()}:{self.alias}"
+
+    def _apply_concurrency(self, lambda_client, function_name: str, existing: bool = True) -> None:
+        """Reserved Concurrency, Version, Alias und Provisioned Concurrency abgleichen"""
+        if self.reserved_concurrency is not None:
+            lambda_client.put_function_concurrency(
+                FunctionName=function_name,
+                ReservedConcurrentExecutions=self.reserved_concurrency
+            )
+            logger.info(f"Reserved Concurrency: {self.reserved_concurrency}")
+        elif existing:
+            lambda_client.delete_function_concurrency(FunctionName=function_name)
+
+        if not self.publish:
+            return
+
+        # publish_version fails while an update is in progress
+        self._wait_for_function_update(lambda_client, function_name)
+        # Lambda returns the latest version instead of a new one if nothing changed
+        version = lambda_client.publish_version(
+            FunctionName=function_name,
+            CodeSha256=self._package().code_sha256
+        )['Version']
+        logger.info(f"Lambda Version veröffentlicht: {function_name}:{version}")
+        if self.snap_start:
+            logger.info(f"Warte auf SnapStart Snapshot...")
+            self._wait_for_function_update(lambda_client, function_name, qualifier=version)
+
+        if not self.alias:
+            return
 
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                if self.code_path.is_file():
-                    zipf.write(self.code_path, arcname=self.code_path.name)
-                else:
-                    for file_path in self.code_path.rglob('*'):
-                        if file_path.is_file():
-                            if any(part.startswith('.') for part in file_path.parts):
-                                continue
-                            if '__pycache__' in file_path.parts:
-                                continue
-                            if file_path.suffix in ['.pyc', '.pyo']:
-                                continue
-                            if file_path.name in ['test_lambda.py', 'README.md', 'pyproject.toml', '.python-version']:
-                                continue
-
-                            arcname = file_path.relative_to(self.code_path)
-                            zipf.write(file_path, arcname=arcname)
-                            print(f"  Packe: {arcname}")
-
-            print(f"Deployment Package erstellt: {zip_path}")
-            return zip_path
+            current = lambda_client.get_alias(FunctionName=function_name, Name=self.alias)['FunctionVersion']
+            if self.canary and current != version:
+                result = Canary(self, self.alias, current, version, self.canary).run()
+                if not result.promoted:
+                    raise CanaryRollbackError(
+                        f"Lambda {function_name}: Version {version} verworfen - {result.reason}", result)
+            else:
+                # Also clears the weights of an interrupted canary
+                self.route_alias(self.alias, version, lambda_client=lambda_client)
+                logger.info(f"Alias {self.alias} → Version {version}")
+        except lambda_client.exceptions.ResourceNotFoundException:
+            lambda_client.create_alias(FunctionName=function_name, Name=self.alias, FunctionVersion=version,
+                                       Description=ALIAS_DESCRIPTION)
+            logger.info(f"Alias erstellt: {self.alias} → Version {version}")
 
-        except Exception as e:
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
-            raise e
+        if self.provisioned_concurrency:
+            response = lambda_client.put_provisioned_concurrency_config(
+                FunctionName=function_name,
+                Qualifier=self.alias,
+                ProvisionedConcurrentExecutions=self.provisioned_concurrency
+            )
+            # Allocation takes minutes - the alias serves on-demand until it is READY
+            logger.info(f"Provisioned Concurrency: {self.provisioned_concurrency} ({response.get('Status')})")
+        else:
+            try:
+                lambda_client.delete_provisioned_concurrency_config(FunctionName=function_name,
+                                                                    Qualifier=self.alias)
+            except lambda_client.exceptions.ProvisionedConcurrencyConfigNotFoundException:
+                pass
+
+    def route_alias(self, alias: str, version: str, canary_version: Optional[str] = None, weight: float = 0.0,
+                    lambda_client=None) -> None:
+        """Alias auf version, optional mit Anteil weight des Traffics auf canary_version"""
+        lambda_client = lambda_client or create_session(self.env).client('lambda')
+        lambda_client.update_alias(
+            FunctionName=self.function_name,
+            Name=alias,
+            FunctionVersion=version,
+            RoutingConfig={'AdditionalVersionWeights': {canary_version: weight} if canary_version else {}}
+        )
 
-    def _wait_for_role_propagation(self, lambda_client, iam_client):
-        """Warte bis IAM Role vollständig propagiert ist und von Lambda angenommen werden kann"""
-        import time
+    def _apply_warmer(self, function_arn: str, existing: bool = True) -> None:
+        """Warmer Rule anlegen/angleichen oder (falls vorhanden) entfernen"""
+        warmer = self.warmer
+        rule_name = self._warmer_rule_name(self.function_name)
+        if warmer is None:
+            if existing:
+                ScheduleRule(rule_name, "", self.env).delete(rule_name)
+            return
+
+        # Warm the environments that serve traffic - those of the alias
+        target_arn = f"{self._unqualified_arn(function_arn)}:{self.alias}" if self.alias else function_arn
+        ScheduleRule(
+            rule_name,
+            warmer.schedule_expression,
+            self.env,
+            targets=warmer.targets(target_arn),
+            description=f"Warmer für {self.function_name} ({warmer.concurrency}x)"
+        ).create()
 
-        max_attempts = 120
-        for attempt in range(max_attempts):
-            try:
-                # Try to get the role - this ensures it exists
-                role_name = self.role_arn.split('/')[-1]
-                iam_client.get_role(RoleName=role_name)
+    @staticmethod
+    def _warmer_rule_name(function_name: str) -> str:
+        return f"{function_name}-warmer"
 
-                if attempt > 0:
-                    print(f"IAM Role bereit für Lambda")
-                return
-            except Exception as e:
-                if attempt < max_attempts - 1:
-                    if attempt % 10 == 0 and attempt > 0:
-                        print(f"  Warte auf IAM Role Propagation... ({attempt}s)")
-                    time.sleep(1)
-                else:
-                    print(f"Warnung: IAM Role Propagation timeout nach {max_attempts}s, versuche trotzdem...")
-                    return
+    @staticmethod
+    def _unqualified_arn(arn: str) -> str:
+        return ':'.join(arn.split(':')[:7])
 
-    def _wait_for_function_update(self, lambda_client, function_name):
-        """Warte bis Lambda Function Update abgeschlossen ist"""
-        import time
+    @staticmethod
+    def _fetch_alias(lambda_client, function_name: str) -> Optional[str]:
+        """Name des von myzel verwalteten Alias (None wenn keiner existiert)"""
+        for page in lambda_client.get_paginator('list_aliases').paginate(FunctionName=function_name):
+            for alias in page['Aliases']:
+                if alias.get('Description') == ALIAS_DESCRIPTION:
+                    return alias['Name']
+        return None
 
-        max_attempts = 30
+    @staticmethod
+    def _fetch_provisioned_concurrency(lambda_client, function_name: str, alias: Optional[str]) -> int:
+        if not alias:
+            return 0
+        try:
+            response = lambda_client.get_provisioned_concurrency_config(FunctionName=function_name, Qualifier=alias)
+            return response['RequestedProvisionedConcurrentExecutions']
+        except lambda_client.exceptions.ProvisionedConcurrencyConfigNotFoundException:
+            return 0
+
+    def _package(self) -> PackageEntry:
+        """Hole das Deployment Package aus dem Content-addressed Cache (baut es bei Bedarf)"""
+        if self._package_entry is None:
+            # Prefer the package built ahead of time by the deployment's PackagePool
+            pool = package_pool.active()
+            entry = pool.result(self.code_path, self.optimize, self.runtime) if pool is not None else None
+            self._package_entry = entry or package_cache.package(
+                self.code_path, self.function_name, self.optimize, self.runtime)
+            self.code_size = self._package_entry.size
+        return self._package_entry
+
+    def _code_location(self, package: PackageEntry) -> dict:
+        """Inline ZIP oder S3 Location aus dem Artifact Store"""
+        if self.artifact_bucket:
+            return artifact_store(self.artifact_bucket, self.env).upload(package)
+        return {'ZipFile': package.zip_bytes}
+
+    def _with_role_retry(self, lambda_client, operation, **params) -> dict:
+        """Rufe operation auf, wiederhole nur solange Lambda die IAM Role noch nicht annehmen kann"""
+        delay = ROLE_RETRY_BASE_DELAY
+        for attempt in range(1, ROLE_RETRY_ATTEMPTS + 1):
+            try:
+                return operation(**params)
+            except lambda_client.exceptions.InvalidParameterValueException as e:
+                if not _role_not_assumable(e) or attempt == ROLE_RETRY_ATTEMPTS:
+                    raise
+                logger.info(f"  IAM Role noch nicht propagiert, neuer Versuch in {delay:.1f}s...")
+                events.active().wait(f"lambda:{self.function_name}", "role propagation", attempt, delay)
+                check_deadline()
+                time.sleep(delay)
+                delay = min(delay * 2, ROLE_RETRY_MAX_DELAY)
+
+    def _wait_for_function_update(self, lambda_client, function_name, qualifier: str = "$LATEST"):
+        """Warte bis Lambda Function Update (bzw. die Version) abgeschlossen ist"""
+        # SnapStart versions take a couple of minutes until the snapshot is ready
+        max_attempts = 30 if qualifier == "$LATEST" else 120
         for attempt in range(max_attempts):
             try:
-                response = lambda_client.get_function(FunctionName=function_name)
+                with uncached():
+                    response = lambda_client.get_function(FunctionName=function_name, Qualifier=qualifier)
                 state = response['Configuration']['State']
                 last_update_status = response['Configuration']['LastUpdateStatus']
 
                 if state == 'Active' and last_update_status == 'Successful':
-                    print(f"Lambda Function Update abgeschlossen")
+                    logger.info(f"Lambda Function Update abgeschlossen")
                     return
 
                 if last_update_status == 'Failed':
                     raise Exception(f"Lambda Update fehlgeschlagen")
 
-                print(f"  Warte auf Update... (State: {state}, Status: {last_update_status})")
+                logger.info(f"  Warte auf Update... (State: {state}, Status: {last_update_status})")
+                events.active().wait(f"lambda:{function_name}", "function update", attempt + 1, 2)
+                check_deadline()
                 time.sleep(2)
 
+            except DeadlineExceededError:
+                raise
             except Exception as e:
                 if 'Update' in str(e) or 'progress' in str(e):
+                    events.active().wait(f"lambda:{function_name}", "function update", attempt + 1, 2)
+                    check_deadline()
                     time.sleep(2)
                 else:
                     raise
@@ -305,48 +519,144 @@ class LambdaFunction(Resources):
     def __repr__(self) -> str:
         return f"LambdaFunction(name='{self.function_name}', runtime='{self.runtime}')"
 
-    def invoke(self, payload: dict = None, invocation_type: str = "RequestResponse") -> dict:
+    def invoke(self, payload: dict = None, invocation_type: str = "RequestResponse",
+               log_type: Optional[str] = None, qualifier: Optional[str] = None) -> dict:
         """Invoke the Lambda function
 
         Args:
             payload: JSON payload to send to the Lambda (dict)
             invocation_type: "RequestResponse" (sync) or "Event" (async)
+            log_type: "Tail" returns the last 4 KB of the execution log (incl. REPORT line)
+            qualifier: Version or alias to invoke (default $LATEST)
 
         Returns:
-            Response dict with StatusCode and Payload
+            Response dict with StatusCode and Payload (plus FunctionError and
+            the decoded LogResult if requested)
         """
-        import json
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
-        lambda_client = session.client('lambda')
-
         try:
-            response = lambda_client.invoke(
-                FunctionName=self.function_name,
-                InvocationType=invocation_type,
-                Payload=json.dumps(payload or {})
-            )
+            return self._invoke_once(self._invoke_client(), payload, invocation_type, log_type, qualifier)
+        except Exception as e:
+            logger.error(f"Fehler beim Aufrufen der Lambda {self.function_name}: {e}")
+            raise
+
+    def invoke_many(
+        self,
+        payloads: Iterable[dict],
+        concurrency: int = 16,
+        invocation_type: str = "RequestResponse",
+        log_type: Optional[str] = None,
+        qualifier: Optional[str] = None
+    ) -> Iterator['InvocationResult']:
+        """Invoke die Function für viele Payloads parallel, Ergebnisse in Abschlussreihenfolge
+
+        Payloads are consumed lazily: at most `concurrency` calls are in
+        flight, the next payload is only taken once a result was handed out
+        (backpressure - a generator of millions of payloads is fine). All
+        calls share one client with a connection pool of matching size.
+        Errors are captured per call instead of aborting the batch.
+        """
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        client = self._invoke_client(concurrency)
+        payloads = iter(enumerate(payloads))
+        in_flight = set()
 
-            # For async invocations (Event), there's no payload returned
-            response_payload = None
-            if invocation_type == "Event":
-                # Async invocation doesn't return payload
-                response_payload = None
+        def call(index: int, payload: dict) -> InvocationResult:
+            started = time.perf_counter()
+            try:
+                response = self._invoke_once(client, payload, invocation_type, log_type, qualifier)
+                return InvocationResult(index, payload, response['StatusCode'], response['Payload'],
+                                        (time.perf_counter() - started) * 1000,
+                                        function_error=response.get('FunctionError'),
+                                        log_result=response.get('LogResult'))
+            except Exception as e:
+                return InvocationResult(index, payload, None, None, (time.perf_counter() - started) * 1000,
+                                        error=f"{type(e).__name__}: {e}")
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"invoke-{self.function_name}") as pool:
+            for index, payload in itertools.islice(payloads, concurrency):
+                in_flight.add(pool.submit(call, index, payload))
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+                    for index, payload in itertools.islice(payloads, 1):
+                        in_flight.add(pool.submit(call, index, payload))
+
+    def _invoke_client(self, pool_size: int = MIN_POOL_CONNECTIONS):
+        """Wiederverwendeter Lambda Client (thread-safe) mit ausreichend großem Connection Pool"""
+        from botocore.config import Config
+
+        pool_size = max(pool_size, MIN_POOL_CONNECTIONS)
+        with self._client_lock:
+            client, size = self._invoke_client_pool or (None, 0)
+            if client is None or size < pool_size:
+                client = create_session(self.env).client(
+                    'lambda', config=Config(max_pool_connections=pool_size))
+                self._invoke_client_pool = (client, pool_size)
+            return client
+
+    def _invoke_once(self, lambda_client, payload: Optional[dict], invocation_type: str,
+                     log_type: Optional[str], qualifier: Optional[str]) -> dict:
+        params = {
+            'FunctionName': self.function_name,
+            'InvocationType': invocation_type,
+            'Payload': json.dumps(payload or {})
+        }
+        if log_type:
+            params['LogType'] = log_type
+        if qualifier:
+            params['Qualifier'] = qualifier
+
+        response = lambda_client.invoke(**params)
+
+        # For async invocations (Event), there's no payload returned
+        response_payload = None
+        if invocation_type != "Event":
+            # Sync invocation returns payload
+            payload_data = response.get('Payload', b'{}')
+            if hasattr(payload_data, 'read'):
+                payload_str = payload_data.read()
+                response_payload = json.loads(payload_str) if payload_str else None
             else:
-                # Sync invocation returns payload
-                payload_data = response.get('Payload', b'{}')
-                if hasattr(payload_data, 'read'):
-                    payload_str = payload_data.read()
-                    response_payload = json.loads(payload_str) if payload_str else None
-                else:
-                    response_payload = payload_data
+                response_payload = payload_data
+
+        result = {
+            'StatusCode': response['StatusCode'],
+            'Payload': response_payload
+        }
+        if 'FunctionError' in response:
+            result['FunctionError'] = response['FunctionError']
+        if 'LogResult' in response:
+            result['LogResult'] = base64.b64decode(response['LogResult']).decode('utf-8', 'replace')
+        return result
+
+    def reconfigure(self, **changes) -> None:
+        """Reine Konfigurationsänderung (ohne Code/Version), z.B. memory_size=512
+
+        Updates the attributes and $LATEST in place and waits until the update
+        is done. Every configuration update starts fresh execution environments.
+        """
+        fields = {
+            'memory_size': 'MemorySize',
+            'timeout': 'Timeout',
+            'environment_variables': 'Environment',
+        }
+        unknown = set(changes) - set(fields)
+        if unknown:
+            raise ValueError(f"Nicht konfigurierbar: {', '.join(sorted(unknown))}")
+
+        params = {'FunctionName': self.function_name}
+        for name, value in changes.items():
+            setattr(self, name, value)
+            params[fields[name]] = {'Variables': value} if name == 'environment_variables' else value
+
+        session = create_session(self.env)
+        lambda_client = session.client('lambda')
+        lambda_client.update_function_configuration(**params)
+        self._wait_for_function_update(lambda_client, self.function_name)
 
-            return {
-                'StatusCode': response['StatusCode'],
-                'Payload': response_payload
-            }
-        except Exception as e:
-            print(f"Fehler beim Aufrufen der Lambda {self.function_name}: {e}")
-            raise
+
+def _role_not_assumable(error) -> bool:
+    """InvalidParameterValueException wegen einer (noch) nicht annehmbaren Role"""
+    return "cannot be assumed" in error.response.get('Error', {}).get('Message', '')
@@ -0,0 +1,215 @@
+from typing import Optional
+
+from src.core.log import get_logger
+from src.core.session import create_session
+from src.model import AwsEnviroment, Resources
+from src.model.registry import register_resource
+
+logger = get_logger("lambda_function_url")
+
+AUTH_TYPES = ("NONE", "AWS_IAM")
+INVOKE_MODES = ("BUFFERED", "RESPONSE_STREAM")
+
+# CORS keys of the constructor -> Lambda API
+CORS_FIELDS = {
+    "allow_origins": "AllowOrigins",
+    "allow_methods": "AllowMethods",
+    "allow_headers": "AllowHeaders",
+    "expose_headers": "ExposeHeaders",
+    "max_age": "MaxAge",
+    "allow_credentials": "AllowCredentials",
+}
+
+# Public URLs need both statements (InvokeFunctionUrl plus InvokeFunction via the URL)
+PUBLIC_STATEMENTS = ("function-url-public", "function-url-invoke")
+
+
+@register_resource("lambda_function_url")
+class LambdaFunctionUrl(Resources):
+    """Lambda Function URL Resource - HTTPS Endpoint direkt auf einer Function, ohne API Gateway"""
+
+    _diff_fields = ('function_name', 'qualifier', 'auth_type', 'invoke_mode', 'cors')
+
+    def __init__(
+        self,
+        function_name: str,
+        env: AwsEnviroment,
+        auth_type: str = "NONE",
+        cors: Optional[dict] = None,
+        qualifier: Optional[str] = None,
+        invoke_mode: str = "BUFFERED"
+    ):
+        """
+        Args:
+            function_name: Name der Lambda Function
+            auth_type: "NONE" (öffentlich) oder "AWS_IAM" (nur SigV4 signierte Requests)
+            cors: CORS Config, z.B.:
+                {
+                    "allow_origins": ["https://example.com"],
+                    "allow_methods": ["GET"],
+                    "allow_headers": ["content-type"],
+                    "expose_headers": [],
+                    "max_age": 300,
+                    "allow_credentials": False
+                }
+            qualifier: Alias der Function (z.B. "live" aus LambdaFunction(alias=...))
+            invoke_mode: "BUFFERED" oder "RESPONSE_STREAM"
+        """
+        if auth_type not in AUTH_TYPES:
+            raise ValueError(f"Function URL {function_name}: unbekannter auth_type {auth_type}")
+        if invoke_mode not in INVOKE_MODES:
+            raise ValueError(f"Function URL {function_name}: unbekannter invoke_mode {invoke_mode}")
+        unknown = set(cors or {}) - set(CORS_FIELDS)
+        if unknown:
+            raise ValueError(f"Function URL {function_name}: unbekannte CORS Felder {', '.join(sorted(unknown))}")
+
+        self.function_name = function_name
+        self.env = env
+        self.auth_type = auth_type
+        self.cors = cors or {}
+        self.qualifier = qualifier
+        self.invoke_mode = invoke_mode
+        # https://<id>.lambda-url.<region>.on.aws/ - known after create() or get()
+        self.function_url: Optional[str] = None
+
+    @classmethod
+    def get(cls, tech_id: str, env: AwsEnviroment) -> 'LambdaFunctionUrl':
+        """Hole die Function URL Config (tech_id ist die ggf. qualifizierte Function ARN)"""
+        function_name, qualifier = cls._split_arn(tech_id)
+        session = create_session(env)
+        lambda_client = session.client('lambda')
+
+        try:
+            config = lambda_client.get_function_url_config(**cls._function_params(function_name, qualifier))
+            function_url = cls(
+                function_name=function_name,
+                env=env,
+                auth_type=config['AuthType'],
+                cors={name: config['Cors'][key] for name, key in CORS_FIELDS.items()
+                      if key in config.get('Cors', {})},
+                qualifier=qualifier,
+                invoke_mode=config.get('InvokeMode', 'BUFFERED')
+            )
+            function_url.function_url = config['FunctionUrl']
+            return function_url
+        except lambda_client.exceptions.ResourceNotFoundException:
+            function_url = cls(function_name=function_name, env=env, qualifier=qualifier)
+            function_url._missing = True
+            return function_url
+        except Exception as e:
+            logger.error(f"Fehler beim Abrufen der Function URL {tech_id}: {e}")
+            raise
+
+    def create(self) -> str:
+        """Erstelle die Function URL oder gleiche eine existierende an"""
+        session = create_session(self.env)
+        lambda_client = session.client('lambda')
+
+        config = {
+            **self._function_params(self.function_name, self.qualifier),
+            'AuthType': self.auth_type,
+            'Cors': {key: self.cors[name] for name, key in CORS_FIELDS.items() if name in self.cors},
+            'InvokeMode': self.invoke_mode,
+        }
+        try:
+            lambda_client.get_function_url_config(**self._function_params(self.function_name, self.qualifier))
+            response = lambda_client.update_function_url_config(**config)
+            logger.info(f"Function URL aktualisiert: {self.function_name}")
+        except lambda_client.exceptions.ResourceNotFoundException:
+            response = lambda_client.create_function_url_config(**config)
+            logger.info(f"Function URL erstellt: {self.function_name}")
+
+        self.function_url = response['FunctionUrl']
+        logger.info(f"URL: {self.function_url} (Auth: {self.auth_type})")
+
+        if self.auth_type == "NONE":
+            self._add_public_permissions(lambda_client)
+        else:
+            self._remove_public_permissions(lambda_client)
+        return response['FunctionArn']
+
+    def update(self, deployed_tech_id: str, new_value: 'LambdaFunctionUrl') -> str:
+        """Update eine Function URL - bei anderer Function/Alias wird die alte URL gelöscht"""
+        if self._split_arn(deployed_tech_id) != (new_value.function_name, new_value.qualifier):
+            logger.info(f"Function URL zieht um: {deployed_tech_id} → {new_value.function_name}")
+            self.delete(deployed_tech_id)
+        return new_value.create()
+
+    def delete(self, tech_id: str):
+        """Lösche eine Function URL samt öffentlicher Permissions"""
+        function_name, qualifier = self._split_arn(tech_id)
+        session = create_session(self.env)
+        lambda_client = session.client('lambda')
+
+        try:
+            lambda_client.delete_function_url_config(**self._function_params(function_name, qualifier))
+            logger.info(f"Function URL gelöscht: {function_name}")
+        except lambda_client.exceptions.ResourceNotFoundException:
+            logger.info(f"Function URL existiert nicht: {function_name}")
+            return
+        except Exception as e:
+            logger.error(f"Fehler beim Löschen der Function URL: {e}")
+            raise
+
+        target = LambdaFunctionUrl(function_name, self.env, qualifier=qualifier)
+        target._remove_public_permissions(lambda_client)
+
+    def get_url(self) -> str:
+        """URL der deployten Function URL (z.B. als CloudFront Origin)"""
+        if self.function_url:
+            return self.function_url
+        lambda_client = create_session(self.env).client('lambda')
+        try:
+            config = lambda_client.get_function_url_config(
+                **self._function_params(self.function_name, self.qualifier))
+        except lambda_client.exceptions.ResourceNotFoundException:
+            raise ValueError(f"Function URL {self.function_name} ist noch nicht deployed")
+        self.function_url = config['FunctionUrl']
+        return self.function_url
+
+    def _add_public_permissions(self, lambda_client) -> None:
+        permissions = (
+            {'Action': 'lambda:InvokeFunctionUrl', 'FunctionUrlAuthType': 'NONE'},
+            {'Action': 'lambda:InvokeFunction', 'InvokedViaFunctionUrl': True},
+        )
+        for statement_id, permission in zip(PUBLIC_STATEMENTS, permissions):
+            try:
+                lambda_client.add_permission(
+                    **self._function_params(self.function_name, self.qualifier),
+                    StatementId=statement_id,
+                    Principal='*',
+                    **permission
+                )
+                logger.info(f"  Öffentliche Permission hinzugefügt: {permission['Action']}")
+            except lambda_client.exceptions.ResourceConflictException:
+                logger.info(f"  Öffentliche Permission existiert bereits: {permission['Action']}")
+
+    def _remove_public_permissions(self, lambda_client) -> None:
+        for statement_id in PUBLIC_STATEMENTS:
+            try:
+                lambda_client.remove_permission(
+                    **self._function_params(self.function_name, self.qualifier),
+                    StatementId=statement_id
+                )
+                logger.info(f"  Öffentliche Permission entfernt: {statement_id}")
+            except lambda_client.exceptions.ResourceNotFoundException:
+                pass
+
+    @staticmethod
+    def _function_params(function_name: str, qualifier: Optional[str]) -> dict:
+        params = {'FunctionName': function_name}
+        if qualifier:
+            params['Qualifier'] = qualifier
+        return params
+
+    @staticmethod
+    def _split_arn(arn: str) -> tuple[str, Optional[str]]:
+        """Function ARN (ggf. mit Alias) -> (Function Name, Alias)"""
+        parts = arn.split(':')
+        if len(parts) < 7:
+            return arn, None
+        return parts[6], parts[7] if len(parts) > 7 else None
+
+    def __repr__(self) -> str:
+        qualifier = f":{self.qualifier}" if self.qualifier else ""
+        return f"LambdaFunctionUrl(function='{self.function_name}{qualifier}', auth='{self.auth_type}')"
@@ -0,0 +1,180 @@
+from pathlib import Path
+from typing import Optional, Union
+
+from src.core.log import get_logger
+from src.core.session import create_session
+from src.model import AwsEnviroment, Resources, lazy_field
+from src.model.registry import register_resource
+from src.packaging import OptimizeOptions, artifact_store
+from src.packaging.layers import LayerBuilder, lock_hash, merge_locks
+
+logger = get_logger("lambda_layer")
+
+# The lock hash (dependencies plus optimize options) is stored in the layer version description
+DESCRIPTION_PREFIX = "myzel-lock:"
+
+
+@register_resource("lambda_layer")
+class LambdaLayer(Resources):
+    """
+    Lambda Layer Resource mit den gelockten Abhängigkeiten von Functions.
+
+    The layer is built offline from the uv.lock files of the given function
+    directories (see LayerBuilder) and published once per lock hash: an
+    existing layer version with the same lock hash is reused instead of
+    publishing a new one. The optimize options are part of the hash, so
+    switching them publishes a new version. Attach it via LambdaFunction(layers=[layer]).
+    """
+
+    _diff_fields = ('layer_name', 'runtime', 'architecture', 'lock_hash')
+
+    # Hash of the locked dependency set - computed from the uv.lock files on first access
+    lock_hash = lazy_field()
+
+    def __init__(
+        self,
+        layer_name: str,
+        env: AwsEnviroment,
+        function_dirs: list = None,
+        runtime: str = "python3.13",
+        architecture: str = "x86_64",
+        wheel_dir: Optional[str] = None,
+        artifact_bucket: Optional[str] = None,
+        optimize: Union[bool, OptimizeOptions] = False
+    ):
+        """
+        Args:
+            layer_name: Name des Layers
+            function_dirs: Function Verzeichnisse, deren uv.lock Abhängigkeiten in den Layer kommen
+            runtime: Kompatible Lambda Runtime (bestimmt die Wheel Tags)
+            architecture: x86_64 oder arm64
+            wheel_dir: Lokaler Wheel Cache (Default: MYZEL_WHEEL_DIR)
+            artifact_bucket: Optional, S3 Bucket für den Upload (siehe LambdaFunction)
+            optimize: Bytecode vorkompilieren und Tests/Docs/Stubs entfernen (True = Defaults)
+        """
+        self.layer_name = layer_name
+        self.env = env
+        self.function_dirs = [Path(d) for d in function_dirs or []]
+        self.runtime = runtime
+        self.architecture = architecture
+        self.wheel_dir = wheel_dir
+        self.artifact_bucket = artifact_bucket
+        self.optimize = OptimizeOptions() if optimize is True else (optimize or None)
+        if self.function_dirs:
+            self.defer('lock_hash', lambda: lock_hash(self._wheels(), self.runtime, self.architecture,
+                                                           self.optimize))
+
+    @classmethod
+    def get(cls, tech_id: str, env: AwsEnviroment) -> 'LambdaLayer':
+        """Hole eine spezifische Layer Version"""
+        session = create_session(env)
+        lambda_client = session.client('lambda')
+        layer_name = cls._extract_layer_name(tech_id)
+
+        try:
+            response = lambda_client.get_layer_version_by_arn(Arn=tech_id)
+            layer = cls(
+                layer_name=layer_name,
+                env=env,
+                runtime=(response.get('CompatibleRuntimes') or ["python3.13"])[0],
+                architecture=(response.get('CompatibleArchitectures') or ["x86_64"])[0]
+            )
+            layer.lock_hash = response.get('Description', '').removeprefix(DESCRIPTION_PREFIX)
+            return layer
+        except lambda_client.exceptions.ResourceNotFoundException:
+            layer = cls(layer_name=layer_name, env=env)
+            layer._missing = True
+            return layer
+        except Exception as e:
+            logger.error(f"Fehler beim Abrufen des Layers {tech_id}: {e}")
+            raise
+
+    def create(self) -> str:
+        """Veröffentliche eine Layer Version (oder verwende die mit gleichem Lock Hash)"""
+        session = create_session(self.env)
+        lambda_client = session.client('lambda')
+
+        existing = self._find_version(lambda_client)
+        if existing is not None:
+            logger.info(f"Lambda Layer existiert bereits: {self.layer_name} ({self.lock_hash[:12]})")
+            return existing
+
+        wheels = self._wheels()
+        if not wheels:
+            raise ValueError(f"Lambda Layer {self.layer_name}: keine gelockten Abhängigkeiten gefunden")
+
+        package = LayerBuilder(self.wheel_dir).build(wheels, self.runtime, self.architecture, self.layer_name,
+                                                     self.optimize)
+        if self.artifact_bucket:
+            content = artifact_store(self.artifact_bucket, self.env).upload(package)
+        else:
+            content = {'ZipFile': package.zip_bytes}
+
+        response = lambda_client.publish_layer_version(
+            LayerName=self.layer_name,
+            Description=f"{DESCRIPTION_PREFIX}{self.lock_hash}",
+            Content=content,
+            CompatibleRuntimes=[self.runtime],
+            CompatibleArchitectures=[self.architecture]
+        )
+
+        arn = response['LayerVersionArn']
+        logger.info(f"Lambda Layer veröffentlicht: {self.layer_name} v{response['Version']}")
+        logger.info(f"ARN: {arn}")
+        logger.info(f"Abhängigkeiten: {', '.join(f'{w.name}=={w.version}' for w in wheels)}")
+        return arn
+
+    def update(self, deployed_tech_id: str, new_value: 'LambdaLayer') -> str:
+        """Layer Versionen sind unveränderlich - veröffentliche eine neue Version"""
+        logger.info(f"Lambda Layer {new_value.layer_name}: Abhängigkeiten geändert, neue Version...")
+        # The old version stays until delete - functions may still reference it
+        return new_value.create()
+
+    def delete(self, tech_id: str):
+        """Lösche eine Layer Version"""
+        session = create_session(self.env)
+        lambda_client = session.client('lambda')
+
+        try:
+            lambda_client.delete_layer_version(
+                LayerName=self._extract_layer_name(tech_id),
+                VersionNumber=int(tech_id.split(':')[-1])
+            )
+            logger.info(f"Lambda Layer Version gelöscht: {tech_id}")
+        except lambda_client.exceptions.ResourceNotFoundException:
+            logger.info(f"Lambda Layer Version existiert nicht: {tech_id}")
+        except Exception as e:
+            logger.error(f"Fehler beim Löschen des Lambda Layers: {e}")
+            raise
+
+    def get_arn(self) -> str:
+        """ARN der deployten Layer Version"""
+        if not self._tech_id:
+            raise ValueError(f"Lambda Layer {self.layer_name} ist noch nicht deployed")
+        return self._tech_id
+
+    def _wheels(self):
+        return merge_locks(self.function_dirs, self.runtime, self.architecture)
+
+    def _find_version(self, lambda_client) -> Optional[str]:
+        """Suche eine Layer Version mit gleichem Lock Hash"""
+        if not self.function_dirs:
+            return None
+        description = f"{DESCRIPTION_PREFIX}{self.lock_hash}"
+        try:
+            paginator = lambda_client.get_paginator('list_layer_versions')
+            for page in paginator.paginate(LayerName=self.layer_name, CompatibleRuntime=self.runtime):
+                for version in page['LayerVersions']:
+                    if version.get('Description') == description:
+                        return version['LayerVersionArn']
+        except lambda_client.exceptions.ResourceNotFoundException:
+            pass
+        return None
+
+    @staticmethod
+    def _extract_layer_name(arn: str) -> str:
+        """arn:aws:lambda:region:account:layer:name:version -> name"""
+        return arn.split(':')[6]
+
+    def __repr__(self) -> str:
+        return f"LambdaLayer(name='{self.layer_name}', runtime='{self.runtime}')"
@@ -1,16 +1,23 @@
 import json
 
-import boto3
 from botocore.exceptions import ClientError
 
-from src.model import AwsEnviroment, Resources
+from src.core.log import ProgressCounter, get_logger
+from src.core.session import create_session
+from src.model import AwsEnviroment, Resources, lazy_field
 from src.model.registry import register_resource
 
+logger = get_logger("s3")
+
 
 @register_resource("s3")
 class S3(Resources):
     """S3 Resource für AWS Bucket Management"""
 
+    _diff_fields = ('bucket_name', 'policy')
+
+    policy = lazy_field()
+
     def __init__(
         self,
         bucket_name: str,
@@ -26,34 +33,33 @@ class S3(Resources):
     def get(cls, tech_id: str, env: AwsEnviroment) -> 'S3':
         """Hole einen spezifischen S3 Bucket aus ARN"""
         bucket_name = cls._extract_bucket_name(tech_id)
-        session = boto3.session.Session(
-            profile_name=env.profile,
-            region_name=env.region
-        )
+        session = create_session(env)
         s3_client = session.client('s3')
 
         try:
             s3_client.head_bucket(Bucket=bucket_name)
-            return cls(bucket_name=bucket_name, env=env)
+            bucket = cls(bucket_name=bucket_name, env=env)
+            # The bucket policy is only fetched when the diff compares it
+            bucket.defer('policy', lambda: cls._fetch_policy(s3_client, bucket_name))
+            return bucket
         except ClientError as e:
             if e.response['Error']['Code'] == '404':
-                return cls(bucket_name=bucket_name, env=env)
+                bucket = cls(bucket_name=bucket_name, env=env)
+                bucket._missing = True
+                return bucket
             raise
         except Exception as e:
-            print(f"Fehler beim Abrufen des Buckets {bucket_name}: {e}")
+            logger.error(f"Fehler beim Abrufen des Buckets {bucket_name}: {e}")
             raise
 
     def create(self) -> str:
         """Erstelle einen neuen S3 Bucket oder nutze existierenden"""
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         s3_client = session.client('s3')
 
         try:
             if self._bucket_exists(self.bucket_name, s3_client):
-                print(f"S3 Bucket '{self.bucket_name}' existiert bereits")
+                logger.info(f"S3 Bucket '{self.bucket_name}' existiert bereits")
             else:
                 if self.env.region == 'us-east-1':
                     s3_client.create_bucket(Bucket=self.bucket_name)
@@ -62,7 +68,7 @@ class S3(Resources):
                         Bucket=self.bucket_name,
                         CreateBucketConfiguration={'LocationConstraint': self.env.region}
                     )
-                print(f"S3 Bucket '{self.bucket_name}' erfolgreich erstellt")
+                logger.info(f"S3 Bucket '{self.bucket_name}' erfolgreich erstellt")
 
             if self.policy:
                 self._apply_policy(s3_client)
@@ -70,7 +76,7 @@ class S3(Resources):
             arn = f"arn:aws:s3:::{self.bucket_name}"
             return arn
         except Exception as e:
-            print(f"Fehler beim Erstellen des Buckets: {e}")
+            logger.error(f"Fehler beim Erstellen des Buckets: {e}")
             raise
 
     def update(self, deployed_tech_id: str, new_value: 'S3') -> str:
@@ -79,12 +85,9 @@ class S3(Resources):
         new_bucket_name = new_value.bucket_name
 
         if deployed_bucket_name == new_bucket_name:
-            print(f"S3 Bucket '{deployed_bucket_name}' ist bereits aktuell")
+            logger.info(f"S3 Bucket '{deployed_bucket_name}' ist bereits aktuell")
 
-            session = boto3.session.Session(
-                profile_name=new_value.env.profile,
-                region_name=new_value.env.region
-            )
+            session = create_session(new_value.env)
             s3_client = session.client('s3')
 
             if new_value.policy:
@@ -93,18 +96,15 @@ class S3(Resources):
             arn = f"arn:aws:s3:::{deployed_bucket_name}"
             return arn
 
-        session = boto3.session.Session(
-            profile_name=new_value.env.profile,
-            region_name=new_value.env.region
-        )
+        session = create_session(new_value.env)
         s3_client = session.client('s3')
 
         try:
             # 1. Neuen Bucket erstellen, falls er nicht existiert
             if new_value._bucket_exists(new_bucket_name, s3_client):
-                print(f"S3 Bucket '{new_bucket_name}' existiert bereits")
+                logger.info(f"S3 Bucket '{new_bucket_name}' existiert bereits")
             else:
-                print(f"Erstelle neuen S3 Bucket '{new_bucket_name}'")
+                logger.info(f"Erstelle neuen S3 Bucket '{new_bucket_name}'")
                 if new_value.env.region == 'us-east-1':
                     s3_client.create_bucket(Bucket=new_bucket_name)
                 else:
@@ -116,67 +116,66 @@ class S3(Resources):
             # 2. Prüfe ob neuer Bucket leer ist
             response = s3_client.list_objects_v2(Bucket=new_bucket_name)
             if response.get('Contents'):
-                print(f"Fehler: S3 Bucket '{new_bucket_name}' ist nicht leer")
+                logger.error(f"Fehler: S3 Bucket '{new_bucket_name}' ist nicht leer")
                 raise Exception(f"Ziel-Bucket '{new_bucket_name}' ist nicht leer")
 
             # 3. Sync Inhalte vom alten zum neuen Bucket
             if deployed_bucket_name and self._bucket_exists(deployed_bucket_name, s3_client):
-                print(f"Synce Inhalte von '{deployed_bucket_name}' zu '{new_bucket_name}'")
+                logger.info(f"Synce Inhalte von '{deployed_bucket_name}' zu '{new_bucket_name}'")
                 paginator = s3_client.get_paginator('list_objects_v2')
                 pages = paginator.paginate(Bucket=deployed_bucket_name)
 
-                for page in pages:
-                    if 'Contents' in page:
-                        for obj in page['Contents']:
-                            key = obj['Key']
-                            copy_source = {'Bucket': deployed_bucket_name, 'Key': key}
-                            s3_client.copy_object(CopySource=copy_source, Bucket=new_bucket_name, Key=key)
-                            print(f"  Kopiert: {key}")
+                with ProgressCounter(logger, f"s3://{new_bucket_name}", "Objekte kopiert") as progress:
+                    for page in pages:
+                        if 'Contents' in page:
+                            for obj in page['Contents']:
+                                key = obj['Key']
+                                copy_source = {'Bucket': deployed_bucket_name, 'Key': key}
+                                s3_client.copy_object(CopySource=copy_source, Bucket=new_bucket_name, Key=key)
+                                progress.add(key, obj.get('Size', 0))
 
                 # 4. Lösche alten Bucket
-                print(f"Lösche alten S3 Bucket '{deployed_bucket_name}'")
+                logger.info(f"Lösche alten S3 Bucket '{deployed_bucket_name}'")
                 s3_client.delete_bucket(Bucket=deployed_bucket_name)
             elif deployed_bucket_name:
-                print(f"Alten S3 Bucket '{deployed_bucket_name}' existiert nicht, überspringe Sync")
+                logger.info(f"Alten S3 Bucket '{deployed_bucket_name}' existiert nicht, überspringe Sync")
 
             arn = f"arn:aws:s3:::{new_bucket_name}"
-            print(f"S3 Bucket erfolgreich von '{deployed_bucket_name}' zu '{new_bucket_name}' migriert")
+            logger.info(f"S3 Bucket erfolgreich von '{deployed_bucket_name}' zu '{new_bucket_name}' migriert")
             return arn
 
         except Exception as e:
-            print(f"Fehler beim Update des Buckets: {e}")
+            logger.error(f"Fehler beim Update des Buckets: {e}")
             raise
 
     def delete(self, tech_id: str):
         """Lösche einen S3 Bucket"""
         bucket_name = self._extract_bucket_name(tech_id)
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         s3_client = session.client('s3')
 
         try:
             # Prüfe ob Bucket existiert
             if not self._bucket_exists(bucket_name, s3_client):
-                print(f"S3 Bucket '{bucket_name}' existiert nicht")
+                logger.info(f"S3 Bucket '{bucket_name}' existiert nicht")
                 return
 
             # Lösche alle Objekte im Bucket
             paginator = s3_client.get_paginator('list_objects_v2')
             pages = paginator.paginate(Bucket=bucket_name)
 
-            for page in pages:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        print(f"  Lösche Objekt: {obj['Key']}")
-                        s3_client.delete_object(Bucket=bucket_name, Key=obj['Key'])
+            with ProgressCounter(logger, f"s3://{bucket_name}", "Objekte gelöscht") as progress:
+                for page in pages:
+                    if 'Contents' in page:
+                        for obj in page['Contents']:
+                            s3_client.delete_object(Bucket=bucket_name, Key=obj['Key'])
+                            progress.add(obj['Key'], obj.get('Size', 0))
 
             # Lösche den Bucket
             s3_client.delete_bucket(Bucket=bucket_name)
-            print(f"S3 Bucket '{bucket_name}' erfolgreich gelöscht")
+            logger.info(f"S3 Bucket '{bucket_name}' erfolgreich gelöscht")
         except Exception as e:
-            print(f"Fehler beim Löschen des Buckets: {e}")
+            logger.error(f"Fehler beim Löschen des Buckets: {e}")
             raise
 
     @staticmethod
@@ -186,6 +185,17 @@ class S3(Resources):
         """
         return arn.split(':::')[-1]
 
+    @staticmethod
+    def _fetch_policy(s3_client, bucket_name: str):
+        """Hole die Bucket Policy (None wenn keine gesetzt ist)"""
+        try:
+            response = s3_client.get_bucket_policy(Bucket=bucket_name)
+            return json.loads(response['Policy'])
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchBucketPolicy':
+                return None
+            raise
+
     def _bucket_exists(self, bucket_name: str, s3_client) -> bool:
         """Prüfe ob ein Bucket existiert"""
         try:
@@ -212,21 +222,21 @@ class S3(Resources):
                 new_policy_str_sorted = json.dumps(self.policy, sort_keys=True)
 
                 if existing_policy_str == new_policy_str_sorted:
-                    print(f"Bucket Policy für '{self.bucket_name}' ist bereits aktuell")
+                    logger.info(f"Bucket Policy für '{self.bucket_name}' ist bereits aktuell")
                     return
                 else:
-                    print(f"Aktualisiere Bucket Policy für '{self.bucket_name}'")
+                    logger.info(f"Aktualisiere Bucket Policy für '{self.bucket_name}'")
             else:
-                print(f"Erstelle neue Bucket Policy für '{self.bucket_name}'")
+                logger.info(f"Erstelle neue Bucket Policy für '{self.bucket_name}'")
 
             s3_client.put_bucket_policy(
                 Bucket=self.bucket_name,
                 Policy=new_policy_str
             )
-            print(f"Bucket Policy erfolgreich angewendet")
+            logger.info(f"Bucket Policy erfolgreich angewendet")
 
         except Exception as e:
-            print(f"Fehler beim Anwenden der Bucket Policy: {e}")
+            logger.error(f"Fehler beim Anwenden der Bucket Policy: {e}")
             raise
 
     def list(self, prefix: str = "") -> list:
@@ -238,10 +248,7 @@ class S3(Resources):
         Returns:
             List of object keys
         """
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         s3_client = session.client('s3')
 
         try:
@@ -255,7 +262,7 @@ class S3(Resources):
                         objects.append(obj['Key'])
             return objects
         except Exception as e:
-            print(f"Fehler beim Auflisten der Objekte in {self.bucket_name}: {e}")
+            logger.error(f"Fehler beim Auflisten der Objekte in {self.bucket_name}: {e}")
             raise
 
     def upload(self, local_path: str, s3_key: str = None) -> None:
@@ -266,10 +273,7 @@ class S3(Resources):
             s3_key: S3 object key (if None, uses filename)
         """
         from pathlib import Path as PathlibPath
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         s3_client = session.client('s3')
 
         try:
@@ -280,9 +284,9 @@ class S3(Resources):
             key = s3_key or local_file.name
             with open(local_path, 'rb') as f:
                 s3_client.put_object(Bucket=self.bucket_name, Key=key, Body=f)
-            print(f"✓ Hochgeladen: {local_path} → s3://{self.bucket_name}/{key}")
+            logger.info(f"✓ Hochgeladen: {local_path} → s3://{self.bucket_name}/{key}")
         except Exception as e:
-            print(f"Fehler beim Hochladen zu {self.bucket_name}: {e}")
+            logger.error(f"Fehler beim Hochladen zu {self.bucket_name}: {e}")
             raise
 
     def download(self, s3_key: str, local_path: str) -> None:
@@ -292,18 +296,15 @@ class S3(Resources):
             s3_key: S3 object key
             local_path: Local path to save file
         """
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         s3_client = session.client('s3')
 
         try:
             with open(local_path, 'wb') as f:
                 s3_client.download_fileobj(self.bucket_name, s3_key, f)
-            print(f"✓ Heruntergeladen: s3://{self.bucket_name}/{s3_key} → {local_path}")
+            logger.info(f"✓ Heruntergeladen: s3://{self.bucket_name}/{s3_key} → {local_path}")
         except Exception as e:
-            print(f"Fehler beim Herunterladen von {self.bucket_name}: {e}")
+            logger.error(f"Fehler beim Herunterladen von {self.bucket_name}: {e}")
             raise
 
     def delete(self, s3_key: str) -> None:
@@ -312,17 +313,14 @@ class S3(Resources):
         Args:
             s3_key: S3 object key
         """
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         s3_client = session.client('s3')
 
         try:
             s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
-            print(f"✓ Gelöscht: s3://{self.bucket_name}/{s3_key}")
+            logger.info(f"✓ Gelöscht: s3://{self.bucket_name}/{s3_key}")
         except Exception as e:
-            print(f"Fehler beim Löschen von {self.bucket_name}: {e}")
+            logger.error(f"Fehler beim Löschen von {self.bucket_name}: {e}")
             raise
 
     def __repr__(self) -> str:
@@ -1,11 +1,14 @@
 import mimetypes
 import os
-import boto3
 from pathlib import Path
 
+from src.core.log import ProgressCounter, get_logger
+from src.core.session import create_session
 from src.model import AwsEnviroment, Resources
 from src.model.registry import register_resource
 
+logger = get_logger("s3_deploy")
+
 
 @register_resource("s3_deploy")
 class S3Deploy(Resources):
@@ -32,16 +35,13 @@ class S3Deploy(Resources):
 
     def create(self) -> str:
         """Erstelle Bucket und lade Dateien hoch"""
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         s3_client = session.client('s3')
 
         try:
             # Erstelle Bucket falls nicht vorhanden
             if not self._bucket_exists(self.bucket_name, s3_client):
-                print(f"Erstelle S3 Bucket '{self.bucket_name}'")
+                logger.info(f"Erstelle S3 Bucket '{self.bucket_name}'")
                 if self.env.region == 'us-east-1':
                     s3_client.create_bucket(Bucket=self.bucket_name)
                 else:
@@ -50,25 +50,22 @@ class S3Deploy(Resources):
                         CreateBucketConfiguration={'LocationConstraint': self.env.region}
                     )
             else:
-                print(f"S3 Bucket '{self.bucket_name}' existiert bereits")
+                logger.info(f"S3 Bucket '{self.bucket_name}' existiert bereits")
 
             # Lade Dateien hoch
             self._upload_directory(s3_client)
 
             tech_id = self._create_tech_id(self.bucket_name, self.s3_path)
-            print(f"Dateien erfolgreich in S3 Bucket '{self.bucket_name}/{self.s3_path}' hochgeladen")
+            logger.info(f"Dateien erfolgreich in S3 Bucket '{self.bucket_name}/{self.s3_path}' hochgeladen")
             return tech_id
 
         except Exception as e:
-            print(f"Fehler beim S3 Deployment: {e}")
+            logger.error(f"Fehler beim S3 Deployment: {e}")
             raise
 
     def update(self, deployed_tech_id: str, new_value: 'S3Deploy') -> str:
         """Update Deployment - lade neue Dateien hoch"""
-        session = boto3.session.Session(
-            profile_name=new_value.env.profile,
-            region_name=new_value.env.region
-        )
+        session = create_session(new_value.env)
         s3_client = session.client('s3')
 
         try:
@@ -76,38 +73,35 @@ class S3Deploy(Resources):
 
             # Wenn Bucket oder Pfad sich ändern, leere den alten Pfad
             if deployed_bucket == new_value.bucket_name and deployed_path == new_value.s3_path:
-                print(f"Update S3 Deployment in Bucket '{new_value.bucket_name}/{new_value.s3_path}'")
+                logger.info(f"Update S3 Deployment in Bucket '{new_value.bucket_name}/{new_value.s3_path}'")
                 new_value._clear_prefix(s3_client, new_value.s3_path)
             else:
-                print(f"Ändere S3 Deployment von '{deployed_bucket}/{deployed_path}' zu '{new_value.bucket_name}/{new_value.s3_path}'")
+                logger.info(f"Ändere S3 Deployment von '{deployed_bucket}/{deployed_path}' zu '{new_value.bucket_name}/{new_value.s3_path}'")
                 new_value._clear_prefix(s3_client, deployed_path)
 
             # Lade neue Dateien hoch
             new_value._upload_directory(s3_client)
 
             tech_id = new_value._create_tech_id(new_value.bucket_name, new_value.s3_path)
-            print(f"S3 Deployment erfolgreich aktualisiert")
+            logger.info(f"S3 Deployment erfolgreich aktualisiert")
             return tech_id
 
         except Exception as e:
-            print(f"Fehler beim Update des Deployments: {e}")
+            logger.error(f"Fehler beim Update des Deployments: {e}")
             raise
 
     def delete(self, tech_id: str):
         """Lösche alle Dateien aus dem S3 Pfad"""
         bucket_name, s3_path = self._extract_from_tech_id(tech_id)
-        session = boto3.session.Session(
-            profile_name=self.env.profile,
-            region_name=self.env.region
-        )
+        session = create_session(self.env)
         s3_client = session.client('s3')
 
         try:
-            print(f"Lösche Inhalte aus S3 Bucket '{bucket_name}/{s3_path}'")
+            logger.info(f"Lösche Inhalte aus S3 Bucket '{bucket_name}/{s3_path}'")
             self._clear_prefix(s3_client, s3_path)
-            print(f"Inhalte erfolgreich gelöscht")
+            logger.info(f"Inhalte erfolgreich gelöscht")
         except Exception as e:
-            print(f"Fehler beim Löschen: {e}")
+            logger.error(f"Fehler beim Löschen: {e}")
             raise
 
     def _bucket_exists(self, bucket_name: str, s3_client) -> bool:
@@ -126,6 +120,7 @@ class S3Deploy(Resources):
         if not self.local_path.is_dir():
             raise NotADirectoryError(f"Pfad ist kein Verzeichnis: {self.local_path}")
 
+        progress = ProgressCounter(logger, f"s3://{self.bucket_name}/{self.s3_path}", "Dateien hochgeladen")
         for file_path in self.local_path.rglob('*'):
             if file_path.is_file():
                 # Berechne relativen Pfad für S3 Key
@@ -140,13 +135,14 @@ class S3Deploy(Resources):
                 if content_type is None:
                     content_type = 'application/octet-stream'
 
-                print(f"  Lade hoch: {s3_key} (ContentType: {content_type})")
                 s3_client.upload_file(
                     Filename=str(file_path),
                     Bucket=self.bucket_name,
                     Key=s3_key,
                     ExtraArgs={'ContentType': content_type}
                 )
+                progress.add(f"{s3_key} (ContentType: {content_type})", file_path.stat().st_size)
+        progress.done()
 
     def _clear_prefix(self, s3_client, prefix: str):
         """Lösche alle Objekte mit einem bestimmten Präfix"""
@@ -156,22 +152,24 @@ class S3Deploy(Resources):
         paginator = s3_client.get_paginator('list_objects_v2')
         pages = paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
 
-        for page in pages:
-            if 'Contents' in page:
-                for obj in page['Contents']:
-                    print(f"  Lösche: {obj['Key']}")
-                    s3_client.delete_object(Bucket=self.bucket_name, Key=obj['Key'])
+        with ProgressCounter(logger, f"s3://{self.bucket_name}/{prefix}", "Objekte gelöscht") as progress:
+            for page in pages:
+                if 'Contents' in page:
+                    for obj in page['Contents']:
+                        s3_client.delete_object(Bucket=self.bucket_name, Key=obj['Key'])
+                        progress.add(obj['Key'], obj.get('Size', 0))
 
     def _clear_bucket(self, s3_client):
         """Lösche alle Objekte aus dem Bucket"""
         paginator = s3_client.get_paginator('list_objects_v2')
         pages = paginator.paginate(Bucket=self.bucket_name)
 
-        for page in pages:
-            if 'Contents' in page:
-                for obj in page['Contents']:
-                    print(f"  Lösche: {obj['Key']}")
-                    s3_client.delete_object(Bucket=self.bucket_name, Key=obj['Key'])
+        with ProgressCounter(logger, f"s3://{self.bucket_name}", "Objekte gelöscht") as progress:
+            for page in pages:
+                if 'Contents' in page:
+                    for obj in page['Contents']:
+                        s3_client.delete_object(Bucket=self.bucket_name, Key=obj['Key'])
+                        progress.add(obj['Key'], obj.get('Size', 0))
 
     @staticmethod
     def _create_tech_id(bucket_name: str, s3_path: str) -> str:
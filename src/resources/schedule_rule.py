@@ -0,0 +1,223 @@
+import json
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from src.core.log import get_logger
+from src.core.session import create_session
+from src.model import AwsEnviroment, Resources, lazy_field
+from src.model.registry import register_resource
+from src.packaging.warmer_runtime import WARMER_MARKER
+
+logger = get_logger("schedule_rule")
+
+# EventBridge limit per rule - every warmer target is one parallel invocation
+MAX_TARGETS = 5
+
+_RATE = re.compile(r"^rate\((\d+) minutes?\)$")
+
+
+@dataclass
+class WarmerConfig:
+    """Hält `concurrency` Umgebungen einer Function warm, alle `interval` Minuten"""
+    concurrency: int = 1
+    interval: int = 5
+    # Each warmer invocation stays busy this long, so the parallel ones need separate environments
+    delay_ms: int = 100
+
+    def __post_init__(self):
+        if not 1 <= self.concurrency <= MAX_TARGETS:
+            raise ValueError(f"Warmer concurrency muss zwischen 1 und {MAX_TARGETS} liegen "
+                             f"(EventBridge Targets pro Rule): {self.concurrency}")
+        if self.interval < 1:
+            raise ValueError(f"Warmer interval muss mindestens 1 Minute sein: {self.interval}")
+
+    @property
+    def schedule_expression(self) -> str:
+        return f"rate({self.interval} minute{'' if self.interval == 1 else 's'})"
+
+    def targets(self, function_arn: str) -> list[dict]:
+        """Ein Target pro paralleler Invocation, jedes mit dem Marker Payload"""
+        return [
+            {"id": f"warmer-{index}", "arn": function_arn,
+             "input": {WARMER_MARKER: {"index": index, "delay_ms": self.delay_ms}}}
+            for index in range(1, self.concurrency + 1)
+        ]
+
+    @classmethod
+    def from_rule(cls, rule: 'ScheduleRule') -> Optional['WarmerConfig']:
+        """Warmer Config aus einer deployten Rule (None wenn es keine Warmer Rule ist)"""
+        match = _RATE.match(rule.schedule_expression or "")
+        markers = [target["input"].get(WARMER_MARKER) for target in rule.targets
+                   if isinstance(target.get("input"), dict)]
+        if match is None or not markers or None in markers:
+            return None
+        return cls(concurrency=len(markers), interval=int(match.group(1)),
+                   delay_ms=markers[0].get("delay_ms", cls.delay_ms))
+
+
+@register_resource("schedule_rule")
+class ScheduleRule(Resources):
+    """EventBridge Schedule Rule Resource - ruft Targets (z.B. Lambda Functions) zeitgesteuert auf"""
+
+    _diff_fields = ('rule_name', 'schedule_expression', 'enabled', 'description', 'targets')
+
+    targets = lazy_field()
+
+    def __init__(
+        self,
+        rule_name: str,
+        schedule_expression: str,
+        env: AwsEnviroment,
+        targets: list = None,
+        description: str = "",
+        enabled: bool = True
+    ):
+        """
+        Args:
+            rule_name: Name der Rule
+            schedule_expression: z.B. "rate(5 minutes)" oder "cron(0 6 * * ? *)"
+            targets: Liste von Targets, z.B.:
+                [
+                    {
+                        "id": "warmer-1",
+                        "arn": "arn:aws:lambda:...:function:todo-list",
+                        "input": {"myzel-warmer": {...}}  # optional, konstantes JSON Event
+                    }
+                ]
+            env: AWS Environment
+        """
+        self.rule_name = rule_name
+        self.schedule_expression = schedule_expression
+        self.env = env
+        self.targets = sorted(targets or [], key=lambda target: target["id"])
+        self.description = description
+        self.enabled = enabled
+
+    @classmethod
+    def get(cls, tech_id: str, env: AwsEnviroment) -> 'ScheduleRule':
+        """Hole eine spezifische Schedule Rule (tech_id: Rule ARN oder Name)"""
+        rule_name = cls._extract_rule_name(tech_id)
+        session = create_session(env)
+        events_client = session.client('events')
+
+        try:
+            response = events_client.describe_rule(Name=rule_name)
+            rule = cls(
+                rule_name=response['Name'],
+                schedule_expression=response.get('ScheduleExpression', ''),
+                env=env,
+                description=response.get('Description', ''),
+                enabled=response.get('State') == 'ENABLED'
+            )
+            rule.defer('targets', lambda: cls._fetch_targets(events_client, rule_name))
+            return rule
+        except events_client.exceptions.ResourceNotFoundException:
+            rule = cls(rule_name=rule_name, schedule_expression="", env=env)
+            rule._missing = True
+            return rule
+        except Exception as e:
+            logger.error(f"Fehler beim Abrufen der Schedule Rule {rule_name}: {e}")
+            raise
+
+    @staticmethod
+    def _fetch_targets(events_client, rule_name: str) -> list:
+        targets = []
+        for page in events_client.get_paginator('list_targets_by_rule').paginate(Rule=rule_name):
+            for target in page['Targets']:
+                entry = {"id": target['Id'], "arn": target['Arn']}
+                if 'Input' in target:
+                    entry["input"] = json.loads(target['Input'])
+                targets.append(entry)
+        return sorted(targets, key=lambda target: target["id"])
+
+    def create(self) -> str:
+        """Erstelle die Rule oder gleiche eine existierende an (Schedule, Status, Targets)"""
+        session = create_session(self.env)
+        events_client = session.client('events')
+        lambda_client = session.client('lambda')
+
+        rule_arn = events_client.put_rule(
+            Name=self.rule_name,
+            ScheduleExpression=self.schedule_expression,
+            State='ENABLED' if self.enabled else 'DISABLED',
+            Description=self.description
+        )['RuleArn']
+        logger.info(f"Schedule Rule: {self.rule_name} ({self.schedule_expression})")
+
+        desired_ids = {target["id"] for target in self.targets}
+        deployed = self._fetch_targets(events_client, self.rule_name)
+        stale = [target for target in deployed if target["id"] not in desired_ids]
+        if stale:
+            events_client.remove_targets(Rule=self.rule_name, Ids=[target["id"] for target in stale])
+            logger.info(f"  Targets entfernt: {', '.join(target['id'] for target in stale)}")
+
+        if self.targets:
+            targets = []
+            for target in self.targets:
+                entry = {'Id': target["id"], 'Arn': target["arn"]}
+                if "input" in target:
+                    entry['Input'] = json.dumps(target["input"])
+                targets.append(entry)
+            response = events_client.put_targets(Rule=self.rule_name, Targets=targets)
+            if response.get('FailedEntryCount'):
+                raise Exception(f"Targets der Rule {self.rule_name} fehlgeschlagen: {response['FailedEntries']}")
+            logger.info(f"  Targets: {len(targets)}")
+
+        # One resource policy statement per function, however many targets point to it
+        for function_arn in sorted({target["arn"] for target in self.targets if ":lambda:" in target["arn"]}):
+            try:
+                lambda_client.add_permission(
+                    FunctionName=function_arn,
+                    StatementId=f"events-{self.rule_name}",
+                    Action='lambda:InvokeFunction',
+                    Principal='events.amazonaws.com',
+                    SourceArn=rule_arn
+                )
+                logger.info(f"  Lambda Permission hinzugefügt für {function_arn}")
+            except lambda_client.exceptions.ResourceConflictException:
+                logger.info(f"  Lambda Permission existiert bereits für {function_arn}")
+
+        return rule_arn
+
+    def update(self, deployed_tech_id: str, new_value: 'ScheduleRule') -> str:
+        """Update eine Schedule Rule - bei neuem Namen wird die alte gelöscht"""
+        if self._extract_rule_name(deployed_tech_id) != new_value.rule_name:
+            self.delete(deployed_tech_id)
+        return new_value.create()
+
+    def delete(self, tech_id: str):
+        """Lösche eine Schedule Rule samt Targets und Lambda Permissions"""
+        rule_name = self._extract_rule_name(tech_id)
+        session = create_session(self.env)
+        events_client = session.client('events')
+        lambda_client = session.client('lambda')
+
+        try:
+            targets = self._fetch_targets(events_client, rule_name)
+        except events_client.exceptions.ResourceNotFoundException:
+            logger.info(f"Schedule Rule existiert nicht: {rule_name}")
+            return
+
+        try:
+            if targets:
+                events_client.remove_targets(Rule=rule_name, Ids=[target["id"] for target in targets])
+            events_client.delete_rule(Name=rule_name)
+            logger.info(f"Schedule Rule gelöscht: {rule_name}")
+        except Exception as e:
+            logger.error(f"Fehler beim Löschen der Schedule Rule: {e}")
+            raise
+
+        for function_arn in sorted({target["arn"] for target in targets if ":lambda:" in target["arn"]}):
+            try:
+                lambda_client.remove_permission(FunctionName=function_arn, StatementId=f"events-{rule_name}")
+            except lambda_client.exceptions.ResourceNotFoundException:
+                pass
+
+    @staticmethod
+    def _extract_rule_name(tech_id: str) -> str:
+        """Extrahiere Rule Name aus ARN (arn:aws:events:...:rule/<name>)"""
+        return tech_id.split('/')[-1]
+
+    def __repr__(self) -> str:
+        return f"ScheduleRule(name='{self.rule_name}', schedule='{self.schedule_expression}')"
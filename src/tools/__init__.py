@@ -0,0 +1,8 @@
+from src.tools.cold_start import ColdStartBenchmark, ColdStartResult, compare
+from src.tools.import_profiler import ImportHistory, ImportProfile, parse_importtime, profile_functions
+from src.tools.power_tuning import PowerTuner, TuningPoint, TuningResult
+from src.core.report import InvocationReport, parse_report, percentile
+
+__all__ = ["ColdStartBenchmark", "ColdStartResult", "compare", "ImportHistory", "ImportProfile",
+           "parse_importtime", "profile_functions", "PowerTuner", "TuningPoint", "TuningResult",
+           "InvocationReport", "parse_report", "percentile"]
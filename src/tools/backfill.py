@@ -0,0 +1,43 @@
+import argparse
+import os
+from typing import Optional
+
+from src.core.log import get_logger
+
+logger = get_logger("tools")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """python -m src.tools.backfill todos entity todo
+
+    One-off migration: sets the attribute on all items that lack it (e.g. the
+    partition key of a GSI added later). Scans the whole table - run it once
+    after the index was deployed, not on every deploy.
+    """
+    from src.core.log import configure_logging
+    from src.model import AwsEnviroment
+    from src.resources.dynamodb import DynamoDB
+
+    parser = argparse.ArgumentParser(description="Backfill eines fehlenden Attributs in einer DynamoDB Tabelle")
+    parser.add_argument("table_name")
+    parser.add_argument("attribute")
+    parser.add_argument("value", help="String Wert für alle Items ohne das Attribut")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    env = AwsEnviroment(
+        profile=os.getenv("AWS_PROFILE", "default"),
+        region=os.getenv("AWS_REGION", "eu-central-1"),
+        account=os.getenv("AWS_ACCOUNT", "")
+    )
+    table = DynamoDB.get(args.table_name, env)
+    if table._missing:
+        raise SystemExit(f"DynamoDB Tabelle nicht gefunden: {args.table_name}")
+
+    updated = table.fill_missing(args.attribute, args.value)
+    logger.info(f"Backfill abgeschlossen: {updated} Items in {args.table_name} aktualisiert")
+    return updated
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+import argparse
+import json
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from src.core.log import format_bytes, get_logger
+from src.core.report import parse_report, percentile
+
+logger = get_logger("tools")
+
+# No-op variable toggled per cycle: every configuration update forces fresh
+# execution environments, without touching code or versions
+COLD_START_ENV_VAR = "MYZEL_COLD_START_CYCLE"
+
+
+@dataclass
+class ColdStartSample:
+    """Erster Aufruf nach einer Konfigurationsänderung"""
+    cycle: int
+    init_duration_ms: Optional[float]
+    duration_ms: Optional[float]
+    # Client side round trip of the first invocation (init + duration + overhead)
+    latency_ms: float
+    error: Optional[str] = None
+
+
+@dataclass
+class ColdStartResult:
+    """Verteilung der Cold Starts einer Function"""
+    function_name: str
+    package_size: Optional[int]
+    # Package optimization setting, e.g. "none" or "precompile+strip"
+    optimize: str
+    samples: list[ColdStartSample] = field(default_factory=list)
+
+    @property
+    def init_durations(self) -> list[float]:
+        return [s.init_duration_ms for s in self.samples if s.init_duration_ms is not None]
+
+    @property
+    def latencies(self) -> list[float]:
+        return [s.latency_ms for s in self.samples if s.error is None]
+
+    def summary(self) -> dict:
+        return {
+            "function_name": self.function_name,
+            "package_size": self.package_size,
+            "optimize": self.optimize,
+            "cycles": len(self.samples),
+            "cold_starts": len(self.init_durations),
+            "errors": sum(1 for s in self.samples if s.error is not None),
+            "init_p50_ms": percentile(self.init_durations, 50),
+            "init_p95_ms": percentile(self.init_durations, 95),
+            "init_max_ms": max(self.init_durations, default=None),
+            "latency_p50_ms": percentile(self.latencies, 50),
+            "latency_p95_ms": percentile(self.latencies, 95),
+        }
+
+    def to_dict(self) -> dict:
+        return {**self.summary(), "samples": [s.__dict__ for s in self.samples]}
+
+
+class ColdStartBenchmark:
+    """
+    Measures cold starts of deployed functions over N cycles.
+
+    Each cycle sets COLD_START_ENV_VAR to a fresh value with a
+    configuration-only update (LambdaFunction.reconfigure), which retires
+    all warm execution environments, and invokes once with LogType=Tail.
+    The REPORT line gives the Init Duration, the client measures the
+    first-invoke latency. The original environment is restored afterwards.
+
+    Results carry the package size and optimization setting, so runs with
+    and without LambdaFunction(optimize=...) can be compared (compare()).
+    Functions can be LambdaFunction objects or stand-ins with the same
+    invoke/reconfigure methods.
+    """
+
+    def __init__(self, functions: Iterable, cycles: int = 10, payload: Optional[dict] = None,
+                 label: Optional[str] = None):
+        """
+        Args:
+            label: Optimization label of the results (default: derived from
+                function.optimize - deployed functions from get() don't know it)
+        """
+        self.functions = list(functions)
+        self.cycles = cycles
+        self.payload = payload or {}
+        self.label = label
+
+    def run(self) -> list[ColdStartResult]:
+        results = [self._measure(function) for function in self.functions]
+        self._log(results)
+        return results
+
+    def _measure(self, function) -> ColdStartResult:
+        result = ColdStartResult(function.function_name, _package_size(function),
+                                 self.label or _optimize_label(function))
+        original = dict(function.environment_variables)
+        logger.info(f"Cold Start Benchmark {function.function_name}: {self.cycles} Zyklen...")
+        try:
+            for cycle in range(self.cycles):
+                function.reconfigure(environment_variables={**original, COLD_START_ENV_VAR: uuid.uuid4().hex})
+                started = time.perf_counter()
+                response = function.invoke(self.payload, log_type="Tail")
+                latency_ms = (time.perf_counter() - started) * 1000
+
+                report = parse_report(response.get("LogResult", ""))
+                result.samples.append(ColdStartSample(
+                    cycle=cycle,
+                    init_duration_ms=report.init_duration_ms if report else None,
+                    duration_ms=report.duration_ms if report else None,
+                    latency_ms=latency_ms,
+                    error=response.get("FunctionError"),
+                ))
+        finally:
+            function.reconfigure(environment_variables=original)
+        return result
+
+    @staticmethod
+    def _log(results: list[ColdStartResult]) -> None:
+        logger.info("Cold Starts:")
+        logger.info(f"  {'Function':<24} {'Package':>10} {'Optimize':<18} {'Init p50':>10} {'Init p95':>10} "
+                    f"{'1. Aufruf p50':>14} {'p95':>10}")
+        for result in results:
+            summary = result.summary()
+            size = format_bytes(result.package_size) if result.package_size is not None else "-"
+            logger.info(
+                f"  {result.function_name:<24} {size:>10} {result.optimize:<18} "
+                f"{_ms(summary['init_p50_ms']):>10} {_ms(summary['init_p95_ms']):>10} "
+                f"{_ms(summary['latency_p50_ms']):>14} {_ms(summary['latency_p95_ms']):>10}",
+                extra=summary
+            )
+            if summary["cold_starts"] < summary["cycles"]:
+                logger.warning(f"Warnung: {result.function_name}: nur {summary['cold_starts']} von "
+                               f"{summary['cycles']} Aufrufen mit Init Duration")
+
+
+def compare(baseline: list[ColdStartResult], candidate: list[ColdStartResult]) -> dict[str, dict]:
+    """Init/Latenz p50 Differenz pro Function (z.B. ohne vs. mit optimize)"""
+    before = {result.function_name: result.summary() for result in baseline}
+    deltas = {}
+    for result in candidate:
+        if result.function_name not in before:
+            continue
+        old, new = before[result.function_name], result.summary()
+        deltas[result.function_name] = {
+            key: None if old[key] is None or new[key] is None else new[key] - old[key]
+            for key in ("package_size", "init_p50_ms", "latency_p50_ms")
+        }
+        logger.info(f"  {result.function_name}: {old['optimize']} → {new['optimize']}: "
+                    f"Init p50 {_delta(deltas[result.function_name]['init_p50_ms'])}, "
+                    f"1. Aufruf p50 {_delta(deltas[result.function_name]['latency_p50_ms'])}")
+    return deltas
+
+
+def save(results: list[ColdStartResult], path: Union[str, Path]) -> None:
+    """Ergebnisse als JSON Zeile anhängen (eine Zeile pro Lauf)"""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"ts": time.time(), "results": [r.to_dict() for r in results]}) + "\n")
+
+
+def _package_size(function) -> Optional[int]:
+    # Deployed size (CodeSize) from LambdaFunction.get() or of the last built package
+    return getattr(function, "code_size", None)
+
+
+def _optimize_label(function) -> str:
+    options = getattr(function, "optimize", None)
+    if options is None:
+        return "none"
+    parts = (["precompile"] if options.precompile else []) + (["strip"] if options.strip else [])
+    return "+".join(parts) or "none"
+
+
+def _ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.1f} ms"
+
+
+def _delta(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:+.1f} ms"
+
+
+def main(argv: Optional[list[str]] = None) -> list[ColdStartResult]:
+    """python -m src.tools.cold_start hallo-welt todo-list --cycles 10 --label precompile+strip"""
+    from src.core.log import configure_logging
+    from src.model import AwsEnviroment
+    from src.resources.lambda_function import LambdaFunction
+
+    parser = argparse.ArgumentParser(description="Lambda Cold Start Benchmark")
+    parser.add_argument("function_names", nargs="+")
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--payload", default="{}", help="JSON Payload")
+    parser.add_argument("--label", help="Optimierung des deployten Packages (z.B. none, precompile+strip)")
+    parser.add_argument("--output", help="Ergebnisse als JSON Zeile anhängen")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    env = AwsEnviroment(
+        profile=os.getenv("AWS_PROFILE", "default"),
+        region=os.getenv("AWS_REGION", "eu-central-1"),
+        account=os.getenv("AWS_ACCOUNT", "")
+    )
+    functions = []
+    for function_name in args.function_names:
+        function = LambdaFunction.get(function_name, env)
+        if function._missing:
+            raise SystemExit(f"Lambda Function nicht gefunden: {function_name}")
+        functions.append(function)
+
+    results = ColdStartBenchmark(functions, args.cycles, json.loads(args.payload), args.label).run()
+    if args.output:
+        save(results, args.output)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from src.core.log import get_logger
+from src.packaging.package import RUNTIME_FILES
+
+logger = get_logger("tools")
+
+# Packages whose imports take at least this long (median, ms) are flagged
+HEAVY_IMPORT_MS = 50.0
+
+# Written to stderr right before the handler import - everything before it is interpreter startup
+_START_MARKER = "myzel-import-start"
+
+# __import__ instead of importlib.import_module: only the import statement path
+# reports the handler module itself to -X importtime. The helpers every package
+# ships (RUNTIME_FILES, argv[3:] as name=path) are loaded before the marker.
+_IMPORT_SCRIPT = """
+import importlib.util, sys
+sys.path.insert(0, sys.argv[1])
+for runtime_file in sys.argv[3:]:
+    name, path = runtime_file.split("=", 1)
+    spec = importlib.util.spec_from_file_location(name, path)
+    sys.modules[name] = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(sys.modules[name])
+print({marker!r}, file=sys.stderr, flush=True)
+__import__(sys.argv[2])
+""".format(marker=_START_MARKER)
+
+# Minimal environment of the clean subprocess; boto3 clients created at import
+# need a region, dummy credentials keep real ones out
+_CLEAN_ENV = {
+    "AWS_DEFAULT_REGION": "eu-central-1",
+    "AWS_ACCESS_KEY_ID": "profiler",
+    "AWS_SECRET_ACCESS_KEY": "profiler",
+    "AWS_EC2_METADATA_DISABLED": "true",
+}
+
+
+def default_history_path() -> Path:
+    """Verlauf in MYZEL_CACHE_DIR (sonst ~/.cache/myzel)"""
+    return Path(os.getenv("MYZEL_CACHE_DIR", Path.home() / ".cache" / "myzel")) / "import_profile.jsonl"
+
+
+@dataclass
+class ImportProfile:
+    """Import-Kosten eines Handler Moduls (Median über alle Läufe)"""
+    function: str
+    # Cumulative import time of the handler module (what Lambda's Init Duration pays)
+    total_ms: float
+    # Module-level code of the handler itself (e.g. boto3.resource(...) and Table(...))
+    handler_ms: float
+    # Self time summed per top-level package, most expensive first
+    packages: dict[str, float] = field(default_factory=dict)
+    runs: int = 1
+    error: Optional[str] = None
+
+    def heavy(self, threshold_ms: float = HEAVY_IMPORT_MS) -> list[str]:
+        return [name for name, ms in self.packages.items() if ms >= threshold_ms]
+
+    def to_dict(self) -> dict:
+        return {
+            "function": self.function,
+            "total_ms": self.total_ms,
+            "handler_ms": self.handler_ms,
+            "packages": self.packages,
+            "runs": self.runs,
+            "error": self.error,
+        }
+
+
+def parse_importtime(stderr: str, module: str) -> tuple[float, float, dict[str, float]]:
+    """-X importtime Ausgabe -> (Gesamt ms, Handler ms, self ms pro Top-Level Package)
+
+    Only lines after the start marker count; interpreter startup is ignored.
+    """
+    lines = stderr.splitlines()
+    if _START_MARKER in lines:
+        lines = lines[lines.index(_START_MARKER) + 1:]
+
+    total = handler = 0.0
+    packages: dict[str, float] = {}
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # header line
+        name = name.strip()
+        self_ms, cumulative_ms = int(self_us) / 1000, int(cumulative_us) / 1000
+        if name == module:
+            handler, total = self_ms, cumulative_ms
+            continue
+        top_level = name.split(".")[0]
+        packages[top_level] = packages.get(top_level, 0.0) + self_ms
+    return total, handler, packages
+
+
+def profile_function(
+    code_path: Union[str, Path],
+    module: str = "lambda_function",
+    runs: int = 3,
+    python: str = sys.executable,
+    environment: Optional[dict] = None
+) -> ImportProfile:
+    """Importiere das Handler Modul `runs` mal in einem frischen Prozess mit -X importtime"""
+    code_path = Path(code_path).resolve()
+    env = {"PATH": os.environ.get("PATH", ""), **_CLEAN_ENV, **(environment or {})}
+    if "SYSTEMROOT" in os.environ:
+        env["SYSTEMROOT"] = os.environ["SYSTEMROOT"]
+
+    samples = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            # -s: no user site-packages, -B: no pyc writes into the function directory
+            [python, "-s", "-B", "-X", "importtime", "-c", _IMPORT_SCRIPT, str(code_path), module,
+             *(f"{arcname.removesuffix('.py')}={path}" for arcname, path in RUNTIME_FILES.items())],
+            cwd=code_path, env=env, capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "Import fehlgeschlagen"
+            return ImportProfile(code_path.name, 0.0, 0.0, runs=len(samples), error=error)
+        samples.append(parse_importtime(completed.stderr, module))
+
+    names = {name for _, _, packages in samples for name in packages}
+    packages = {
+        name: statistics.median(packages.get(name, 0.0) for _, _, packages in samples)
+        for name in names
+    }
+    return ImportProfile(
+        function=code_path.name,
+        total_ms=statistics.median(total for total, _, _ in samples),
+        handler_ms=statistics.median(handler for _, handler, _ in samples),
+        packages=dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)),
+        runs=runs,
+    )
+
+
+class ImportHistory:
+    """Verlauf der Import-Profile als JSON Lines (ein Eintrag pro Function und Lauf)"""
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = Path(path) if path is not None else default_history_path()
+
+    def previous(self, function: str) -> Optional[dict]:
+        if not self.path.exists():
+            return None
+        last = None
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            entry = json.loads(line)
+            if entry.get("function") == function and not entry.get("error"):
+                last = entry
+        return last
+
+    def append(self, profiles: Iterable[ImportProfile]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            for profile in profiles:
+                f.write(json.dumps({"ts": time.time(), **profile.to_dict()}) + "\n")
+
+
+def profile_functions(
+    root: Union[str, Path] = "functions",
+    runs: int = 3,
+    threshold_ms: float = HEAVY_IMPORT_MS,
+    history: Optional[ImportHistory] = None,
+    top: int = 5
+) -> list[ImportProfile]:
+    """Profile alle functions/*/lambda_function.py, melde schwere Imports und Änderungen zum Verlauf"""
+    profiles = []
+    for handler in sorted(Path(root).glob("*/lambda_function.py")):
+        profile = profile_function(handler.parent, runs=runs)
+        profiles.append(profile)
+        _log(profile, threshold_ms, history.previous(profile.function) if history else None, top)
+
+    if history is not None:
+        history.append(profiles)
+    return profiles
+
+
+def _log(profile: ImportProfile, threshold_ms: float, previous: Optional[dict], top: int) -> None:
+    if profile.error:
+        logger.warning(f"Warnung: {profile.function}: Import fehlgeschlagen: {profile.error}")
+        return
+
+    trend = ""
+    if previous is not None:
+        trend = f" ({profile.total_ms - previous['total_ms']:+.1f} ms zum letzten Lauf)"
+    logger.info(f"{profile.function}: Import {profile.total_ms:.1f} ms, Modul-Code {profile.handler_ms:.1f} ms{trend}",
+                extra=profile.to_dict())
+    heavy = set(profile.heavy(threshold_ms))
+    for name, ms in list(profile.packages.items())[:top]:
+        marker = "  ⚠ schwer" if name in heavy else ""
+        logger.info(f"  {name:<28} {ms:>8.1f} ms{marker}")
+
+
+def main(argv: Optional[list[str]] = None) -> list[ImportProfile]:
+    """python -m src.tools.import_profiler ./functions --runs 5"""
+    from src.core.log import configure_logging
+
+    parser = argparse.ArgumentParser(description="Import-Zeit Profiler für Lambda Handler")
+    parser.add_argument("root", nargs="?", default="functions")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=HEAVY_IMPORT_MS, help="Schwere Imports ab ms")
+    parser.add_argument("--history", help="Verlauf (Default: MYZEL_CACHE_DIR/import_profile.jsonl)")
+    parser.add_argument("--no-history", action="store_true")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    history = None if args.no_history else ImportHistory(args.history)
+    return profile_functions(args.root, args.runs, args.threshold, history)
+
+
+if __name__ == "__main__":
+    main()
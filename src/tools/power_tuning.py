@@ -0,0 +1,215 @@
+import argparse
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.core.log import get_logger
+from src.core.report import InvocationReport, parse_report, percentile
+
+logger = get_logger("tools")
+
+DEFAULT_MEMORY_SIZES = (128, 256, 512, 1024, 1769, 3008)
+
+STRATEGIES = ("cost", "speed", "balanced")
+
+
+@dataclass
+class TuningPoint:
+    """Messergebnis für eine Memory Size"""
+    memory_size: int
+    reports: list[InvocationReport] = field(default_factory=list)
+    errors: int = 0
+    architecture: str = "x86_64"
+
+    @property
+    def warm(self) -> list[InvocationReport]:
+        # The first call after a configuration change is a cold start
+        return [report for report in self.reports if not report.cold_start] or self.reports
+
+    @property
+    def p50_ms(self) -> Optional[float]:
+        return percentile((r.duration_ms for r in self.warm), 50)
+
+    @property
+    def p95_ms(self) -> Optional[float]:
+        return percentile((r.duration_ms for r in self.warm), 95)
+
+    @property
+    def init_ms(self) -> Optional[float]:
+        inits = [r.init_duration_ms for r in self.reports if r.cold_start]
+        return sum(inits) / len(inits) if inits else None
+
+    @property
+    def cost_per_invocation(self) -> Optional[float]:
+        """Durchschnittliche Kosten einer warmen Invocation in USD"""
+        warm = self.warm
+        return sum(r.cost(self.architecture) for r in warm) / len(warm) if warm else None
+
+    def to_dict(self) -> dict:
+        return {
+            "memory_size": self.memory_size,
+            "invocations": len(self.reports),
+            "errors": self.errors,
+            "p50_ms": self.p50_ms,
+            "p95_ms": self.p95_ms,
+            "init_ms": self.init_ms,
+            "cost_per_invocation": self.cost_per_invocation,
+        }
+
+
+@dataclass
+class TuningResult:
+    """Kosten/Latenz Kurve und empfohlene Memory Size"""
+    function_name: str
+    strategy: str
+    points: list[TuningPoint]
+    recommendation: Optional[int]
+
+    def to_dict(self) -> dict:
+        return {
+            "function_name": self.function_name,
+            "strategy": self.strategy,
+            "recommendation": self.recommendation,
+            "points": [point.to_dict() for point in self.points],
+        }
+
+
+class PowerTuner:
+    """
+    Memory sweep for a Lambda function.
+
+    For every memory size the function is reconfigured (configuration-only
+    update), invoked `invocations` times with LogType=Tail and the REPORT
+    lines are collected. The first invocation after the update is a cold
+    start: its init duration is reported separately and it is left out of
+    the latency/cost figures. The original memory size is restored at the end.
+
+    The function can be a LambdaFunction or any stand-in with the same
+    invoke(payload, log_type=...) and reconfigure(memory_size=...) methods.
+    """
+
+    def __init__(
+        self,
+        function,
+        memory_sizes: tuple[int, ...] = DEFAULT_MEMORY_SIZES,
+        invocations: int = 10,
+        payload: Optional[dict] = None,
+        strategy: str = "balanced",
+        architecture: str = "x86_64"
+    ):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unbekannte Strategie: {strategy} (erlaubt: {', '.join(STRATEGIES)})")
+        self.function = function
+        self.memory_sizes = tuple(sorted(memory_sizes))
+        self.invocations = invocations
+        self.payload = payload or {}
+        self.strategy = strategy
+        self.architecture = architecture
+
+    def run(self) -> TuningResult:
+        original = self.function.memory_size
+        points = []
+        try:
+            for memory_size in self.memory_sizes:
+                points.append(self._measure(memory_size))
+        finally:
+            if self.function.memory_size != original:
+                self.function.reconfigure(memory_size=original)
+
+        result = TuningResult(self.function.function_name, self.strategy, points, self._recommend(points))
+        self._log(result)
+        return result
+
+    def _measure(self, memory_size: int) -> TuningPoint:
+        logger.info(f"Power Tuning {self.function.function_name}: {memory_size} MB...")
+        self.function.reconfigure(memory_size=memory_size)
+        point = TuningPoint(memory_size, architecture=self.architecture)
+        for _ in range(self.invocations):
+            response = self.function.invoke(self.payload, log_type="Tail")
+            if response.get("FunctionError"):
+                point.errors += 1
+            report = parse_report(response.get("LogResult", ""))
+            if report is not None:
+                point.reports.append(report)
+        return point
+
+    def _recommend(self, points: list[TuningPoint]) -> Optional[int]:
+        # Sizes with errors are never recommended (e.g. out of memory)
+        candidates = [p for p in points if p.reports and not p.errors]
+        if not candidates:
+            return None
+        if self.strategy == "cost":
+            best = min(candidates, key=lambda p: (p.cost_per_invocation, p.p95_ms))
+        elif self.strategy == "speed":
+            best = min(candidates, key=lambda p: (p.p95_ms, p.cost_per_invocation))
+        else:
+            # Normalized cost x latency - the knee of the curve
+            min_cost = min(p.cost_per_invocation for p in candidates)
+            min_p95 = min(p.p95_ms for p in candidates) or 1
+            best = min(candidates, key=lambda p: (p.cost_per_invocation / min_cost) * (p.p95_ms / min_p95))
+        return best.memory_size
+
+    @staticmethod
+    def _log(result: TuningResult) -> None:
+        logger.info(f"Power Tuning {result.function_name} ({result.strategy}):")
+        logger.info(f"  {'Memory':>8} {'p50':>10} {'p95':>10} {'Init':>10} {'USD/1M':>10} {'Fehler':>7}")
+        for point in result.points:
+            marker = " ←" if point.memory_size == result.recommendation else ""
+            logger.info(
+                f"  {point.memory_size:>5} MB {_ms(point.p50_ms):>10} {_ms(point.p95_ms):>10} "
+                f"{_ms(point.init_ms):>10} {_usd(point.cost_per_invocation):>10} {point.errors:>7}{marker}",
+                extra=point.to_dict()
+            )
+        if result.recommendation is None:
+            logger.warning("Warnung: keine Memory Size ohne Fehler gemessen")
+        else:
+            logger.info(f"Empfehlung: memory_size={result.recommendation}")
+
+
+def _ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.1f} ms"
+
+
+def _usd(cost: Optional[float]) -> str:
+    return "-" if cost is None else f"{cost * 1_000_000:.2f}"
+
+
+def main(argv: Optional[list[str]] = None) -> TuningResult:
+    """python -m src.tools.power_tuning hallo-welt --memory 128 256 512"""
+    from src.core.log import configure_logging
+    from src.model import AwsEnviroment
+    from src.resources.lambda_function import LambdaFunction
+
+    parser = argparse.ArgumentParser(description="Lambda Power Tuning (Memory Sweep)")
+    parser.add_argument("function_name")
+    parser.add_argument("--memory", type=int, nargs="+", default=list(DEFAULT_MEMORY_SIZES))
+    parser.add_argument("--invocations", type=int, default=10)
+    parser.add_argument("--payload", default="{}", help="JSON Payload")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="balanced")
+    parser.add_argument("--output", help="Ergebnis als JSON schreiben")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    env = AwsEnviroment(
+        profile=os.getenv("AWS_PROFILE", "default"),
+        region=os.getenv("AWS_REGION", "eu-central-1"),
+        account=os.getenv("AWS_ACCOUNT", "")
+    )
+    function = LambdaFunction.get(args.function_name, env)
+    if function._missing:
+        raise SystemExit(f"Lambda Function nicht gefunden: {args.function_name}")
+
+    started = time.monotonic()
+    result = PowerTuner(function, tuple(args.memory), args.invocations, json.loads(args.payload),
+                        args.strategy).run()
+    logger.info(f"Power Tuning abgeschlossen in {time.monotonic() - started:.0f}s")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result.to_dict(), f, indent=2)
+    return result
+
+
+if __name__ == "__main__":
+    main()
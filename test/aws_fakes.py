@@ -0,0 +1,43 @@
+"""Gemeinsame botocore Fakes der Tests - Requests werden lokal beantwortet, ohne AWS"""
+import io
+import json
+from typing import Callable, Optional, Union
+
+import boto3
+from botocore.awsrequest import AWSResponse
+
+from src.model import AwsEnviroment
+
+ENV = AwsEnviroment(profile="default", region="eu-central-1", account="123456789012")
+
+
+class FakeRaw:
+    """Roher HTTP Body einer AWSResponse"""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self._stream = io.BytesIO(body)
+
+    def stream(self, **kwargs):
+        yield self.body
+
+    def read(self, amt=None, **kwargs) -> bytes:
+        # Streaming responses (Invoke Payload) are read from the raw body
+        return self._stream.read(amt)
+
+
+def aws_response(request, body: Union[bytes, dict, list] = b"", status: int = 200,
+                 headers: Optional[dict] = None) -> AWSResponse:
+    """Antwort auf einen Request - dicts und Listen werden als JSON gesendet"""
+    if not isinstance(body, bytes):
+        body = json.dumps(body).encode()
+    return AWSResponse(request.url, status, headers or {}, FakeRaw(body))
+
+
+def fake_session(handler: Optional[Callable] = None, event_name: str = "before-send") -> boto3.session.Session:
+    """Session mit Dummy Credentials; handler beantwortet die Requests (z.B. event_name="before-send.lambda")"""
+    session = boto3.session.Session(aws_access_key_id="test", aws_secret_access_key="test",
+                                    region_name=ENV.region)
+    if handler is not None:
+        session.events.register(event_name, handler)
+    return session
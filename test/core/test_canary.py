@@ -0,0 +1,93 @@
+from src.core import Canary, CanaryConfig
+from src.core.canary import ReportMetrics
+from src.model import AwsEnviroment
+from src.resources.lambda_function import LambdaFunction
+from test.tools.local_lambda import LocalLambda
+
+
+def _handler(event, context):
+    return {"statusCode": 200}
+
+
+def _failing(event, context):
+    raise RuntimeError("kaputt")
+
+
+def _function(candidate_handler=_handler, candidate_ms: float = 100.0) -> LocalLambda:
+    function = LocalLambda(_handler, "todo-list", duration=lambda memory: 100.0)
+    function.publish_version()
+    function.publish_version(candidate_handler, lambda memory: candidate_ms)
+    function.route_alias("live", "1")
+    return function
+
+
+def _config(**overrides) -> CanaryConfig:
+    settings = dict(weight=0.3, duration=0.2, interval=0.05, payloads=[{}] * 100)
+    return CanaryConfig(**{**settings, **overrides})
+
+
+def test_canary_promote():
+    """Testet einen Canary ohne Regression"""
+    function = _function(candidate_ms=105.0)
+    result = Canary(function, "live", "1", "2", _config()).run()
+
+    assert result.promoted, result.reason
+    assert result.stable.invocations > 0 and result.candidate.invocations > 0
+    # Weighted first, then the whole alias on the new version
+    assert function.alias_updates[1] == ("live", "1", {"2": 0.3})
+    assert function.alias_updates[-1] == ("live", "2", {})
+    print("✓ Neue Version nach der Beobachtung übernommen")
+
+    # A single payload at the default weight still reaches min_invocations
+    function = _function()
+    result = Canary(function, "live", "1", "2", _config(weight=0.1, payloads=[{}])).run()
+    assert result.promoted, result.reason
+    assert result.candidate.invocations >= 20
+    print("✓ Synthetischer Traffic reicht für min_invocations")
+
+
+def test_canary_rollback():
+    """Testet den Rollback bei Latenz- und Fehler-Regressionen und zu wenig Traffic"""
+    slow = _function(candidate_ms=180.0)
+    result = Canary(slow, "live", "1", "2", _config(duration=60)).run()
+    assert not result.promoted and "p95" in result.reason
+    # Regressions roll back right away instead of waiting for the full duration
+    assert result.duration_s < 5
+    assert slow.alias_updates[-1] == ("live", "1", {})
+    print("✓ Latenz-Regression zurückgerollt")
+
+    failing = _function(candidate_handler=_failing)
+    result = Canary(failing, "live", "1", "2", _config()).run()
+    assert not result.promoted and "Fehlerrate" in result.reason
+    assert result.candidate.error_rate == 1.0 and result.stable.error_rate == 0.0
+    print("✓ Fehler-Regression zurückgerollt")
+
+    idle = _function()
+    # No synthetic traffic and no calls from outside
+    result = Canary(idle, "live", "1", "2", _config(payloads=[]), metrics=ReportMetrics()).run()
+    assert not result.promoted and "zu wenige" in result.reason
+    assert idle.alias_updates[-1] == ("live", "1", {})
+    print("✓ Ohne genug Traffic keine Übernahme")
+
+
+def test_canary_config():
+    """Testet die Validierung der Canary Konfiguration"""
+    env = AwsEnviroment(profile="default", region="eu-central-1", account="123456789012")
+    try:
+        LambdaFunction(function_name="hello", handler="lambda_function.lambda_handler", runtime="python3.13",
+                       code_path="", role_arn="", env=env, canary=CanaryConfig())
+        raise AssertionError("ValueError erwartet: canary ohne alias")
+    except ValueError:
+        pass
+    try:
+        CanaryConfig(weight=1.5)
+        raise AssertionError("ValueError erwartet")
+    except ValueError:
+        pass
+    print("✓ Ungültige Konfiguration abgelehnt")
+
+
+if __name__ == "__main__":
+    test_canary_promote()
+    test_canary_rollback()
+    test_canary_config()
@@ -0,0 +1,72 @@
+from src.core import describe_cache
+from src.core.describe_cache import DescribeCache, uncached
+from test.aws_fakes import aws_response, fake_session
+
+
+class _FakeLambda:
+    """Beantwortet HTTP Requests lokal und zählt sie (Stubber validiert vor dem Cache)"""
+
+    def __init__(self):
+        self.code_sha256 = "a"
+        self.requests = []
+
+    def __call__(self, request, **kwargs):
+        self.requests.append(request.method)
+        return aws_response(request, {"Configuration": {"FunctionName": "hello", "CodeSha256": self.code_sha256}})
+
+
+def _lambda_client(cache: DescribeCache, fake: _FakeLambda):
+    session = fake_session()
+    cache.register(session)
+    session.events.register("before-send.lambda", fake)
+    return session.client("lambda")
+
+
+def _sha(response: dict) -> str:
+    return response["Configuration"]["CodeSha256"]
+
+
+def test_describe_cache():
+    """Testet Cache Hits, Invalidierung durch Mutationen und uncached()"""
+    cache = DescribeCache()
+    fake = _FakeLambda()
+    client = _lambda_client(cache, fake)
+    describe_cache.activate(cache)
+
+    try:
+        first = client.get_function(FunctionName="hello")
+        second = client.get_function(FunctionName="hello")
+        assert _sha(first) == "a" and _sha(second) == "a"
+        assert len(fake.requests) == 1
+        assert cache.hits == 1 and cache.misses == 1
+
+        # Cached responses are copies
+        second["Configuration"]["CodeSha256"] = "modified"
+        assert _sha(client.get_function(FunctionName="hello")) == "a"
+        print("✓ Cache Hit")
+
+        # A mutation of the same function invalidates its entries
+        fake.code_sha256 = "b"
+        client.update_function_configuration(FunctionName="hello", Timeout=10)
+        assert _sha(client.get_function(FunctionName="hello")) == "b"
+        assert len(fake.requests) == 3
+        print("✓ Invalidierung nach Mutation")
+
+        # Polling reads bypass the cache but refresh the entry
+        fake.code_sha256 = "c"
+        with uncached():
+            assert _sha(client.get_function(FunctionName="hello")) == "c"
+        assert _sha(client.get_function(FunctionName="hello")) == "c"
+        assert len(fake.requests) == 4
+        print("✓ uncached()")
+    finally:
+        describe_cache.activate(None)
+
+    # Without an active cache every call goes to AWS
+    client.get_function(FunctionName="hello")
+    assert len(fake.requests) == 5
+    print("✓ Inaktiver Cache")
+
+
+if __name__ == "__main__":
+    test_describe_cache()
@@ -0,0 +1,83 @@
+import threading
+import time
+
+from src.core import events
+from src.core.events import EventBus, DeploymentSubscriber
+
+
+class RecordingSubscriber(DeploymentSubscriber):
+    def __init__(self):
+        self.events = []
+
+    def on_plan(self, event):
+        self.events.append(event)
+
+
+class SlowSubscriber(DeploymentSubscriber):
+    def __init__(self):
+        self.release = threading.Event()
+        self.events = []
+
+    def on_wait(self, event):
+        self.release.wait(5)
+        self.events.append(event)
+
+
+def test_events():
+    """Testet Event Bus Dispatching"""
+    bus = EventBus()
+    assert not bus.wants("on_plan")
+
+    # Without subscribers nothing is dispatched
+    bus.plan("01-role", "iam_role", "create")
+
+    recorder = bus.subscribe(RecordingSubscriber())
+    assert bus.wants("on_plan")
+    assert not bus.wants("on_wait")
+
+    bus.plan("01-role", "iam_role", "create")
+    assert len(recorder.events) == 1
+    assert recorder.events[0].action == "create"
+
+    bus.unsubscribe(recorder)
+    assert not bus.wants("on_plan")
+    print("✓ Synchronous dispatch")
+
+    # Async subscribers never block the emitter
+    slow = SlowSubscriber()
+    bus.subscribe(slow, asynchronous=True)
+    started = time.perf_counter()
+    for attempt in range(3):
+        bus.wait("cloudfront:E123", "distribution deployment", attempt, 30)
+    assert time.perf_counter() - started < 1
+    slow.release.set()
+    bus.flush()
+    assert len(slow.events) == 3
+    print("✓ Asynchronous dispatch")
+
+    # Unsubscribing an async subscriber delivers its queued events and stops the worker
+    wrapper = bus.subscribe(RecordingSubscriber(), asynchronous=True)
+    bus.plan("01-role", "iam_role", "create")
+    bus.unsubscribe(wrapper.subscriber)
+    assert not bus.wants("on_plan")
+    assert len(wrapper.subscriber.events) == 1
+    assert not wrapper._thread.is_alive()
+    print("✓ Async worker stopped on unsubscribe")
+
+    # Resources and sessions emit to the bus of the running deployment
+    deployment_bus = EventBus()
+    waits = deployment_bus.subscribe(SlowSubscriber())
+    waits.release.set()
+    events.activate(deployment_bus)
+    try:
+        assert events.active() is deployment_bus
+        events.active().wait("dynamodb:todos", "table_exists", 1, 20)
+    finally:
+        events.activate(None)
+    assert events.active() is events.bus
+    assert len(waits.events) == 1
+    print("✓ Events of the active deployment bus")
+
+
+if __name__ == "__main__":
+    test_events()
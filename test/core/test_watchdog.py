@@ -0,0 +1,49 @@
+import io
+import time
+
+from src.core.log import configure_logging
+from src.core.watchdog import Watchdog, DeadlineExceededError
+
+
+def test_watchdog():
+    """Testet Budget-Warnungen und harte Deadlines"""
+    output = io.StringIO()
+    configure_logging("INFO", json_lines=output, console=False)
+
+    watchdog = Watchdog(
+        budgets={"lambda": 0.05},
+        deadlines={"lambda": 0.3},
+        poll_interval=0.02
+    )
+
+    try:
+        # Slow operation: warning with stack dump, then hard deadline
+        try:
+            with watchdog.watch("10-lambda-hello", "lambda", "create"):
+                watchdog.api_call_started("lambda", "GetFunction")
+                time.sleep(0.15)
+                watchdog.check_deadline()
+                time.sleep(0.25)
+                watchdog.check_deadline()
+            raise AssertionError("DeadlineExceededError expected")
+        except DeadlineExceededError as e:
+            assert "10-lambda-hello" in str(e)
+        print("✓ Deadline exceeded")
+
+        log = output.getvalue()
+        assert "10-lambda-hello" in log
+        assert "lambda.GetFunction" in log
+        assert "test_watchdog" in log  # stack dump of the stuck thread
+        print("✓ Slow operation reported")
+
+        # Fast operation within budget
+        with watchdog.watch("11-lambda-fast", "lambda", "update"):
+            watchdog.check_deadline()
+        print("✓ Fast operation")
+    finally:
+        watchdog.close()
+        configure_logging("INFO")
+
+
+if __name__ == "__main__":
+    test_watchdog()
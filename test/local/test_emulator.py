@@ -0,0 +1,103 @@
+import json
+import tempfile
+import urllib.request
+from pathlib import Path
+
+from src.local import LocalApi
+from src.model import AwsEnviroment
+from src.resources.api_gateway import ApiGateway
+from src.resources.lambda_function import LambdaFunction
+
+ENV = AwsEnviroment(profile="default", region="eu-central-1", account="123456789012")
+
+ECHO_HANDLER = '''
+import json
+import os
+
+imports = 0
+imports += 1
+TABLE_NAME = os.environ.get("TABLE_NAME")
+
+
+def lambda_handler(event, context):
+    if event.get("queryStringParameters", {}).get("fail"):
+        raise RuntimeError("kaputt")
+    return {
+        "statusCode": 200,
+        "headers": {"Content-Type": "application/json"},
+        "body": json.dumps({
+            "routeKey": event["routeKey"],
+            "pathParameters": event.get("pathParameters"),
+            "query": event.get("queryStringParameters"),
+            "body": json.loads(event.get("body", "{}")),
+            "table": TABLE_NAME,
+            "endpoint": os.environ.get("AWS_ENDPOINT_URL_DYNAMODB"),
+            "imports": imports,
+            "function": context.function_name,
+        }),
+    }
+'''
+
+
+def _function(tmp: str, name: str, source: str) -> LambdaFunction:
+    code_path = Path(tmp) / name
+    code_path.mkdir()
+    (code_path / "lambda_function.py").write_text(source)
+    return LambdaFunction(function_name=name, handler="lambda_function.lambda_handler", runtime="python3.13",
+                          code_path=str(code_path), role_arn="", env=ENV,
+                          environment_variables={"TABLE_NAME": "todos"})
+
+
+def _route(method: str, name: str) -> dict:
+    return {"method": method, "lambda_arn": f"arn:aws:lambda:eu-central-1:123456789012:function:{name}",
+            "lambda_name": name}
+
+
+def test_local_api():
+    """Testet Routing, Payload Format 2.0 Events und warme Worker ohne AWS"""
+    with tempfile.TemporaryDirectory() as tmp:
+        todo = _function(tmp, "todo", ECHO_HANDLER)
+        plain = _function(tmp, "plain", "def lambda_handler(event, context):\n    return {'hello': 'welt'}\n")
+        api_gateway = ApiGateway("local", {
+            "/api/todos/{id}/update": _route("PUT", "todo"),
+            "/api/todos/create": _route("POST", "todo"),
+            "/api/todos/{id}": _route("GET", "todo"),
+            "/api/hello": _route("GET", "plain"),
+        }, ENV)
+
+        api = LocalApi(api_gateway, [todo, plain], environment={"TABLE_NAME": "todos-local"},
+                       dynamodb_endpoint="http://localhost:8000")
+
+        response = api.request("PUT", "/api/todos/42/update?x=1&x=2", {"Content-Type": "application/json"},
+                               json.dumps({"completed": True}).encode())
+        data = response.json()
+        assert response.status == 200
+        assert data["routeKey"] == "PUT /api/todos/{id}/update"
+        assert data["pathParameters"] == {"id": "42"}
+        assert data["query"] == {"x": "1,2"}
+        assert data["body"] == {"completed": True}
+        assert data["table"] == "todos-local" and data["endpoint"] == "http://localhost:8000"
+        print("✓ Payload Format 2.0 Event")
+
+        # Routes match on method and path; the module is imported once (warm worker)
+        assert api.request("DELETE", "/api/todos/7").status == 404
+        assert api.request("GET", "/api/todos/create").json()["pathParameters"] == {"id": "create"}
+        assert api.request("POST", "/api/todos/create").json()["pathParameters"] is None
+        assert api.request("GET", "/api/todos/7").json()["imports"] == 1
+        assert api.request("GET", "/api/hello").json() == {"hello": "welt"}
+        assert api.request("GET", "/api/todos/7?fail=1").status == 500
+        assert api.report()["PUT /api/todos/{id}/update"]["count"] == 1
+        print("✓ Routing und warme Worker")
+
+        with api:
+            base_url = api.start()
+            request = urllib.request.Request(f"{base_url}/api/todos/9/update", method="PUT",
+                                             data=b'{"title": "x"}')
+            with urllib.request.urlopen(request) as http_response:
+                assert http_response.status == 200
+                assert json.loads(http_response.read())["pathParameters"] == {"id": "9"}
+        print("✓ HTTP Server")
+
+
+if __name__ == "__main__":
+    test_local_api()
@@ -0,0 +1,61 @@
+import os
+import tempfile
+from pathlib import Path
+
+from src.packaging import IgnoreRules, collect_files
+
+
+def test_ignore_rules():
+    """Testet .myzelignore Regeln und das Prunen ignorierter Verzeichnisse"""
+    with tempfile.TemporaryDirectory() as tmp:
+        code_path = Path(tmp) / "hello"
+        for name in ("lambda_function.py", "pyproject.toml", "lib/util.py", "lib/util.pyc",
+                     "lib/fixtures/data.json", "lib/fixtures/keep.json", "docs/index.md",
+                     "data/big.bin", "vendor/data/schema.json", ".venv/lib/site.py",
+                     "node_modules/left-pad/index.js", "__pycache__/x.cpython-313.pyc"):
+            (code_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (code_path / name).write_text(name)
+        (code_path / ".myzelignore").write_text(
+            "# Testdaten\n"
+            "fixtures/\n"
+            "/data/\n"
+            "**/*.md\n"
+        )
+
+        arcnames = [arcname for _, arcname in collect_files(code_path)]
+        assert arcnames == ["lambda_function.py", "lib/util.py", "vendor/data/schema.json"]
+        print("✓ Default Regeln und .myzelignore angewendet")
+
+        rules = IgnoreRules.for_directory(code_path)
+        assert rules.ignored("lib/fixtures", is_dir=True)
+        assert rules.ignored("data", is_dir=True)
+        assert not rules.ignored("vendor/data", is_dir=True)
+        assert not rules.ignored("fixtures")
+        print("✓ Verzeichnis-Regeln und verankerte Muster")
+
+        # Last matching rule wins
+        negated = IgnoreRules(["*.json", "!keep.json"])
+        assert negated.ignored("a/data.json")
+        assert not negated.ignored("a/keep.json")
+        print("✓ Negation")
+
+        # Ignored directories are pruned, not descended into
+        visited = []
+        original_walk = os.walk
+
+        def recording_walk(top, *args, **kwargs):
+            for entry in original_walk(top, *args, **kwargs):
+                visited.append(Path(entry[0]).relative_to(code_path).as_posix())
+                yield entry
+
+        os.walk = recording_walk
+        try:
+            collect_files(code_path)
+        finally:
+            os.walk = original_walk
+        assert not any(path.startswith((".venv", "node_modules", "lib/fixtures", "data")) for path in visited)
+        print("✓ Ignorierte Verzeichnisse werden nicht durchsucht")
+
+
+if __name__ == "__main__":
+    test_ignore_rules()
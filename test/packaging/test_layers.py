@@ -0,0 +1,92 @@
+import hashlib
+import tempfile
+import zipfile
+from pathlib import Path
+
+from src.packaging import LayerBuilder, OptimizeOptions, PackageCache, group_by_lock, locked_wheels
+from src.packaging.layers import lock_hash
+
+WHEEL = "tinydep-1.0.0-py3-none-any.whl"
+
+
+def write_wheel(wheel_dir: Path) -> str:
+    """Erzeuge eine minimale pure-Python Wheel und gib ihren SHA-256 zurück"""
+    wheel_dir.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(wheel_dir / WHEEL, 'w') as wheel:
+        wheel.writestr("tinydep/__init__.py", "VALUE = 1\n")
+        wheel.writestr("tinydep-1.0.0.dist-info/METADATA", "Name: tinydep\nVersion: 1.0.0\n")
+        wheel.writestr("tinydep-1.0.0.data/scripts/tinydep", "#!/bin/sh\n")
+    return hashlib.sha256((wheel_dir / WHEEL).read_bytes()).hexdigest()
+
+
+def write_function(function_dir: Path, wheel_sha256: str, with_dependency: bool = True) -> None:
+    """Function Verzeichnis mit pyproject.toml und uv.lock"""
+    function_dir.mkdir(parents=True, exist_ok=True)
+    (function_dir / "lambda_function.py").write_text("def lambda_handler(event, context):\n    return 1\n")
+    dependencies = '["tinydep"]' if with_dependency else "[]"
+    (function_dir / "pyproject.toml").write_text(
+        f'[project]\nname = "{function_dir.name}"\nversion = "0.1.0"\ndependencies = {dependencies}\n'
+    )
+    lock = f'version = 1\n\n[[package]]\nname = "{function_dir.name}"\nversion = "0.1.0"\nsource = {{ editable = "." }}\n'
+    if with_dependency:
+        lock += (
+            '\n[[package]]\nname = "tinydep"\nversion = "1.0.0"\n'
+            'source = { registry = "https://pypi.org/simple" }\n'
+            'wheels = [\n'
+            '    { url = "https://files.example/tinydep-1.0.0-cp313-cp313-win_amd64.whl", hash = "sha256:00", size = 1 },\n'
+            f'    {{ url = "https://files.example/{WHEEL}", hash = "sha256:{wheel_sha256}", size = 1 }},\n'
+            ']\n'
+        )
+    (function_dir / "uv.lock").write_text(lock)
+
+
+def test_layer_builder():
+    """Testet Lock Auflösung, Gruppierung nach Lock-Hash und Layer Build aus dem Wheel Cache"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        sha256 = write_wheel(tmp / "wheels")
+        write_function(tmp / "functions" / "todo_create", sha256)
+        write_function(tmp / "functions" / "todo_list", sha256)
+        write_function(tmp / "functions" / "hallo_welt", sha256, with_dependency=False)
+
+        wheels = locked_wheels(tmp / "functions" / "todo_create")
+        assert [(w.name, w.version, w.filename) for w in wheels] == [("tinydep", "1.0.0", WHEEL)]
+        print("✓ uv.lock aufgelöst (Windows Wheel ignoriert)")
+
+        # Identical locks share one layer, functions without dependencies need none
+        groups = group_by_lock(tmp / "functions")
+        assert len(groups) == 1
+        assert [d.name for d in next(iter(groups.values()))] == ["todo_create", "todo_list"]
+        print("✓ Gruppierung nach Lock-Hash")
+
+        # Optimized layers are a different layer version than plain ones
+        plain = lock_hash(wheels, "python3.13", "x86_64")
+        optimized = lock_hash(wheels, "python3.13", "x86_64", OptimizeOptions())
+        assert plain != optimized
+        assert optimized != lock_hash(wheels, "python3.13", "x86_64", OptimizeOptions(precompile=False))
+        assert plain in groups
+        print("✓ Optimize Optionen im Lock-Hash")
+
+        builder = LayerBuilder(tmp / "wheels", PackageCache(tmp / "cache"))
+        layer = builder.build(wheels, "python3.13", "x86_64", "deps")
+        with zipfile.ZipFile(layer.zip_path) as archive:
+            names = archive.namelist()
+        assert names == sorted(names)
+        assert "python/tinydep/__init__.py" in names
+        assert "python/tinydep-1.0.0.dist-info/METADATA" in names
+        assert not any("scripts" in name for name in names)
+        assert builder.build(wheels, "python3.13", "x86_64", "deps").code_sha256 == layer.code_sha256
+        print("✓ Layer gebaut")
+
+        # Tampered wheel is rejected
+        (tmp / "wheels" / WHEEL).write_bytes(b"broken")
+        try:
+            LayerBuilder(tmp / "wheels", PackageCache(tmp / "cache2")).build(wheels, "python3.13", "x86_64", "deps")
+            raise AssertionError("ValueError expected")
+        except ValueError:
+            pass
+        print("✓ Hash Prüfung")
+
+
+if __name__ == "__main__":
+    test_layer_builder()
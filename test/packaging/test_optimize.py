@@ -0,0 +1,55 @@
+import importlib.util
+import marshal
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+from src.packaging import OptimizeOptions, PackageCache
+
+RUNTIME = f"python{sys.version_info[0]}.{sys.version_info[1]}"
+TAG = f"cpython-{sys.version_info[0]}{sys.version_info[1]}"
+
+
+def test_optimize():
+    """Testet Tree-Shaking und vorkompilierten Bytecode für die Ziel-Runtime"""
+    with tempfile.TemporaryDirectory() as tmp:
+        code_path = Path(tmp) / "hello"
+        (code_path / "vendor" / "tests").mkdir(parents=True)
+        (code_path / "lambda_function.py").write_text("def lambda_handler(event, context):\n    return 42\n")
+        (code_path / "vendor" / "__init__.py").write_text("")
+        (code_path / "vendor" / "__init__.pyi").write_text("")
+        (code_path / "vendor" / "tests" / "test_vendor.py").write_text("assert True\n")
+
+        cache = PackageCache(Path(tmp) / "cache")
+        plain = cache.package(code_path, "hello", runtime=RUNTIME)
+        optimized = cache.package(code_path, "hello", OptimizeOptions(), RUNTIME)
+        assert optimized.source_hash != plain.source_hash
+
+        with zipfile.ZipFile(optimized.zip_path) as archive:
+            names = archive.namelist()
+            pyc = archive.read(f"__pycache__/lambda_function.{TAG}.pyc")
+
+        assert "lambda_function.py" in names
+        assert f"vendor/__pycache__/__init__.{TAG}.pyc" in names
+        assert not any("tests/" in name or name.endswith(".pyi") for name in names)
+        print("✓ Nicht benötigte Dateien entfernt")
+
+        # Unchecked hash-based pyc for the target interpreter
+        assert pyc[:4] == importlib.util.MAGIC_NUMBER
+        assert int.from_bytes(pyc[4:8], "little") == 0b01
+        namespace = {}
+        exec(marshal.loads(pyc[16:]), namespace)
+        assert namespace["lambda_handler"](None, None) == 42
+        assert marshal.loads(pyc[16:]).co_filename == "/var/task/lambda_function.py"
+        print("✓ Bytecode vorkompiliert")
+
+        # Precompile only
+        only_pyc = cache.package(code_path, "hello", OptimizeOptions(strip=()), RUNTIME)
+        with zipfile.ZipFile(only_pyc.zip_path) as archive:
+            assert "vendor/__init__.pyi" in archive.namelist()
+        print("✓ Konfigurierbare Regeln")
+
+
+if __name__ == "__main__":
+    test_optimize()
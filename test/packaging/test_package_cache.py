@@ -0,0 +1,86 @@
+import hashlib
+import io
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+from src.packaging import PackageCache
+from src.packaging.buffer import ZipBuffer
+
+
+def test_package_cache():
+    """Testet Cache Treffer, Invalidierung durch Inhaltsänderungen und Exclude-Regeln"""
+    with tempfile.TemporaryDirectory() as tmp:
+        code_path = Path(tmp) / "hello"
+        code_path.mkdir()
+        (code_path / "lambda_function.py").write_text("def lambda_handler(event, context):\n    return 1\n")
+        cache = PackageCache(Path(tmp) / "cache")
+
+        first = cache.package(code_path, "hello")
+        assert first.size == len(first.zip_bytes)
+        assert first.code_sha256.endswith("=")
+
+        # Unchanged source: same entry, zip is not rebuilt
+        second = cache.package(code_path, "hello")
+        assert second.source_hash == first.source_hash
+        assert second.code_sha256 == first.code_sha256
+        assert second.zip_bytes == first.zip_bytes
+        print("✓ Cache Hit")
+
+        # Excluded files do not change the key
+        (code_path / "README.md").write_text("docs")
+        (code_path / "__pycache__").mkdir()
+        (code_path / "__pycache__" / "lambda_function.cpython-313.pyc").write_bytes(b"\0")
+        assert cache.package(code_path, "hello").source_hash == first.source_hash
+        print("✓ Exclude-Regeln")
+
+        # Changed content: new key and new CodeSha256
+        (code_path / "lambda_function.py").write_text("def lambda_handler(event, context):\n    return 2\n")
+        changed = cache.package(code_path, "hello")
+        assert changed.source_hash != first.source_hash
+        assert changed.code_sha256 != first.code_sha256
+        print("✓ Inhaltsänderung")
+
+
+def test_reproducible_zip():
+    """Identische Quellen ergeben byte-identische Archive, unabhängig von mtimes und Reihenfolge"""
+    with tempfile.TemporaryDirectory() as tmp:
+        hashes = []
+        for index, (names, mtime) in enumerate([(["b.py", "a.py"], 1_000_000), (["a.py", "b.py"], 2_000_000)]):
+            code_path = Path(tmp) / f"src{index}"
+            code_path.mkdir()
+            for name in names:
+                file_path = code_path / name
+                file_path.write_text(f"# {name}\n")
+                os.utime(file_path, (mtime, mtime))
+            # Separate caches: the second archive is really rebuilt
+            hashes.append(PackageCache(Path(tmp) / f"cache{index}").package(code_path, "hello").code_sha256)
+
+        assert hashes[0] == hashes[1]
+        print("✓ Reproduzierbares ZIP")
+
+
+def test_zip_buffer():
+    """Kleine Archive bleiben im Speicher, große werden auf Disk ausgelagert"""
+    for threshold, spilled in [(1024 * 1024, False), (512, True)]:
+        buffer = ZipBuffer(spill_threshold=threshold)
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zipf:
+            zipf.writestr("a.txt", os.urandom(4096))
+        assert buffer.spilled == spilled
+
+        written = io.BytesIO()
+        buffer.write_to(written)
+        assert buffer.size() == len(written.getvalue())
+        assert buffer.sha256() == hashlib.sha256(written.getvalue()).digest()
+        assert zipfile.ZipFile(io.BytesIO(written.getvalue())).namelist() == ["a.txt"]
+        if not spilled:
+            assert bytes(buffer.payload()) == written.getvalue()
+        buffer.close()
+    print("✓ ZipBuffer")
+
+
+if __name__ == "__main__":
+    test_package_cache()
+    test_reproducible_zip()
+    test_zip_buffer()
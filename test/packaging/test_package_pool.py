@@ -0,0 +1,44 @@
+import tempfile
+from pathlib import Path
+
+from src.packaging import OptimizeOptions, PackageCache, PackagePool
+
+
+def test_package_pool():
+    """Testet parallelen Build, Deduplizierung identischer Quellen und Cache Skip"""
+    with tempfile.TemporaryDirectory() as tmp:
+        sources = []
+        for name, body in [("a", "return 'a'"), ("b", "return 'b'"), ("a_copy", "return 'a'")]:
+            code_path = Path(tmp) / name
+            code_path.mkdir()
+            (code_path / "lambda_function.py").write_text(f"def lambda_handler(event, context):\n    {body}\n")
+            sources.append(code_path)
+
+        cache = PackageCache(Path(tmp) / "cache")
+        with PackagePool(cache, max_workers=2) as pool:
+            pool.prepackage(*sources)
+            a, b, a_copy = (pool.result(path) for path in sources)
+            assert a.code_sha256 != b.code_sha256
+            # Identical sources are built once and share the entry
+            assert a.source_hash == a_copy.source_hash
+            assert cache.lookup(a.source_hash).zip_bytes == a.zip_bytes
+            assert pool.skipped == 0
+        print("✓ Paralleler Build")
+
+        # Second run: everything comes from the cache
+        with PackagePool(cache, max_workers=2) as pool:
+            pool.prepackage(*sources)
+            assert pool.skipped == 3
+            assert pool.result(sources[1]).code_sha256 == b.code_sha256
+            assert pool.result(Path(tmp) / "unknown") is None
+            # A plain prebuild is never handed to a function that wants an optimized package
+            optimize = OptimizeOptions(precompile=False)
+            assert pool.result(sources[1], optimize) is None
+            pool.submit(sources[1], "b", optimize)
+            assert pool.result(sources[1], optimize).source_hash != b.source_hash
+            assert pool.result(sources[1]).source_hash == b.source_hash
+        print("✓ Cache Skip")
+
+
+if __name__ == "__main__":
+    test_package_pool()
@@ -0,0 +1,113 @@
+import importlib.util
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from src.packaging import Router, collect_files, source_hash
+from src.resources.schedule_rule import WARMER_MARKER
+
+LIST_HANDLER = """import json
+
+
+def lambda_handler(event, context):
+    return {"statusCode": 200, "body": json.dumps({"route": "list"})}
+"""
+
+UPDATE_HANDLER = """import json
+
+
+def lambda_handler(event, context):
+    from naming import label  # sibling module, imported lazily
+    return {"statusCode": 200, "body": json.dumps({"route": label(), "id": event["pathParameters"]["id"]})}
+"""
+
+
+def _load_router(code_path: Path):
+    """Importiere myzel_router aus dem Bundle wie die Lambda Runtime"""
+    spec = importlib.util.spec_from_file_location("myzel_router_test", code_path / "myzel_router.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _dispatch(module):
+    response = module.lambda_handler({"routeKey": "GET /api/todos"}, None)
+    assert json.loads(response["body"]) == {"route": "list"}
+    response = module.lambda_handler({"routeKey": "PUT /api/todos/{id}/update", "pathParameters": {"id": "7"}},
+                                     None)
+    assert json.loads(response["body"]) == {"route": "update", "id": "7"}
+    print("✓ Dispatch über routeKey")
+
+    # Function URL events carry no routeKey: method and path are matched
+    response = module.lambda_handler({"routeKey": "$default", "rawPath": "/api/todos/42/update",
+                                      "requestContext": {"http": {"method": "PUT"}}}, None)
+    assert json.loads(response["body"])["id"] == "42"
+    response = module.lambda_handler({"routeKey": "$default", "rawPath": "/api/todos/42/update",
+                                      "requestContext": {"http": {"method": "GET"}}}, None)
+    assert response["statusCode"] == 404
+    assert module.lambda_handler({WARMER_MARKER: {"delay_ms": 1}}, None) == {"warmed": True}
+    print("✓ Function URL Pfade und Warmer Events")
+
+
+def test_router():
+    """Testet das Bündeln mehrerer Functions mit routeKey Dispatch"""
+    with tempfile.TemporaryDirectory() as tmp:
+        functions = Path(tmp) / "functions"
+        for name, handler in (("todo_list", LIST_HANDLER), ("todo_update", UPDATE_HANDLER)):
+            (functions / name).mkdir(parents=True)
+            (functions / name / "lambda_function.py").write_text(handler)
+        (functions / "todo_update" / "naming.py").write_text("def label():\n    return 'update'\n")
+        (functions / "todo_update" / "notes.md").write_text("intern")
+        (functions / "todo_update" / ".myzelignore").write_text("*.md\n")
+
+        router = Router("todo-router", {
+            "GET /api/todos": functions / "todo_list",
+            "PUT /api/todos/{id}/update": functions / "todo_update",
+        }, build_root=Path(tmp) / "build")
+        code_path = router.build()
+        arcnames = [arcname for _, arcname in collect_files(code_path)]
+        assert "todo_update/naming.py" in arcnames and "todo_update/notes.md" not in arcnames
+        assert json.loads((code_path / "myzel_routes.json").read_text())["routes"]["GET /api/todos"] == "todo_list"
+        assert router.handler == "myzel_router.lambda_handler"
+
+        first = source_hash(collect_files(code_path))
+        assert source_hash(collect_files(router.build())) == first
+        print("✓ Bundle deterministisch gebaut")
+
+        # The router puts the bundled directories on sys.path
+        path = list(sys.path)
+        try:
+            module = _load_router(code_path)
+            _dispatch(module)
+        finally:
+            sys.path[:] = path
+
+        routes = router.api_routes("arn:aws:lambda:eu-central-1:123456789012:function:todo-router", "todo-router")
+        assert routes["/api/todos/{id}/update"]["method"] == "PUT"
+        assert {route["lambda_name"] for route in routes.values()} == {"todo-router"}
+        print("✓ ApiGateway Routes auf die gebündelte Function")
+
+        for invalid in ({"/api/todos": functions / "todo_list"},
+                        {"GET /a": functions / "todo_list", "GET /b": Path(tmp) / "other" / "todo_list"}):
+            try:
+                Router("broken", invalid)
+                raise AssertionError(f"ValueError erwartet: {invalid}")
+            except ValueError:
+                pass
+        print("✓ Ungültige Routes abgelehnt")
+
+        # Sibling modules share sys.path in the bundle: same name, different content is rejected
+        (functions / "todo_list" / "naming.py").write_text("def label():\n    return 'list'\n")
+        try:
+            router.build()
+            raise AssertionError("ValueError erwartet: naming.py doppelt")
+        except ValueError as e:
+            assert "naming" in str(e)
+        (functions / "todo_list" / "naming.py").write_text((functions / "todo_update" / "naming.py").read_text())
+        router.build()
+        print("✓ Kollidierende Geschwister-Module abgelehnt")
+
+
+if __name__ == "__main__":
+    test_router()
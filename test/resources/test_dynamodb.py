@@ -1,6 +1,60 @@
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+from src.packaging.package import install_runtime_modules
+from src.resources import dynamodb
 from src.resources.dynamodb import DynamoDB
 from test.resources.resource_tester import ResourceTester
 from test.resources.env_helper import load_env
+from test.aws_fakes import ENV, aws_response, fake_session
+
+TABLE_ARN = "arn:aws:dynamodb:eu-central-1:123456789012:table/todos"
+
+BY_CREATED = {
+    "index_name": "by-created",
+    "partition_key": {"name": "entity", "type": "S"},
+    "sort_key": {"name": "created_at", "type": "N"},
+    "projection": ["title", "completed"]
+}
+
+
+class _FakeDynamoDB:
+    """Tabelle mit einem veralteten GSI - UpdateTable wirkt sofort, zeichnet alle Requests auf"""
+
+    def __init__(self):
+        self.requests = []
+        self.attributes = [{"AttributeName": "id", "AttributeType": "S"},
+                           {"AttributeName": "status", "AttributeType": "S"}]
+        self.indexes = [{
+            "IndexName": "by-status",
+            "KeySchema": [{"AttributeName": "status", "KeyType": "HASH"}],
+            "Projection": {"ProjectionType": "KEYS_ONLY"},
+            "IndexStatus": "ACTIVE",
+        }]
+
+    def __call__(self, request, event_name, **kwargs):
+        operation = event_name.split(".")[-1]
+        body = json.loads(request.body) if request.body else {}
+        self.requests.append((operation, body))
+        if operation == "UpdateTable":
+            update = body["GlobalSecondaryIndexUpdates"][0]
+            if "Delete" in update:
+                self.indexes = [gsi for gsi in self.indexes if gsi["IndexName"] != update["Delete"]["IndexName"]]
+            else:
+                self.attributes += body["AttributeDefinitions"]
+                self.indexes.append({**update["Create"], "IndexStatus": "ACTIVE"})
+        table = {
+            "TableName": "todos",
+            "TableArn": TABLE_ARN,
+            "KeySchema": [{"AttributeName": "id", "KeyType": "HASH"}],
+            "AttributeDefinitions": self.attributes,
+            "GlobalSecondaryIndexes": self.indexes,
+        }
+        response = {"TableDescription": table} if operation == "UpdateTable" else {"Table": table}
+        return aws_response(request, response)
 
 
 def test_dynamodb():
@@ -26,5 +80,140 @@ def test_dynamodb():
     tester.print_summary()
 
 
+def test_index_config():
+    """Testet das GSI Format: eigenes und AWS Format ergeben die gleiche Config"""
+    table = DynamoDB("todos", {"name": "id", "type": "S"}, ENV, global_secondary_indexes=[BY_CREATED])
+    assert table._index_config(table.global_secondary_indexes[0]) == {
+        "IndexName": "by-created",
+        "KeySchema": [{"AttributeName": "entity", "KeyType": "HASH"},
+                      {"AttributeName": "created_at", "KeyType": "RANGE"}],
+        "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["completed", "title"]},
+    }
+    attribute_definitions = []
+    table._add_attribute_definitions(attribute_definitions, table.global_secondary_indexes[0])
+    assert attribute_definitions == [{"AttributeName": "entity", "AttributeType": "S"},
+                                     {"AttributeName": "created_at", "AttributeType": "N"}]
+
+    aws_format = DynamoDB("todos", {"name": "id", "type": "S"}, ENV, global_secondary_indexes=[{
+        "IndexName": "by-status",
+        "KeySchema": [{"AttributeName": "status", "KeyType": "HASH"}],
+        "Projection": {"ProjectionType": "KEYS_ONLY"},
+    }])
+    assert aws_format.global_secondary_indexes == [
+        {"index_name": "by-status", "partition_key": {"name": "status", "type": "S"},
+         "sort_key": None, "projection": "KEYS_ONLY"}]
+    assert table != aws_format
+
+    try:
+        DynamoDB("todos", {"name": "id", "type": "S"}, ENV,
+                 global_secondary_indexes=[{**BY_CREATED, "projection": "SOME"}])
+        raise AssertionError("ValueError erwartet")
+    except ValueError:
+        pass
+    print("✓ GSI Config mit typisierten Keys und INCLUDE Projection")
+
+
+def test_index_update():
+    """Testet das Anlegen eines neuen und Löschen eines veralteten GSI auf einer bestehenden Tabelle"""
+    fake = _FakeDynamoDB()
+    session = fake_session(fake, "before-send.dynamodb")
+    create_session = dynamodb.create_session
+    dynamodb.create_session = lambda env: session
+    try:
+        deployed = DynamoDB.get(TABLE_ARN, ENV)
+        desired = DynamoDB("todos", {"name": "id", "type": "S"}, ENV, global_secondary_indexes=[BY_CREATED])
+        assert deployed != desired
+        assert deployed.update(TABLE_ARN, desired) == TABLE_ARN
+        assert DynamoDB.get(TABLE_ARN, ENV) == desired
+    finally:
+        dynamodb.create_session = create_session
+
+    updates = [body for operation, body in fake.requests if operation == "UpdateTable"]
+    # One index change per UpdateTable call, the old index first
+    assert [list(update["GlobalSecondaryIndexUpdates"][0]) for update in updates] == [["Delete"], ["Create"]]
+    assert {"AttributeName": "created_at", "AttributeType": "N"} in updates[1]["AttributeDefinitions"]
+    print("✓ GSI auf bestehender Tabelle angelegt, veralteter GSI gelöscht")
+
+
+def test_fill_missing():
+    """Testet den Backfill eines fehlenden Attributs (paginierter Scan, bedingte Updates)"""
+    requests = []
+
+    def fake(request, event_name, **kwargs):
+        operation = event_name.split(".")[-1]
+        body = json.loads(request.body)
+        requests.append((operation, body))
+        if operation == "Scan":
+            page = {"Items": [{"id": {"S": "a1"}}], "LastEvaluatedKey": {"id": {"S": "a1"}}}
+            if "ExclusiveStartKey" in body:
+                page = {"Items": [{"id": {"S": "b2"}}, {"id": {"S": "gone"}}]}
+            return aws_response(request, page)
+        if body["Key"]["id"]["S"] == "gone":
+            error = {"__type": "com.amazonaws.dynamodb.v20120810#ConditionalCheckFailedException"}
+            return aws_response(request, error, 400)
+        return aws_response(request, {})
+
+    session = fake_session(fake, "before-send.dynamodb")
+    create_session = dynamodb.create_session
+    dynamodb.create_session = lambda env: session
+    try:
+        table = DynamoDB("todos", {"name": "id", "type": "S"}, ENV, global_secondary_indexes=[BY_CREATED])
+        assert table.fill_missing("entity", "todo") == 2
+    finally:
+        dynamodb.create_session = create_session
+
+    scans = [body for operation, body in requests if operation == "Scan"]
+    assert len(scans) == 2 and scans[0]["ProjectionExpression"] == "#k0"
+    assert scans[0]["FilterExpression"] == "attribute_not_exists(#attr)"
+    updates = [body for operation, body in requests if operation == "UpdateItem"]
+    assert [update["Key"]["id"]["S"] for update in updates] == ["a1", "b2", "gone"]
+    assert updates[0]["ExpressionAttributeValues"] == {":value": {"S": "todo"}}
+    print("✓ Backfill ohne bestehende Werte zu überschreiben")
+
+
+def test_todo_list_cursor():
+    """Testet die Seiten von todo_list: GSI Query mit Limit, Projection und Cursor Token"""
+    function_dir = Path(__file__).parents[2] / "functions" / "todo_list"
+    os.environ.setdefault("AWS_DEFAULT_REGION", "eu-central-1")
+    spec = importlib.util.spec_from_file_location("todo_list", function_dir / "lambda_function.py")
+    todo_list = importlib.util.module_from_spec(spec)
+    install_runtime_modules()
+    sys.path.insert(0, str(function_dir))
+    try:
+        spec.loader.exec_module(todo_list)
+    finally:
+        sys.path.remove(str(function_dir))
+
+    last_key = {"id": "a1", "entity": "todo", "created_at": 1700000000}
+    queries = []
+
+    class _Table:
+        def query(self, **kwargs):
+            queries.append(kwargs)
+            return {"Items": [{"id": "a1", "title": "Test"}], "LastEvaluatedKey": last_key}
+
+    todo_list.table = _Table()
+    response = todo_list.lambda_handler({"queryStringParameters": {"limit": "1"}}, None)
+    body = json.loads(response["body"])
+    assert response["statusCode"] == 200
+    assert body["todos"] == [{"id": "a1", "title": "Test"}]
+    assert queries[0]["IndexName"] == "by-created"
+    assert queries[0]["Limit"] == 1 and queries[0]["ScanIndexForward"] is False
+    assert "ExclusiveStartKey" not in queries[0]
+
+    todo_list.lambda_handler({"queryStringParameters": {"cursor": body["next_cursor"]}}, None)
+    assert queries[1]["ExclusiveStartKey"] == last_key
+    assert queries[1]["Limit"] == todo_list.DEFAULT_LIMIT
+
+    for params in ({"cursor": "kein-cursor"}, {"limit": "0"}, {"limit": "viele"}):
+        assert todo_list.lambda_handler({"queryStringParameters": params}, None)["statusCode"] == 400
+    assert len(queries) == 2
+    print("✓ todo_list blättert über den GSI mit Cursor Token")
+
+
 if __name__ == "__main__":
     test_dynamodb()
+    test_index_config()
+    test_index_update()
+    test_fill_missing()
+    test_todo_list_cursor()
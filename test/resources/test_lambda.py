@@ -1,9 +1,15 @@
+import json
+import threading
 import time
 from pathlib import Path
+
+from src.resources import lambda_function
+from src.resources.api_gateway import ApiGateway
 from src.resources.lambda_function import LambdaFunction
 from src.resources.iam_role import IamRole
 from test.resources.resource_tester import ResourceTester
 from test.resources.env_helper import load_env
+from test.aws_fakes import ENV, aws_response, fake_session
 
 
 def test_lambda():
@@ -76,5 +82,186 @@ def test_lambda():
         print(f"Could not cleanup IAM Role: {e}")
 
 
+class _FakeCreate:
+    """Lambda lehnt die Role zunächst ab, bis sie "propagiert" ist"""
+
+    def __init__(self, failures: int, message: str):
+        self.failures = failures
+        self.message = message
+        self.calls = 0
+
+    def __call__(self, request, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            return aws_response(request, {"Type": "User", "message": self.message}, 400,
+                                {"x-amzn-ErrorType": "InvalidParameterValueException"})
+        return aws_response(request, {"FunctionArn": "arn:aws:lambda:eu-central-1:123456789012:function:hello"}, 201)
+
+
+def test_role_retry():
+    """Testet das optimistische Create mit Retry nur bei nicht annehmbarer Role"""
+    session = fake_session()
+    lambda_resource = LambdaFunction(
+        function_name="hello",
+        handler="lambda_function.lambda_handler",
+        runtime="python3.13",
+        code_path="",
+        role_arn="arn:aws:iam::123456789012:role/hello",
+        env=ENV
+    )
+    params = {"FunctionName": "hello", "Role": lambda_resource.role_arn, "Code": {"ZipFile": b"zip"}}
+    base_delay = lambda_function.ROLE_RETRY_BASE_DELAY
+    lambda_function.ROLE_RETRY_BASE_DELAY = 0.01
+
+    try:
+        fake = _FakeCreate(2, "The role defined for the function cannot be assumed by Lambda.")
+        session.events.register("before-send.lambda", fake)
+        client = session.client("lambda")
+        response = lambda_resource._with_role_retry(client, client.create_function, **params)
+        assert response["FunctionArn"].endswith(":hello")
+        assert fake.calls == 3
+        print("✓ Retry bis die Role angenommen werden kann")
+
+        other = _FakeCreate(1, "Unzipped size must be smaller than 262144000 bytes")
+        session.events.unregister("before-send.lambda", fake)
+        session.events.register("before-send.lambda", other)
+        client = session.client("lambda")
+        try:
+            lambda_resource._with_role_retry(client, client.create_function, **params)
+            raise AssertionError("InvalidParameterValueException erwartet")
+        except client.exceptions.InvalidParameterValueException:
+            pass
+        assert other.calls == 1
+        print("✓ Andere Fehler werden nicht wiederholt")
+    finally:
+        lambda_function.ROLE_RETRY_BASE_DELAY = base_delay
+
+
+def test_alias_config():
+    """Testet Alias/Concurrency Validierung und Routes auf die Alias ARN"""
+    common = dict(handler="lambda_function.lambda_handler", code_path="", role_arn="", env=ENV)
+
+    for invalid in (dict(runtime="python3.13", provisioned_concurrency=2),
+                    dict(runtime="python3.11", snap_start=True)):
+        try:
+            LambdaFunction(function_name="hello", **common, **invalid)
+            raise AssertionError(f"ValueError erwartet: {invalid}")
+        except ValueError:
+            pass
+    print("✓ Ungültige Kombinationen abgelehnt")
+
+    live = LambdaFunction(function_name="hello", runtime="python3.13", alias="live",
+                          provisioned_concurrency=2, snap_start=True, **common)
+    assert live.publish
+    alias_arn = live.get_alias_arn()
+    assert alias_arn == "arn:aws:lambda:eu-central-1:123456789012:function:hello:live"
+
+    by_arn = ApiGateway("api", {"/hello": {"method": "GET", "lambda_arn": alias_arn, "lambda_name": "hello"}}, ENV)
+    by_key = ApiGateway("api", {"/hello": {"method": "GET", "lambda_arn": live.get_arn(), "lambda_name": "hello",
+                                           "alias": "live"}}, ENV)
+    assert by_arn.routes == by_key.routes
+    assert by_arn.routes["/hello"]["alias"] == "live"
+    print("✓ Route auf Alias ARN")
+
+
+def test_diff_order():
+    """Testet dass eine neue Layer-Reihenfolge deployt wird, Policy ARNs aber ungeordnet sind"""
+    common = dict(handler="lambda_function.lambda_handler", runtime="python3.13", code_path="", role_arn="", env=ENV)
+    layers = ["arn:aws:lambda:eu-central-1:123456789012:layer:deps:1",
+              "arn:aws:lambda:eu-central-1:123456789012:layer:tools:1"]
+    deployed = LambdaFunction(function_name="hello", layers=layers, **common)
+    assert deployed != LambdaFunction(function_name="hello", layers=layers[::-1], **common)
+    print("✓ Layer-Reihenfolge ist eine Änderung")
+
+    policies = ["arn:aws:iam::aws:policy/AWSLambdaExecute", "arn:aws:iam::aws:policy/ReadOnlyAccess"]
+    role = dict(role_name="hello-role", assume_role_policy={}, env=ENV)
+    assert IamRole(managed_policies=policies, **role) == IamRole(managed_policies=policies[::-1], **role)
+    print("✓ Policy ARNs ungeordnet verglichen")
+
+
+class _FakeInvoke:
+    """Beantwortet Invoke Requests langsam und misst die gleichzeitig laufenden"""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request, **kwargs):
+        with self._lock:
+            self.calls += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.02)
+        with self._lock:
+            self.running -= 1
+
+        payload = json.loads(request.body)
+        headers = {}
+        if request.headers.get("X-Amz-Invocation-Type") in ("Event", b"Event"):
+            return aws_response(request, status=202)
+        if payload.get("fail"):
+            headers["X-Amz-Function-Error"] = "Unhandled"
+            payload = {"errorMessage": "kaputt"}
+        return aws_response(request, payload, headers=headers)
+
+
+def test_invoke_many():
+    """Testet parallele Invokes mit Backpressure, Fehlererfassung und gepooltem Client"""
+    fake = _FakeInvoke()
+    session = fake_session(fake, "before-send.lambda")
+    sessions = []
+
+    def create_session(env):
+        sessions.append(env)
+        return session
+
+    lambda_resource = LambdaFunction(
+        function_name="hello",
+        handler="lambda_function.lambda_handler",
+        runtime="python3.13",
+        code_path="",
+        role_arn="",
+        env=ENV
+    )
+    consumed = []
+
+    def payloads():
+        for index in range(40):
+            consumed.append(index)
+            yield {"index": index, "fail": index % 10 == 3}
+
+    original_create_session = lambda_function.create_session
+    lambda_function.create_session = create_session
+    try:
+        results = []
+        for result in lambda_resource.invoke_many(payloads(), concurrency=4):
+            # Backpressure: never more than `concurrency` payloads ahead of the consumer
+            assert len(consumed) - len(results) <= 4
+            results.append(result)
+
+        assert sorted(r.index for r in results) == list(range(40))
+        assert fake.max_running <= 4 and fake.max_running > 1
+        failed = [r for r in results if not r.ok]
+        assert [r.index for r in sorted(failed, key=lambda r: r.index)] == [3, 13, 23, 33]
+        assert all(r.function_error == "Unhandled" for r in failed)
+        assert all(r.response == r.payload and r.latency_ms >= 20 for r in results if r.ok)
+        print("✓ Parallele Invokes mit Backpressure")
+
+        events = list(lambda_resource.invoke_many([{}] * 5, concurrency=2, invocation_type="Event"))
+        assert all(r.status_code == 202 and r.response is None for r in events)
+        lambda_resource.invoke({"index": 99})
+        # One pooled client for all calls (grown once for the larger pool)
+        assert len(sessions) == 1
+        print("✓ Event Invokes und gepoolter Client")
+    finally:
+        lambda_function.create_session = original_create_session
+
+
 if __name__ == "__main__":
     test_lambda()
+    test_role_retry()
+    test_alias_config()
+    test_diff_order()
+    test_invoke_many()
@@ -0,0 +1,95 @@
+import json
+
+from src.resources import lambda_function_url
+from src.resources.cloudfront import CloudFront
+from src.resources.lambda_function_url import LambdaFunctionUrl
+from test.aws_fakes import ENV, aws_response, fake_session
+
+URL = "https://abc123.lambda-url.eu-central-1.on.aws/"
+FUNCTION_ARN = "arn:aws:lambda:eu-central-1:123456789012:function:todo-list:live"
+
+
+class _FakeLambda:
+    """Function URL API ohne existierende URL - zeichnet alle Requests auf"""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request, event_name, **kwargs):
+        operation = event_name.split(".")[-1]
+        body = json.loads(request.body) if request.body else {}
+        self.requests.append((operation, body))
+        if operation == "GetFunctionUrlConfig":
+            error = {"Type": "User", "message": "not found"}
+            return aws_response(request, error, 404, {"x-amzn-ErrorType": "ResourceNotFoundException"})
+        if operation == "CreateFunctionUrlConfig":
+            response = {"FunctionUrl": URL, "FunctionArn": FUNCTION_ARN, "AuthType": body["AuthType"],
+                        "Cors": body.get("Cors", {}), "CreationTime": "2026-01-01T00:00:00Z"}
+            return aws_response(request, response, 201)
+        return aws_response(request, {"Statement": "{}"}, 201)
+
+
+def test_function_url():
+    """Testet Validierung, Create mit CORS und die öffentlichen Permissions"""
+    for invalid in (dict(auth_type="PUBLIC"), dict(cors={"origins": ["*"]}), dict(invoke_mode="STREAM")):
+        try:
+            LambdaFunctionUrl("todo-list", ENV, **invalid)
+            raise AssertionError(f"ValueError erwartet: {invalid}")
+        except ValueError:
+            pass
+    print("✓ Ungültige Konfiguration abgelehnt")
+
+    fake = _FakeLambda()
+    session = fake_session(fake, "before-send.lambda")
+    create_session = lambda_function_url.create_session
+    lambda_function_url.create_session = lambda env: session
+    try:
+        function_url = LambdaFunctionUrl(
+            "todo-list", ENV, qualifier="live",
+            cors={"allow_origins": ["https://example.com"], "allow_methods": ["GET"], "max_age": 300}
+        )
+        assert function_url.create() == FUNCTION_ARN
+        assert function_url.get_url() == URL
+    finally:
+        lambda_function_url.create_session = create_session
+
+    operations = [operation for operation, _ in fake.requests]
+    assert operations == ["GetFunctionUrlConfig", "CreateFunctionUrlConfig", "AddPermission", "AddPermission"]
+    created = fake.requests[1][1]
+    assert created["Cors"] == {"AllowOrigins": ["https://example.com"], "AllowMethods": ["GET"], "MaxAge": 300}
+    assert created["AuthType"] == "NONE"
+    actions = {body["Action"]: body for operation, body in fake.requests if operation == "AddPermission"}
+    assert actions["lambda:InvokeFunctionUrl"]["FunctionUrlAuthType"] == "NONE"
+    assert actions["lambda:InvokeFunction"]["InvokedViaFunctionUrl"] is True
+    print("✓ Function URL mit CORS und öffentlichen Permissions erstellt")
+
+
+def test_cloudfront_function_urls():
+    """Testet Function URL Origins mit eigenen Path Patterns in CloudFront"""
+    cloudfront = CloudFront(env=ENV, bucket_name="my-bucket", function_urls={"/api/todos": URL})
+    assert cloudfront.function_urls == {"/api/todos": URL.rstrip("/")}
+
+    origins, behaviors = cloudfront._function_url_origins({})
+    assert [origin["DomainName"] for origin in origins] == ["abc123.lambda-url.eu-central-1.on.aws"]
+    assert behaviors[0]["PathPattern"] == "/api/todos"
+    assert behaviors[0]["TargetOriginId"] == origins[0]["Id"]
+
+    # Existing origins and behaviors are kept (no spurious distribution update)
+    config = {"Origins": {"Items": origins}, "CacheBehaviors": {"Items": behaviors}}
+    assert CloudFront._function_urls_from_config(config) == cloudfront.function_urls
+    again, same = cloudfront._function_url_origins(config)
+    assert again == origins and same == behaviors
+    print("✓ Function URL Behaviors vor /api/* und stabil beim Update")
+
+    try:
+        CloudFront(env=ENV)
+        raise AssertionError("ValueError erwartet")
+    except ValueError:
+        pass
+    assert CloudFront(env=ENV, function_urls={"/api/todos": URL})
+    print("✓ Function URL als einziger Origin erlaubt")
+
+
+if __name__ == "__main__":
+    test_function_url()
+    test_cloudfront_function_urls()
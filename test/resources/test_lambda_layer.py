@@ -0,0 +1,40 @@
+import tempfile
+from pathlib import Path
+
+from src.resources.lambda_layer import LambdaLayer
+from test.packaging.test_layers import write_function, write_wheel
+from test.resources.resource_tester import ResourceTester
+from test.resources.env_helper import load_env
+
+
+def test_lambda_layer():
+    """Testet Lambda Layer Resource"""
+    env = load_env()
+
+    tester = ResourceTester(env)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        sha256 = write_wheel(tmp / "wheels")
+        write_function(tmp / "functions" / "todo_create", sha256)
+
+        layer_resource = LambdaLayer(
+            layer_name="test-myzel-layer-123456",
+            function_dirs=[tmp / "functions" / "todo_create"],
+            wheel_dir=tmp / "wheels",
+            env=env
+        )
+        layer_modified = LambdaLayer(
+            layer_name="test-myzel-layer-123456",
+            function_dirs=[tmp / "functions" / "todo_create"],
+            wheel_dir=tmp / "wheels",
+            architecture="arm64",
+            env=env
+        )
+
+        tester.test_resource("LambdaLayer", layer_resource, layer_modified)
+        tester.print_summary()
+
+
+if __name__ == "__main__":
+    test_lambda_layer()
@@ -0,0 +1,113 @@
+import json
+from pathlib import Path
+
+from src.packaging.package import install_runtime_modules, package_files
+from src.resources import schedule_rule
+from src.resources.lambda_function import LambdaFunction
+from src.resources.schedule_rule import WARMER_MARKER, ScheduleRule, WarmerConfig
+from test.aws_fakes import ENV, aws_response, fake_session
+
+FUNCTION_ARN = "arn:aws:lambda:eu-central-1:123456789012:function:todo-list"
+RULE_ARN = "arn:aws:events:eu-central-1:123456789012:rule/todo-list-warmer"
+
+
+class _FakeAws:
+    """EventBridge mit einem veralteten Target plus Lambda Permissions - zeichnet alle Requests auf"""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request, event_name, **kwargs):
+        operation = event_name.split(".")[-1]
+        body = json.loads(request.body) if request.body else {}
+        self.requests.append((operation, body))
+        responses = {
+            "PutRule": {"RuleArn": RULE_ARN},
+            "ListTargetsByRule": {"Targets": [{"Id": "warmer-4", "Arn": FUNCTION_ARN}]},
+            "PutTargets": {"FailedEntryCount": 0, "FailedEntries": []},
+            "RemoveTargets": {"FailedEntryCount": 0, "FailedEntries": []},
+            "AddPermission": {"Statement": "{}"},
+        }
+        status = 201 if operation == "AddPermission" else 200
+        return aws_response(request, responses[operation], status)
+
+
+def test_warmer_config():
+    """Testet die Warmer Config und das Zurücklesen aus einer deployten Rule"""
+    for invalid in (dict(concurrency=0), dict(concurrency=6), dict(interval=0)):
+        try:
+            WarmerConfig(**invalid)
+            raise AssertionError(f"ValueError erwartet: {invalid}")
+        except ValueError:
+            pass
+
+    warmer = WarmerConfig(concurrency=3, interval=5)
+    assert warmer.schedule_expression == "rate(5 minutes)"
+    assert WarmerConfig(interval=1).schedule_expression == "rate(1 minute)"
+    targets = warmer.targets(FUNCTION_ARN)
+    assert [target["id"] for target in targets] == ["warmer-1", "warmer-2", "warmer-3"]
+    assert targets[0]["input"][WARMER_MARKER]["delay_ms"] == 100
+
+    rule = ScheduleRule("todo-list-warmer", warmer.schedule_expression, ENV, targets=targets)
+    assert WarmerConfig.from_rule(rule) == warmer
+    assert WarmerConfig.from_rule(ScheduleRule("nightly", "cron(0 6 * * ? *)", ENV)) is None
+    print("✓ Warmer Config mit einem Target pro paralleler Invocation")
+
+
+def test_warmer_rule():
+    """Testet das Anlegen der Warmer Rule auf den Alias einer Function"""
+    fake = _FakeAws()
+    session = fake_session(fake)
+    create_session = schedule_rule.create_session
+    schedule_rule.create_session = lambda env: session
+    try:
+        function = LambdaFunction(
+            function_name="todo-list", handler="lambda_function.lambda_handler", runtime="python3.13",
+            code_path="", role_arn="", env=ENV, alias="live", warmer=WarmerConfig(concurrency=2, interval=5)
+        )
+        function._apply_warmer(FUNCTION_ARN)
+    finally:
+        schedule_rule.create_session = create_session
+
+    requests = dict(fake.requests)
+    assert [operation for operation, _ in fake.requests] == [
+        "PutRule", "ListTargetsByRule", "RemoveTargets", "PutTargets", "AddPermission"]
+    assert requests["PutRule"]["ScheduleExpression"] == "rate(5 minutes)"
+    assert requests["RemoveTargets"]["Ids"] == ["warmer-4"]
+    targets = requests["PutTargets"]["Targets"]
+    assert [target["Arn"] for target in targets] == [f"{FUNCTION_ARN}:live"] * 2
+    assert WARMER_MARKER in json.loads(targets[0]["Input"])
+    # One permission for the alias, not one per target
+    assert requests["AddPermission"]["Principal"] == "events.amazonaws.com"
+    print("✓ Warmer Rule auf den Alias, veraltete Targets entfernt")
+
+
+def test_skip_warmer():
+    """Testet den Handler Helper, der Warmer Events vor dem Handler beantwortet"""
+    install_runtime_modules()
+    import myzel_warmer as warmer
+    assert warmer.WARMER_MARKER == WARMER_MARKER
+
+    calls = []
+
+    @warmer.skip_warmer
+    def handler(event, context):
+        calls.append(event)
+        return {"statusCode": 200}
+
+    event = WarmerConfig(delay_ms=1).targets(FUNCTION_ARN)[0]["input"]
+    assert handler(event, None) == {"warmed": True}
+    assert handler({"rawPath": "/api/todos"}, None) == {"statusCode": 200}
+    assert calls == [{"rawPath": "/api/todos"}]
+
+    # Every function package ships the helper, no copy in the function directory
+    function_dir = Path(__file__).parents[2] / "functions" / "todo_list"
+    assert not (function_dir / "myzel_warmer.py").exists()
+    assert "myzel_warmer.py" in [arcname for _, arcname in package_files(function_dir)]
+    print("✓ Warmer Events erreichen den Handler nicht")
+
+
+if __name__ == "__main__":
+    test_warmer_config()
+    test_warmer_rule()
+    test_skip_warmer()
@@ -0,0 +1,105 @@
+import json
+import random
+import uuid
+from typing import Callable, Optional
+
+
+class LocalLambda:
+    """
+    Lokaler Stand-in für LambdaFunction (invoke/reconfigure).
+
+    Runs the handler in-process and answers like LambdaFunction.invoke with
+    LogType=Tail, including a REPORT line. Durations come from a model
+    (memory size -> ms) so results are deterministic. Every reconfigure()
+    starts a fresh execution environment: the next invocation reports an
+    Init Duration, like on Lambda.
+
+    publish_version() freezes handler and duration model as a version,
+    route_alias() points an alias to versions with weights - invoking the
+    alias picks the version per call (seeded, deterministic) and the START
+    line reports the executed version.
+    """
+
+    def __init__(
+        self,
+        handler: Callable,
+        function_name: str = "local",
+        memory_size: int = 128,
+        duration: Callable[[int], float] = lambda memory_size: 100 * 128 / memory_size,
+        init_duration: Callable[[int], float] = lambda memory_size: 300.0,
+        environment_variables: Optional[dict] = None,
+        code_size: Optional[int] = None,
+        optimize=None
+    ):
+        self.handler = handler
+        self.function_name = function_name
+        self.memory_size = memory_size
+        self.duration = duration
+        self.init_duration = init_duration
+        self.environment_variables = environment_variables or {}
+        self.code_size = code_size
+        self.optimize = optimize
+        self.reconfigurations = 0
+        self.invocations = 0
+        self._fresh = True
+        self.versions: dict[str, tuple[Callable, Callable[[int], float]]] = {}
+        self.aliases: dict[str, tuple[str, dict]] = {}
+        self.alias_updates: list[tuple[str, str, dict]] = []
+        self._random = random.Random(0)
+
+    def publish_version(self, handler: Optional[Callable] = None,
+                        duration: Optional[Callable[[int], float]] = None) -> str:
+        version = str(len(self.versions) + 1)
+        self.versions[version] = (handler or self.handler, duration or self.duration)
+        return version
+
+    def route_alias(self, alias: str, version: str, canary_version: Optional[str] = None,
+                    weight: float = 0.0) -> None:
+        weights = {canary_version: weight} if canary_version else {}
+        self.aliases[alias] = (version, weights)
+        self.alias_updates.append((alias, version, weights))
+
+    def reconfigure(self, **changes) -> None:
+        for name, value in changes.items():
+            setattr(self, name, value)
+        self.reconfigurations += 1
+        self._fresh = True
+
+    def invoke(self, payload: dict = None, invocation_type: str = "RequestResponse",
+               log_type: Optional[str] = None, qualifier: Optional[str] = None) -> dict:
+        self.invocations += 1
+        request_id = str(uuid.uuid4())
+        version, handler, duration = self._resolve(qualifier)
+        response = {"StatusCode": 202 if invocation_type == "Event" else 200, "Payload": None}
+        try:
+            result = handler(json.loads(json.dumps(payload or {})), None)
+            if invocation_type != "Event":
+                response["Payload"] = result
+        except Exception as e:
+            response["FunctionError"] = "Unhandled"
+            response["Payload"] = {"errorMessage": str(e), "errorType": type(e).__name__}
+
+        if log_type == "Tail":
+            response["LogResult"] = self._log(request_id, version, duration(self.memory_size))
+        self._fresh = False
+        return response
+
+    def _resolve(self, qualifier: Optional[str]) -> tuple[str, Callable, Callable[[int], float]]:
+        if qualifier in self.aliases:
+            qualifier, weights = self.aliases[qualifier]
+            for version, weight in weights.items():
+                if self._random.random() < weight:
+                    qualifier = version
+                    break
+        if qualifier in self.versions:
+            return (qualifier, *self.versions[qualifier])
+        return "$LATEST", self.handler, self.duration
+
+    def _log(self, request_id: str, version: str, duration: float) -> str:
+        report = (f"REPORT RequestId: {request_id}\tDuration: {duration:.2f} ms\t"
+                  f"Billed Duration: {max(int(duration + 0.999), 1)} ms\tMemory Size: {self.memory_size} MB\t"
+                  f"Max Memory Used: {min(64, self.memory_size)} MB\t")
+        if self._fresh:
+            report += f"Init Duration: {self.init_duration(self.memory_size):.2f} ms\t"
+        return (f"START RequestId: {request_id} Version: {version}\n"
+                f"END RequestId: {request_id}\n{report}\n")
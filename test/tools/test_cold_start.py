@@ -0,0 +1,39 @@
+from src.packaging import OptimizeOptions
+from src.tools import ColdStartBenchmark, compare
+from src.tools.cold_start import COLD_START_ENV_VAR
+from test.tools.local_lambda import LocalLambda
+
+
+def _handler(event, context):
+    return {"statusCode": 200}
+
+
+def test_cold_start_benchmark():
+    """Testet den Cold Start Benchmark gegen lokale Lambda Stand-ins"""
+    # Init duration grows with the package size
+    plain = LocalLambda(_handler, "todo-list", code_size=4_000_000, environment_variables={"TABLE_NAME": "todos"},
+                        init_duration=lambda memory: 400.0)
+    optimized = LocalLambda(_handler, "todo-list", code_size=2_500_000, environment_variables={"TABLE_NAME": "todos"},
+                            init_duration=lambda memory: 250.0, optimize=OptimizeOptions())
+
+    baseline = ColdStartBenchmark([plain], cycles=5).run()
+    candidate = ColdStartBenchmark([optimized], cycles=5).run()
+
+    summary = baseline[0].summary()
+    assert summary["cycles"] == 5 and summary["cold_starts"] == 5
+    assert summary["init_p50_ms"] == 400.0 and summary["package_size"] == 4_000_000
+    assert summary["optimize"] == "none" and candidate[0].optimize == "precompile+strip"
+    # One configuration update per cycle plus the restore
+    assert plain.reconfigurations == 6 and plain.invocations == 5
+    assert plain.environment_variables == {"TABLE_NAME": "todos"}
+    assert COLD_START_ENV_VAR not in optimized.environment_variables
+    print("✓ Init Duration pro Zyklus erfasst")
+
+    deltas = compare(baseline, candidate)
+    assert deltas["todo-list"]["init_p50_ms"] == -150.0
+    assert deltas["todo-list"]["package_size"] == -1_500_000
+    print("✓ Vergleich der Optimierungs-Einstellungen")
+
+
+if __name__ == "__main__":
+    test_cold_start_benchmark()
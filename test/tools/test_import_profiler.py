@@ -0,0 +1,68 @@
+import tempfile
+from pathlib import Path
+
+from src.tools import ImportHistory, parse_importtime, profile_functions
+from src.tools.import_profiler import _START_MARKER
+
+HEAVY_MODULE = "import time\ntime.sleep(0.08)\n"
+
+HANDLER = """import time
+import heavy_dependency
+
+time.sleep(0.03)
+
+
+def lambda_handler(event, context):
+    return {"statusCode": 200}
+"""
+
+
+def test_parse_importtime():
+    """Testet das Parsen der -X importtime Ausgabe"""
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       900 |        900 | encodings",
+        _START_MARKER,
+        "import time:      2000 |       2000 |     botocore.utils",
+        "import time:      1000 |       3000 |   botocore",
+        "import time:       500 |       3500 | lambda_function",
+    ])
+    total, handler, packages = parse_importtime(stderr, "lambda_function")
+    assert total == 3.5 and handler == 0.5
+    # Interpreter startup before the marker is ignored
+    assert packages == {"botocore": 3.0}
+    print("✓ Import-Zeiten pro Top-Level Package")
+
+
+def test_profile_functions():
+    """Testet den Profiler gegen temporäre Handler in frischen Prozessen"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "functions"
+        for name, handler in (("slow", HANDLER), ("fast", "def lambda_handler(event, context):\n    return {}\n")):
+            (root / name).mkdir(parents=True)
+            (root / name / "lambda_function.py").write_text(handler)
+        (root / "slow" / "heavy_dependency.py").write_text(HEAVY_MODULE)
+        (root / "broken").mkdir()
+        (root / "broken" / "lambda_function.py").write_text("import not_installed_anywhere\n")
+
+        history = ImportHistory(Path(tmp) / "history.jsonl")
+        profiles = {p.function: p for p in profile_functions(root, runs=1, history=history)}
+
+        slow, fast = profiles["slow"], profiles["fast"]
+        assert slow.heavy() == ["heavy_dependency"]
+        assert slow.handler_ms >= 30 and slow.total_ms >= 110
+        assert fast.heavy() == [] and fast.total_ms < slow.total_ms
+        assert "ModuleNotFoundError" in profiles["broken"].error
+        print("✓ Schwere Imports und Modul-Code erkannt")
+
+        assert history.previous("slow")["total_ms"] == slow.total_ms
+        # Failed imports are recorded but never used as baseline
+        assert history.previous("broken") is None
+        profile_functions(root, runs=1, history=history)
+        assert len(history.path.read_text().splitlines()) == 6
+        print("✓ Verlauf wird fortgeschrieben")
+
+
+if __name__ == "__main__":
+    test_parse_importtime()
+    test_profile_functions()
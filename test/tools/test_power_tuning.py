@@ -0,0 +1,55 @@
+from src.tools import PowerTuner, parse_report, percentile
+from test.tools.local_lambda import LocalLambda
+
+
+def _handler(event, context):
+    if event.get("fail"):
+        raise RuntimeError("kaputt")
+    return {"statusCode": 200}
+
+
+def test_parse_report():
+    """Testet das Parsen der REPORT Zeile"""
+    log = ("START RequestId: 8f5 Version: $LATEST\n"
+           "END RequestId: 8f5\n"
+           "REPORT RequestId: 8f5\tDuration: 12.34 ms\tBilled Duration: 13 ms\tMemory Size: 256 MB\t"
+           "Max Memory Used: 48 MB\tInit Duration: 210.50 ms\t\n")
+    report = parse_report(log)
+    assert report.request_id == "8f5"
+    assert report.duration_ms == 12.34 and report.billed_duration_ms == 13
+    assert report.memory_size_mb == 256 and report.max_memory_used_mb == 48
+    assert report.init_duration_ms == 210.5 and report.cold_start
+    assert parse_report("START RequestId: 1\n") is None
+    assert percentile([5, 1, 4, 2, 3], 50) == 3 and percentile([], 95) is None
+    print("✓ REPORT Zeile geparst")
+
+
+def test_power_tuning():
+    """Testet den Memory Sweep gegen einen lokalen Lambda Stand-in"""
+    # CPU-bound until ~1 GB (duration scales with memory), fixed I/O part
+    function = LocalLambda(_handler, "tuning", memory_size=128,
+                           duration=lambda memory: 2000 * 128 / min(memory, 1024) + 20)
+
+    sizes = (128, 256, 512, 1024, 2048)
+    result = PowerTuner(function, sizes, invocations=5, strategy="speed").run()
+    assert [point.memory_size for point in result.points] == list(sizes)
+    assert function.memory_size == 128 and function.reconfigurations == len(sizes) + 1
+    assert all(len(point.reports) == 5 and point.init_ms == 300.0 for point in result.points)
+    # Cold starts are not part of the latency figures
+    assert result.points[0].p95_ms == 2020.0
+    assert result.recommendation == 1024
+    print("✓ Speed Empfehlung")
+
+    assert PowerTuner(function, sizes, invocations=3, strategy="cost").run().recommendation == 128
+    assert PowerTuner(function, sizes, invocations=3, strategy="balanced").run().recommendation == 1024
+    print("✓ Cost/Balanced Empfehlung")
+
+    failing = PowerTuner(function, (128, 256), invocations=2, payload={"fail": True}).run()
+    assert failing.recommendation is None and failing.points[0].errors == 2
+    assert failing.to_dict()["points"][1]["errors"] == 2
+    print("✓ Fehler werden gezählt und nie empfohlen")
+
+
+if __name__ == "__main__":
+    test_parse_report()
+    test_power_tuning()